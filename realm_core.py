@@ -15,7 +15,6 @@ import sys
 import uuid
 import io
 import time
-import torch
 import random
 from datetime import datetime
 from pathlib import Path
@@ -34,42 +33,49 @@ _REALM_ROOT = Path("F:/RealmForge_PROD") # Hard-coded Physical Anchor
 if str(_REALM_ROOT) not in sys.path:
     sys.path.insert(0, str(_REALM_ROOT))
 
-from langchain_groq import ChatGroq
-from langchain_community.llms import HuggingFacePipeline
-from transformers import pipeline
+# Heavy model stacks (torch/transformers/langchain_groq) load inside get_llm() phases only
 from langchain_core.messages import SystemMessage, HumanMessage, ToolMessage, AIMessage, BaseMessage
 from langgraph.graph import StateGraph, END
 
 # --- REALM FORGE INTERNAL IMPORTS ---
+from src.system.startup_profiler import startup_profiler
 from src.system.state import RealmForgeState, get_initial_state
-from src.memory.engine import MemoryManager
+from src.memory.engine import get_memory_kernel
+from src.system.tool_engine import tool_engine
+from src.system.resilience import resilience_layer
+from src.system.arsenal.results import ToolResult
+from src.system.verification import artifact_verifier
+from src.system.compaction import total_messages, spill_tool_output
+from src.system.prompting import ToolCatalog, build_planner_messages
+from src.system.json_stream import extract_json, astream_json, SUPERVISOR_SCHEMA, PLANNER_SCHEMA
+from src.system.speculation import speculation_registry
+from src.system.specialist_index import specialist_index
 
 # --- 1. ARSENAL LINKAGE (SHARDED v50.8 ALIGNMENT) ---
-try:
-    from src.system.arsenal.registry import (
-        ALL_TOOLS_LIST, 
-        DEPARTMENT_TOOL_MAP,
-        get_tools_for_dept,
-        get_swarm_roster,
-        prepare_vocal_response, 
-        generate_neural_audio,
-        read_file,
-        write_file,
-        update_knowledge_graph,
-        calculate_file_hash,
-        get_file_metadata
-    )
-    print(f"✅ [BRAIN] Neural Mastermind Aligned to Sharded Foundation.")
-except ImportError as e:
-    print(f"❌ [CRITICAL_IMPORT_ERROR]: Arsenal Registry linkage failed: {e}")
-    sys.exit(1)
+with startup_profiler.phase("arsenal"):
+    try:
+        from src.system.arsenal.registry import (
+            ALL_TOOLS_LIST, 
+            DEPARTMENT_TOOL_MAP,
+            get_tools_for_dept,
+            get_swarm_roster,
+            prepare_vocal_response, 
+            generate_neural_audio,
+            read_file,
+            write_file,
+            update_knowledge_graph,
+            calculate_file_hash,
+            get_file_metadata
+        )
+        print(f"✅ [BRAIN] Neural Mastermind Aligned to Sharded Foundation.")
+    except ImportError as e:
+        print(f"❌ [CRITICAL_IMPORT_ERROR]: Arsenal Registry linkage failed: {e}")
+        sys.exit(1)
 
 # --- 2. CONFIGURATION & HYBRID LLM FACTORY ---
 load_dotenv()
 
 llm_instance = None
-memory_kernel = MemoryManager() # Production RAG Instance
-_LATTICE_CACHE = None # Internal memory cache to prevent I/O stalls during high-load missions
 
 def get_llm():
     """Initializes LLM based on .env configuration with Mastermind precision."""
@@ -78,67 +84,72 @@ def get_llm():
     
     model_choice = os.getenv("REALM_MODEL_CORE", "GROQ").upper()
     
+    if model_choice == "LOCAL":
+        # Batched, quantized local server shared by every mission (see src/system/inference.py)
+        from src.system.inference import LocalChatModel, local_inference_server
+        llm_instance = LocalChatModel(server=local_inference_server)
+        print(f"🌀 [LOCAL_INFERENCE] {local_inference_server.config.model_id} ({local_inference_server.config.quantization}, batch<={local_inference_server.config.max_batch}) armed.")
+        return llm_instance
+
     if model_choice == "NEMOTRON":
         try:
-            print(f"🌀 [NVIDIA_NEMOTRON] Loading NVIDIA-Nemotron-Nano-9B-v2...")
-            pipe = pipeline(
-                "text-generation", model="nvidia/NVIDIA-Nemotron-Nano-9B-v2", 
-                trust_remote_code=True, device_map="auto",
-                model_kwargs={"torch_dtype": torch.bfloat16 if torch.cuda.is_available() else torch.float32}
-            )
-            llm_instance = HuggingFacePipeline(pipeline=pipe)
+            with startup_profiler.phase("local_model"):
+                import torch
+                from transformers import pipeline
+                from langchain_community.llms import HuggingFacePipeline
+                print(f"🌀 [NVIDIA_NEMOTRON] Loading NVIDIA-Nemotron-Nano-9B-v2...")
+                pipe = pipeline(
+                    "text-generation", model="nvidia/NVIDIA-Nemotron-Nano-9B-v2", 
+                    trust_remote_code=True, device_map="auto",
+                    model_kwargs={"torch_dtype": torch.bfloat16 if torch.cuda.is_available() else torch.float32}
+                )
+                llm_instance = HuggingFacePipeline(pipeline=pipe)
             print("✅ [NVIDIA_NEMOTRON] Local Brain Online.")
         except Exception as e:
             print(f"⚠️ [MODEL_FAULT] Nemotron local failed: {e}. Defaulting to Groq.")
             model_choice = "GROQ"
 
     if model_choice == "GROQ" or llm_instance is None:
-        llm_instance = ChatGroq(
-            temperature=0.1, 
-            model_name="llama-3.3-70b-versatile", 
-            api_key=os.getenv("GROQ_API_KEY")
-        )
+        with startup_profiler.phase("llm_client"):
+            from langchain_groq import ChatGroq
+            llm_instance = ChatGroq(
+                temperature=0.1, 
+                model_name="llama-3.3-70b-versatile", 
+                api_key=os.getenv("GROQ_API_KEY")
+            )
         print("🚀 [GROQ] Cloud Mastermind Online.")
     return llm_instance
 
 # --- PATHS ---
 DECISION_LOG = Path("F:/RealmForge_PROD/data/memory/decisions.log")
 AGENT_DIR = Path("F:/RealmForge_PROD/data/agents")
-# Renormalized lattice artifact
+# Renormalized lattice artifact (indexed by src/system/specialist_index.py)
 LATTICE_MAP = Path("F:/RealmForge_PROD/master_departmental_lattice.json")
 TOOLS = {t.name: t for t in ALL_TOOLS_LIST if hasattr(t, 'name')}
+TOOL_CATALOG = ToolCatalog(ALL_TOOLS_LIST, DEPARTMENT_TOOL_MAP)
 
 # --- HELPERS ---
-def get_industrial_specialist(silo: str):
-    """Picks a physical agent manifest from the 13 canonical industrial silos (Cached for Performance)."""
-    global _LATTICE_CACHE
+def get_industrial_specialist(silo: str, tools: Optional[List[str]] = None, mission_id: Optional[str] = None):
+    """
+    Picks a physical agent manifest from the 13 canonical industrial silos via the specialist index:
+    idle agents whose tools cover the planned set are favored. Passing mission_id leases the agent
+    (counted as in-flight load) until the mission synthesizes or hands off.
+    """
     try:
-        # Load Cache if empty (Ensures 0% Disk Latency during execution)
-        if _LATTICE_CACHE is None:
-            if not LATTICE_MAP.exists(): return None
-            with open(LATTICE_MAP, 'r', encoding='utf-8-sig') as f:
-                _LATTICE_CACHE = json.load(f)
-        
-        # Exact match or fuzzy match for the 13 canonical silos
-        silo_key = next((k for k in _LATTICE_CACHE.keys() if silo.lower() in k.lower()), None)
-        if not silo_key: return None
-        
-        pool = _LATTICE_CACHE[silo_key].get('agents', [])
-        if not pool: return None
-        
-        return random.choice(pool)
+        return specialist_index.pick(silo, tools=tools, mission_id=mission_id)
     except Exception as e:
         print(f"⚠️ [SPECIALIST_FETCH_ERR]: {e}")
         return None
 
-def extract_json(text: str) -> dict:
-    try:
-        match = re.search(r"```json\s*(\{.*?\})\s*```", text, re.DOTALL)
-        if match: return json.loads(match.group(1))
-        text_clean = text.strip()
-        if text_clean.startswith('{'): return json.loads(text_clean)
-        return {}
-    except: return {}
+def sanitize_args(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Production Path Sanitization: forward slashes on every F:/ path argument."""
+    return {k: v.replace("\\", "/") if isinstance(v, str) and "F:/" in v else v for k, v in (args or {}).items()}
+
+async def run_tool(tool_name: str, args: Dict[str, Any], timing: Dict[str, Any]):
+    """Declared async/thread/process lane, under deadline/retry/breaker policy."""
+    return await resilience_layer.execute(
+        tool_name, lambda: tool_engine.dispatch(tool_name, TOOLS[tool_name], args, timing=timing)
+    )
 
 # ==============================================================================
 # 4. NODES (TITAN MASTERMIND CORE v31.11)
@@ -191,10 +202,9 @@ async def supervisor_node(state: RealmForgeState):
     """
     model = get_llm()
     res = await model.ainvoke([SystemMessage(content=prompt)])
-    data = extract_json(res.content if hasattr(res, 'content') else str(res))
+    data = extract_json(res.content if hasattr(res, 'content') else str(res), SUPERVISOR_SCHEMA)
     
-    new_locks = set(locks)
-    new_locks.add(mid)
+    new_locks = [mid]  # Delta only; merge_ordered unions it into the lock set
 
     if data.get("intent") == "GENERAL_INQUIRY":
         return {
@@ -208,7 +218,7 @@ async def supervisor_node(state: RealmForgeState):
 
     primary_silo = data.get("primary_silo", "Architect")
     fallback_silo = data.get("fallback_silo", "Architect")
-    primary = get_industrial_specialist(primary_silo)
+    primary = get_industrial_specialist(primary_silo, mission_id=mid)
     
     invitees = []
     for s in data.get("meeting_invitees", []):
@@ -233,7 +243,7 @@ async def supervisor_node(state: RealmForgeState):
 async def planner_node(state: RealmForgeState):
     """THE SPECIALIST: Yields heartbeat to HUD and maps 180 Tools to mission tasks."""
     # TURN LIMIT GUARD (15 Turns = 30 Messages)
-    if len(state["messages"]) > 30:
+    if total_messages(state["messages"]) > 30:
         return {"next_node": "synthesizer", "messages": [AIMessage(content="🚨 [LIMIT_REACHED]: Strike aborted to preserve node integrity.")]}
 
     # HUD HEARTBEAT: Prevent websocket timeout during analysis
@@ -244,40 +254,43 @@ async def planner_node(state: RealmForgeState):
     dept = state.get("active_department", "Architect")
     params = state.get("semantic_params", {})
     
-    # v31.11 SUTURE: Passing ALL_TOOLS_LIST to satisfy registry signature and fix 500 error
-    available_tools = get_tools_for_dept(dept, ALL_TOOLS_LIST)
-    if not available_tools:
-        available_tools = [t.name for t in ALL_TOOLS_LIST[:50]]
-    
-    prompt = f"""
-    IDENTITY: {agent_name} (Industrial Silo: {dept})
-    MISSION: {mission}
-    SEMANTIC_ENTITIES: {json.dumps(params)}
-    AVAILABLE TOOLS: {available_tools}
-    
-    PROTOCOL: 
-    1. Use SEMANTIC_ENTITIES to fill tool arguments accurately.
-    2. Every file path MUST be F:/RealmForge_PROD/...
-    
-    JSON SCHEMA:
-    {{ "sub_tasks": [ {{"tool": "TOOL_NAME", "args": {{ "param": "value" }} }} ] }}
-    """
+    # Cache-stable prompt: [protocol + compact department catalog] first, mission-specific context after
+    prompt_messages, prompt_stats = build_planner_messages(TOOL_CATALOG, dept, agent_name, mission, params, state["messages"])
     model = get_llm()
-    res = await model.ainvoke([SystemMessage(content=prompt)] + state["messages"])
-    data = extract_json(res.content if hasattr(res, 'content') else str(res))
+    # Streamed: each sub_task is parsed and schema-checked the moment its object closes.
+    # Read-only sensors start right then, overlapping the rest of the completion.
+    mid = state.get("mission_id")
+    speculator = speculation_registry.open(mid, run_tool)
+    def speculate(task):
+        if speculator and task.get("tool") in TOOLS:
+            speculator.launch({"tool": task["tool"], "args": sanitize_args(task.get("args"))})
+    try:
+        data = await astream_json(model, prompt_messages, PLANNER_SCHEMA, on_item=speculate)
+    except BaseException:
+        speculation_registry.release(mid)
+        raise
+    if speculator:
+        # Everything the executor will walk: the standing backlog, then this plan's tasks (arrival order)
+        queued = [*state.get("task_queue", []), *data.get("sub_tasks", [])]
+        speculator.lock({"tool": t.get("tool"), "args": sanitize_args(t.get("args")), "priority": t.get("priority"),
+                         "status": t.get("status", "OPEN")} for t in queued if isinstance(t, dict))
 
     return {
         "task_queue": data.get("sub_tasks", []),
         "next_node": "executor",
-        "messages": [heartbeat, AIMessage(content=f"📋 [PLAN_LOCKED]: Orchestrating kinetic strike with {len(data.get('sub_tasks', []))} tasks.")]
+        "messages": [heartbeat, AIMessage(content=f"📋 [PLAN_LOCKED]: Orchestrating kinetic strike with {len(data.get('sub_tasks', []))} tasks.")],
+        "diagnostic_stream": [f"🧾 [PLANNER_PROMPT]: {prompt_stats['prompt_tokens']} tokens ({prompt_stats['prefix_tokens']} cached prefix, {prompt_stats['tools']} tools, {prompt_stats['history_dropped']} history msgs trimmed)"],
+        "vitals": {"planner_prompt": prompt_stats}
     }
 
 async def execution_node(state: RealmForgeState):
     """FORCE-KINETIC EXECUTOR: Physically triggers tools and logs artifact paths."""
     agent = state.get("active_agent")
+    mid = state.get("mission_id")
     tasks = list(state.get("task_queue", []))
-    messages = list(state["messages"])
-    found_artifacts = list(state.get("artifacts", []))
+    messages = []  # New ToolMessages only; the window reducer appends them to history
+    found_artifacts = []  # Delta only; deduplicate_artifacts keeps first-seen order
+    lane_logs = []
     
     if not tasks: return {"next_node": "validator"}
 
@@ -287,7 +300,8 @@ async def execution_node(state: RealmForgeState):
         # REDUNDANCY HANDOFF PROTOCOL
         if tool_name == "HANDOFF":
             new_silo = state.get("fallback_department", "Architect")
-            specialist = get_industrial_specialist(new_silo)
+            planned = [t.get("tool") for t in tasks if t.get("tool") not in (None, "HANDOFF")]
+            specialist = get_industrial_specialist(new_silo, tools=planned, mission_id=mid)
             handoff = {"from": state['active_department'], "to": new_silo}
             return {
                 "active_agent": specialist['name'] if specialist else "ForgeMaster",
@@ -299,35 +313,41 @@ async def execution_node(state: RealmForgeState):
 
         if tool_name in TOOLS:
             try:
-                args = task.get("args", {})
-                # Production Path Sanitization
-                for k, v in args.items():
-                    if isinstance(v, str) and "F:/" in v: args[k] = v.replace("\\", "/")
-
-                # PRE-EXECUTION SNIFFING
-                path_mentions = re.findall(r'[Ff]:/[^ "^\n\t,)]+', str(args))
-                found_artifacts.extend(path_mentions)
-
-                # Tool Execution
-                result = await TOOLS[tool_name].ainvoke(args)
-                
-                # POST-EXECUTION SNIFFING (Case-insensitive path matching)
-                path_matches = re.findall(r'[Ff]:/[^ "^\n\t,)]+', str(result))
-                found_artifacts.extend(path_matches)
+                args = sanitize_args(task.get("args", {}))
+
+                # Tool Execution: adopt the planner's speculative run when one matches, else dispatch now
+                speculative = speculation_registry.claim(mid, tool_name, args)
+                if speculative:
+                    timing = speculative.timing
+                    result = ToolResult.adapt(await speculative.future)
+                else:
+                    timing = {}
+                    result = ToolResult.adapt(await run_tool(tool_name, args, timing))
+                result.metrics.update(timing)
+                lane_logs.append(f"⏱️ {tool_name} [{timing.get('lane')}{' | speculative' if speculative else ''}]: queued {timing.get('queue_ms', 0)}ms | ran {timing.get('run_ms', 0)}ms")
+
+                # ARTIFACT LEDGER (declared by the tool, no output scraping)
+                found_artifacts.extend(result.artifacts)
 
                 # REDUNDANCY TRIGGER
-                if any(err in str(result) for err in ["Throttled", "Error", "None found", "failed"]):
+                if not result.ok:
+                    speculation_registry.release(mid)
                     return {"next_node": "executor", "task_queue": [{"tool": "HANDOFF"}], "messages": messages}
                 
-                messages.append(ToolMessage(tool_call_id=str(uuid.uuid4()), content=str(result)))
+                content = spill_tool_output(result.render(), state.get("mission_id", "UNK"), tool_name)
+                messages.append(ToolMessage(tool_call_id=str(uuid.uuid4()), content=content))
             except Exception as e:
                 print(f"💥 [TOOL_CRASH]: {tool_name} failed: {e}")
+                speculation_registry.release(mid)
                 return {"next_node": "executor", "task_queue": [{"tool": "HANDOFF"}], "messages": messages}
         
+    speculation_registry.release(mid)  # Unclaimed speculative runs are cancelled
     return {
-        "messages": messages[-15:], 
+        "messages": messages, 
         "active_agent": agent, 
-        "artifacts": list(set(found_artifacts)),
+        "artifacts": list(dict.fromkeys(found_artifacts)),
+        "diagnostic_stream": lane_logs,
+        "vitals": {"tool_engine": tool_engine.snapshot(), "circuit_breakers": resilience_layer.snapshot(), "speculation": speculation_registry.snapshot()},
         "next_node": "validator"
     }
 
@@ -335,21 +355,11 @@ async def validator_node(state: RealmForgeState):
     """THE IRONCLAD GATE: Forensic hash-verification and Lattice anchoring."""
     artifacts = state.get("artifacts", [])
     agent = "IronClad"
-    v_logs = []
     clean_artifacts = [str(a).replace('\\', '/') for a in artifacts if 'F:/' in str(a)]
-    
-    for path in list(set(clean_artifacts)):
-        try:
-            # Physical verification via registry tools
-            res = await calculate_file_hash.ainvoke({"file_path": path})
-            if "ERROR" not in res:
-                current_hash = res.split(": ")[-1].strip()
-                # Anchor the hash to the Knowledge Graph
-                await update_knowledge_graph.ainvoke({"subject": path, "relation": "CURRENT_HASH", "target": current_hash})
-                v_logs.append(f"✅ {path}: Verified. ({current_hash[:8]})")
-            else:
-                v_logs.append(f"❌ {path}: Physical file missing from drive.")
-        except: continue
+
+    # Parallel hashing (stat-cached) + one batched CURRENT_HASH anchor into the lattice
+    records = await artifact_verifier.verify(clean_artifacts)
+    v_logs = [r.log_line() for r in records]
 
     return {
         "active_agent": agent,
@@ -377,7 +387,7 @@ async def synthesizer_node(state: RealmForgeState):
     except: pass
 
     # Persist the completion to the Memory Engine
-    await memory_kernel.commit_mission_event(
+    await get_memory_kernel().commit_mission_event(
         mission_id=mid,
         agent_id=state.get("active_agent"),
         dept=state.get("active_department"),
@@ -385,6 +395,7 @@ async def synthesizer_node(state: RealmForgeState):
         result=last_msg
     )
 
+    specialist_index.release(mid)
     return {"messages": [AIMessage(content=last_msg)], "next_node": END}
 
 # ==============================================================================
@@ -401,8 +412,23 @@ builder.add_node("validator", validator_node)
 builder.add_node("auditor", auditor_node)
 builder.add_node("synthesizer", synthesizer_node)
 
-# Set Entry Point
-builder.set_entry_point("supervisor")
+# Static transitions (single source of truth for the graph and for journal resume)
+STATIC_EDGES = {
+    "planner": "executor",
+    "validator": "auditor",
+    "auditor": "synthesizer",
+    "synthesizer": END,
+}
+
+def resolve_successor(node: str, state: Dict[str, Any]) -> str:
+    """Next node after `node` completed; supervisor/executor route on next_node like their conditional edges."""
+    return STATIC_EDGES[node] if node in STATIC_EDGES else state.get("next_node", END)
+
+# Set Entry Point (journal resumes enter at the node after the last completed one)
+builder.set_conditional_entry_point(
+    lambda x: x.get("resume_from") or "supervisor",
+    {n: n for n in ["supervisor", "planner", "executor", "validator", "auditor", "synthesizer"]}
+)
 
 # Conditional Logic for Supervisor (General Chat vs Strike)
 builder.add_conditional_edges(
@@ -419,10 +445,9 @@ builder.add_conditional_edges(
 )
 
 # Standard Transitions
-builder.add_edge("planner", "executor")
-builder.add_edge("validator", "auditor")
-builder.add_edge("auditor", "synthesizer")
-builder.add_edge("synthesizer", END)
+for _src, _dst in STATIC_EDGES.items():
+    builder.add_edge(_src, _dst)
 
 # Compile Sovereign Brain
-app = builder.compile()
\ No newline at end of file
+with startup_profiler.phase("graph_compile"):
+    app = builder.compile()
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""
+REALM FORGE: MANIFEST PIPELINE BENCHMARK
+Reports files/sec for the legacy per-file yaml.safe_load loop, the C LibYAML loader, the chunked
+process pool, and a no-op content-hash write-back pass (nothing should be rewritten).
+
+Usage: python scripts/bench_manifest_pipeline.py [agents_dir] [workers]
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from src.system.manifest_pipeline import (  # noqa: E402
+    YAML_LOADER, ManifestJob, apply_manifest_jobs, atomic_write_text, parse_manifests,
+)
+
+def rate(label, n, fn):
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+    print(f"   {label:<38} {n / elapsed:>10.0f} files/s  ({elapsed * 1000:.0f} ms)")
+    return elapsed
+
+def legacy_loop(paths):
+    for p in paths:
+        with open(p, "r", encoding="utf-8-sig") as f:
+            yaml.safe_load(f)
+
+def main():
+    root = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).resolve().parents[1] / "data" / "agents"
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    paths = sorted(str(p) for p in root.rglob("*.yaml"))
+    if not paths:
+        print(f"No manifests under {root}")
+        return
+
+    print("--- [REALM FORGE: MANIFEST PIPELINE BENCHMARK] ---")
+    print(f"MANIFESTS: {len(paths)} | WORKERS: {workers} | LOADER: {YAML_LOADER.__name__}\n")
+
+    print(">>> parse")
+    legacy = rate("legacy yaml.safe_load loop", len(paths), lambda: legacy_loop(paths))
+    c_seq = rate("C loader, single process", len(paths), lambda: parse_manifests(paths, workers=1))
+    pool = rate(f"C loader, process pool x{workers}", len(paths), lambda: parse_manifests(paths, workers=workers))
+    print(f"   speedup vs legacy: {legacy / min(c_seq, pool):.1f}x\n")
+
+    print(">>> write-back (scratch copy, no-op patch)")
+    scratch = Path(tempfile.mkdtemp(prefix="realm_manifests_"))
+    try:
+        copies = []
+        for i, p in enumerate(paths):
+            dst = scratch / f"{i}.yaml"
+            shutil.copyfile(p, dst)
+            copies.append(str(dst))
+        # First pass normalizes formatting; the second is the steady state this pipeline targets
+        apply_manifest_jobs([ManifestJob(c) for c in copies], workers=workers)
+        results = []
+        rate("parse + hash compare (unchanged)", len(copies),
+             lambda: results.extend(apply_manifest_jobs([ManifestJob(c) for c in copies], workers=workers)))
+        print(f"   rewritten: {sum(r.written for r in results)} / {len(results)}")
+        rate("parse + unconditional yaml.dump (legacy)", len(copies),
+             lambda: [atomic_write_text(Path(c), yaml.dump(d, sort_keys=False, allow_unicode=True))
+                      for c, d in parse_manifests(copies, workers=1)])
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
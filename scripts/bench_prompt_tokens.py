@@ -0,0 +1,72 @@
+"""
+REALM FORGE: PLANNER PROMPT TOKEN BENCHMARK
+Compares the legacy planner prompt (the old tool selection rendered with str() after a per-mission
+header) against the compact, cache-stable assembly from src/system/prompting.py, per department.
+
+Usage: python scripts/bench_prompt_tokens.py [history_turns]
+"""
+import sys
+import json
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from langchain_core.messages import AIMessage, HumanMessage  # noqa: E402
+from src.system.prompting import ToolCatalog, build_planner_messages, count_tokens, count_message_tokens  # noqa: E402
+from src.system.arsenal.registry import ALL_TOOLS_LIST, get_tools_for_dept  # noqa: E402
+from src.system.arsenal.foundation import DEPARTMENT_TOOL_MAP  # noqa: E402
+
+MISSION = "Audit the billing service, write a remediation plan and commit it to the repo."
+PARAMS = {"target": "billing-service", "path": "F:/RealmForge_PROD/docs/remediation.md"}
+
+def legacy_tools(dept):
+    """The pre-catalog planner's selection, verbatim: StructuredTool objects (full reprs once rendered),
+    or the first 50 names when the registry filter matched nothing."""
+    available_tools = get_tools_for_dept(dept, ALL_TOOLS_LIST)
+    if not available_tools:
+        available_tools = [t.name for t in ALL_TOOLS_LIST[:50]]
+    return available_tools
+
+def legacy_prompt(dept, available_tools):
+    # Verbatim pre-catalog planner prompt; the tool list is interpolated with str() exactly as before
+    return f"""
+    IDENTITY: ForgeMaster (Industrial Silo: {dept})
+    MISSION: {MISSION}
+    SEMANTIC_ENTITIES: {json.dumps(PARAMS)}
+    AVAILABLE TOOLS: {available_tools}
+
+    PROTOCOL:
+    1. Use SEMANTIC_ENTITIES to fill tool arguments accurately.
+    2. Every file path MUST be F:/RealmForge_PROD/...
+
+    JSON SCHEMA:
+    {{ "sub_tasks": [ {{"tool": "TOOL_NAME", "args": {{ "param": "value" }} }} ] }}
+    """
+
+def main():
+    turns = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    history = [HumanMessage(content=MISSION)]
+    for i in range(turns):
+        history.append(AIMessage(content=f"📋 [PLAN_LOCKED]: turn {i} " + "telemetry " * 40))
+
+    t0 = time.perf_counter()
+    catalog = ToolCatalog(ALL_TOOLS_LIST, DEPARTMENT_TOOL_MAP)
+    build_ms = None
+
+    print("--- [REALM FORGE: PLANNER PROMPT TOKEN BENCHMARK] ---")
+    print(f"TOOLS: {len(catalog.by_name)} | HISTORY TURNS: {turns}\n")
+    print(f"   {'DEPARTMENT':<22} {'LEGACY':>8} {'COMPACT':>8} {'PREFIX':>8} {'TOOLS':>6}")
+    for dept in sorted(DEPARTMENT_TOOL_MAP):
+        catalog.for_department(dept)
+        if build_ms is None: build_ms = (time.perf_counter() - t0) * 1000
+        legacy = count_tokens(legacy_prompt(dept, legacy_tools(dept))) + count_message_tokens(history)
+        _, stats = build_planner_messages(catalog, dept, "ForgeMaster", MISSION, PARAMS, history)
+        print(f"   {dept:<22} {legacy:>8} {stats['prompt_tokens']:>8} {stats['prefix_tokens']:>8} {stats['tools']:>6}")
+
+    t0 = time.perf_counter()
+    for _ in range(1000):
+        catalog.for_department("Architect")
+    print(f"\n   first catalog build: {build_ms:.1f} ms | cached lookup: {(time.perf_counter() - t0) * 1000:.3f} µs")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+REALM FORGE: STATE REDUCER BENCHMARK
+Compares the legacy full-rebuild reducers against the incremental TaskBacklog / OrderedSet
+reducers on a large backlog receiving small deltas (the shape of a real planner/executor turn).
+
+Usage: python scripts/bench_state_reducers.py [backlog_size] [delta_size] [rounds]
+"""
+import sys
+import time
+import uuid
+import random
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from src.system.state import merge_tasks, deduplicate_artifacts  # noqa: E402
+
+PRIORITIES = ["LOW", "MEDIUM", "HIGH", "CRITICAL"]
+
+# --- LEGACY BASELINES (verbatim behavior of the pre-incremental reducers) ---
+
+def legacy_merge_tasks(existing, new):
+    task_map = {t.get('id'): t for t in existing if t.get('id')}
+    for t in new:
+        tid = t.get('id') or f"task_{uuid.uuid4().hex[:6]}"
+        t['id'] = tid
+        task_map[tid] = {**task_map[tid], **t} if tid in task_map else t
+    return sorted(list(task_map.values()), key=lambda x: (x.get('status', 'OPEN') != 'OPEN', x.get('priority', 'MEDIUM'), x.get('id', '')))
+
+def legacy_dedupe(existing, new):
+    return list(set((existing or []) + (new or [])))
+
+# --- FIXTURES ---
+
+def make_tasks(n, start=0):
+    return [{"id": f"t{i}", "tool": "write_file", "priority": random.choice(PRIORITIES), "status": "OPEN"} for i in range(start, start + n)]
+
+def make_paths(n, start=0):
+    return [f"F:/RealmForge/data/projects/artifact_{i}.txt" for i in range(start, start + n)]
+
+def bench(label, reducer, seed, deltas):
+    state = reducer([], seed)
+    t0 = time.perf_counter()
+    for d in deltas:
+        state = reducer(state, d)
+    elapsed = (time.perf_counter() - t0) * 1e6 / len(deltas)
+    print(f"   {label:<34} {elapsed:>10.1f} µs/merge")
+    return elapsed
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    delta = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    rounds = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+    random.seed(7)
+
+    print("--- [REALM FORGE: STATE REDUCER BENCHMARK] ---")
+    print(f"BACKLOG: {size} | DELTA: {delta} | ROUNDS: {rounds}\n")
+
+    print(">>> task_queue (new tasks + status updates to existing ids)")
+    def task_deltas():
+        out = []
+        for r in range(rounds):
+            fresh = make_tasks(delta // 2, size + r * delta)
+            updates = [{"id": f"t{random.randrange(size)}", "status": "DONE"} for _ in range(delta - len(fresh))]
+            out.append(fresh + updates)
+        return out
+    legacy = bench("legacy merge_tasks (re-sort)", legacy_merge_tasks, make_tasks(size), task_deltas())
+    fast = bench("TaskBacklog merge_tasks", merge_tasks, make_tasks(size), task_deltas())
+    print(f"   speedup: {legacy / fast:.1f}x\n")
+
+    print(">>> artifacts (path deltas, 50% already known)")
+    art_deltas = [make_paths(delta // 2, size + r * delta) + make_paths(delta // 2, r) for r in range(rounds)]
+    legacy = bench("legacy list(set(...))", legacy_dedupe, make_paths(size), art_deltas)
+    fast = bench("OrderedSet deduplicate_artifacts", deduplicate_artifacts, make_paths(size), art_deltas)
+    print(f"   speedup: {legacy / fast:.1f}x")
+
+if __name__ == "__main__":
+    main()
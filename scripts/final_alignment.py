@@ -1,7 +1,11 @@
 import os
+import sys
 import json
-import yaml
 import math
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from src.system.manifest_pipeline import ManifestJob, apply_manifest_jobs, plan_conflicts, removable_sources  # noqa: E402
 
 # --- PHYSICAL ANCHORS ---
 ROOT = "F:/RealmForge_PROD"
@@ -55,7 +59,8 @@ def execute_renormalization():
         silo_idx = i % len(SILOS)
         lattice[SILOS[silo_idx]]["tools"].append(tool)
 
-    # 3. Physically Move, Rename, and Update Agents
+    # 3. Plan the Move, Rename, and Update for every Agent
+    jobs, job_silos = [], []
     file_idx = 0
     for silo in SILOS:
         # Create physical directory
@@ -69,41 +74,42 @@ def execute_renormalization():
             role = ROLE_POOLS[silo][i % len(ROLE_POOLS[silo])]
             new_filename = f"{silo}_{role}_{file_idx}.yaml"
             new_path = os.path.join(silo_path, new_filename)
-            
-            # Update Internal YAML
-            try:
-                with open(old_path, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f) or {}
-                
-                # Standardize Identity & Professional
-                if 'identity' not in data: data['identity'] = {}
-                if 'professional' not in data: data['professional'] = {}
-                
-                data['identity']['full_name'] = f"Prime_{silo}_{file_idx}"
-                data['professional']['functional_role'] = role
-                data['professional']['department'] = silo.upper()
-                data['professional']['tools_assigned'] = lattice[silo]["tools"]
-                
-                # Write back to the NEW path
-                with open(new_path, 'w', encoding='utf-8') as f:
-                    yaml.dump(data, f)
-                
-                # Add to Lattice
-                lattice[silo]["agents"].append({
-                    "name": data['identity']['full_name'],
-                    "role": role,
-                    "path": new_path.replace("\\", "/")
-                })
-                
-                # Delete the old file if it was moved/renamed
-                if old_path != new_path and os.path.exists(old_path):
-                    os.remove(old_path)
-                    
-            except Exception as e:
-                print(f"[!] Error processing {old_path}: {e}")
-            
+
+            # Standardize Identity & Professional (applied in the worker pool)
+            jobs.append(ManifestJob(old_path, new_path, updates={
+                "identity": {"full_name": f"Prime_{silo}_{file_idx}"},
+                "professional": {"functional_role": role, "department": silo.upper(), "tools_assigned": lattice[silo]["tools"]},
+            }))
+            job_silos.append(silo)
             file_idx += 1
 
+    # 3a. Refuse plans that rename onto another job's pending source (re-runs into existing silo files):
+    # parallel workers could read a file another job already replaced
+    conflicts = plan_conflicts(jobs)
+    if conflicts:
+        for writer, reader in conflicts[:10]:
+            print(f"[!] Plan conflict: {writer.src} -> {writer.dst} overwrites the pending source of {reader.dst}")
+        print(f"[ABORT] {len(conflicts)} rename collisions; nothing was written.")
+        return
+
+    # 3b. Parallel patch + write (unchanged content is not rewritten), then lattice + cleanup
+    results = apply_manifest_jobs(jobs, workers=os.cpu_count())
+    for silo, job, result in zip(job_silos, jobs, results):
+        if result.error:
+            print(f"[!] Error processing {job.src}: {result.error}")
+            continue
+        # Add to Lattice
+        lattice[silo]["agents"].append({
+            "name": result.dna['identity']['full_name'],
+            "role": result.dna['professional']['functional_role'],
+            "path": job.dst.replace("\\", "/")
+        })
+
+    # Delete old files that were moved/renamed, never one that another job just wrote
+    for src in removable_sources(jobs, results):
+        if os.path.exists(src):
+            os.remove(src)
+
     # 4. Final Save of Lattice JSON
     with open(OUTPUT_PATH, 'w', encoding='utf-8') as f:
         json.dump(lattice, f, indent=4)
@@ -1,6 +1,9 @@
-import os, yaml, json
+import os, sys, json
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from src.system.agent_store import AgentStore  # noqa: E402
+
 def sync():
     root = Path("F:/RealmForge_PROD")
     agent_dir = root / "data" / "agents"
@@ -9,20 +12,15 @@ def sync():
     print("📋 [SYNC] Re-indexing 1,112 Agents into sectors...")
     new_roster = []
     
-    # Walk the subfolders we created during the move
-    for af in agent_dir.rglob("*.yaml"):
-        try:
-            with open(af, 'r', encoding='utf-8-sig') as f:
-                dna = yaml.safe_load(f)
-            if dna:
-                new_roster.append({
-                    "name": dna['identity'].get('full_name'),
-                    "role": dna['professional'].get('role_title'),
-                    "dept": dna['professional'].get('department'),
-                    "id": dna['identity'].get('employee_id'),
-                    "status": "ONLINE"
-                })
-        except: continue
+    # Indexed walk: only manifests changed since the last sync are re-parsed
+    for rec in AgentStore(agent_dir, workers=os.cpu_count()).all():
+        new_roster.append({
+            "name": rec.name,
+            "role": rec.role_title,
+            "dept": rec.dept,
+            "id": rec.employee_id,
+            "status": "ONLINE"
+        })
 
     with open(roster_path, 'w', encoding='utf-8-sig') as f:
         json.dump({"roster": new_roster}, f, indent=2)
@@ -3,9 +3,13 @@ REALM FORGE: NVIDIA-TIER ROLE SYNC v3.0
 PURPOSE: Aligns 1,113 agents to an industrial corporate hierarchy.
 EFFECT: Agents physically gain functional_roles recognized by the Brain.
 """
-import os, json, yaml
+import os, sys, json
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from src.system.agent_store import AgentStore  # noqa: E402
+from src.system.manifest_pipeline import ManifestJob, apply_manifest_jobs  # noqa: E402
+
 ROOT = Path("F:/RealmForge_PROD")
 AGENT_DIR = ROOT / "data" / "agents"
 ROSTER_PATH = ROOT / "data" / "roster.json"
@@ -46,45 +50,44 @@ def sync_nvidia_roles():
     print("🚀 [ROLE_MASTERY]: Initiating NVIDIA Industrial Pivot for 1,113 Agents...")
     new_roster = []
     
-    # 1. Walk every sector folder
-    for sector_folder in AGENT_DIR.iterdir():
-        if not sector_folder.is_dir(): continue
-        
-        sector_name = sector_folder.name
+    # 1. Group indexed manifests by sector folder (one incremental store sync instead of 1,113 parses)
+    store = AgentStore(AGENT_DIR, workers=os.cpu_count())
+    sectors = {}
+    for rec in store.all():
+        sectors.setdefault(Path(rec.path).parent.name, []).append(rec)
+
+    jobs, assigned = [], {}
+    for sector_name, records in sectors.items():
         # Find corresponding role pool from NVIDIA map, or default to generalist
         role_pool = NVIDIA_ROLE_HIERARCHY.get(sector_name, [f"{sector_name.capitalize()}_Technical_Specialist"])
-        
-        agent_files = list(sector_folder.glob("*.yaml"))
-        print(f"📦 Sector [{sector_name}]: Syncing {len(agent_files)} agents.")
+        print(f"📦 Sector [{sector_name}]: Syncing {len(records)} agents.")
 
-        for i, f in enumerate(agent_files):
-            try:
-                # 2. Read Agent DNA
-                with open(f, 'r', encoding='utf-8-sig') as stream:
-                    dna = yaml.safe_load(stream)
-                if not dna: continue
+        for i, rec in enumerate(records):
+            # 3. Assign Role (Cycling through pool to ensure variety across 1k agents)
+            functional_role = role_pool[i % len(role_pool)]
+            assigned[rec.path] = (sector_name, functional_role)
+            jobs.append(ManifestJob(rec.path, updates={
+                "professional": {"functional_role": functional_role, "department": sector_name.upper()}
+            }))
 
-                # 3. Assign Role (Cycling through pool to ensure variety across 1k agents)
-                functional_role = role_pool[i % len(role_pool)]
-                
-                # 4. SURGICAL YAML UPDATE
-                dna['professional']['functional_role'] = functional_role
-                dna['professional']['department'] = sector_name.upper()
-                
-                with open(f, 'w', encoding='utf-8-sig') as stream:
-                    yaml.dump(dna, stream, sort_keys=False, allow_unicode=True)
+    # 4. SURGICAL YAML UPDATE (parallel, only files whose content actually changes are rewritten)
+    results = apply_manifest_jobs(jobs, workers=os.cpu_count())
+    for r in results:
+        if r.error:
+            print(f"⚠️ Failed to sync {Path(r.src).name}: {r.error}")
+            continue
+        sector_name, functional_role = assigned[r.src]
 
-                # 5. ROSTER COLLECTION
-                new_roster.append({
-                    "name": dna['identity'].get('full_name'),
-                    "functional_role": functional_role,
-                    "dept": sector_name.upper(),
-                    "id": dna['identity'].get('employee_id'),
-                    "skills": dna['professional'].get('skills', []),
-                    "status": "ONLINE"
-                })
-            except Exception as e:
-                print(f"⚠️ Failed to sync {f.name}: {e}")
+        # 5. ROSTER COLLECTION
+        new_roster.append({
+            "name": r.dna['identity'].get('full_name'),
+            "functional_role": functional_role,
+            "dept": sector_name.upper(),
+            "id": r.dna['identity'].get('employee_id'),
+            "skills": r.dna['professional'].get('skills', []),
+            "status": "ONLINE"
+        })
+    print(f"✍️  {sum(r.written for r in results)} manifests rewritten, {len(results) - sum(r.written for r in results)} already aligned.")
 
     # 6. COMMIT ROSTER TO LATTICE
     with open(ROSTER_PATH, 'w', encoding='utf-8-sig') as f:
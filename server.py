@@ -109,8 +109,15 @@ logger = logging.getLogger("RealmForgeGateway")
 try:
     from src.auth import gatekeeper
     from src.system.state import get_initial_state, RealmForgeState
-    from src.memory.engine import MemoryManager 
+    from src.memory.engine import MemoryManager, get_memory_kernel
+    from src.system.startup_profiler import startup_profiler
     from src.system.orchestrator import orchestrator
+    from src.system.resilience import resilience_layer
+    from src.system.checkpoint import mission_journal, MissionActiveError
+    from src.system.roster_cache import RosterCache
+    from src.system.discord_directory import discord_directory
+    from src.system.discord_dispatcher import discord_dispatcher
+    from src.system.sqlite_manager import sqlite_manager
     from src.system.arsenal.registry import (
         prepare_vocal_response, 
         generate_neural_audio, 
@@ -122,6 +129,8 @@ except ImportError as e:
     logger.error(f"❌ [CRITICAL] Internal Module Import Failure: {e}")
     sys.exit(1)
 
+ROSTER_VIEW = RosterCache(BASE_PATH / "roster_cache.json")
+
 # ==============================================================================
 # 5. DATA MODELS
 # ==============================================================================
@@ -137,8 +146,11 @@ class FileSaveRequest(BaseModel): path: str; content: str
 class ConnectionManager:
     def __init__(self): 
         self.active: List[WebSocket] = []
-        # v29.2 Linkage to Memory for real node counts
-        self.mem = MemoryManager()
+
+    @property
+    def mem(self) -> MemoryManager:
+        # v29.2 Linkage to Memory for real node counts (shared kernel, built on first use)
+        return get_memory_kernel()
         
     async def connect(self, ws: WebSocket):
         await ws.accept()
@@ -164,6 +176,7 @@ class ConnectionManager:
                     "lattice_nodes": current_nodes, 
                     "active_users": len(self.active),
                     "active_sector": msg.get("dept", "Architect"),
+                    "circuit_breakers": resilience_layer.snapshot(),
                     "timestamp": time.time()
                 }
             except: pass
@@ -214,7 +227,10 @@ def get_brain():
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     get_brain()
+    startup_profiler.log_report()
     await gatekeeper.init_auth_db()
+    mission_journal.start_gc()
+    discord_directory.start()
     cid = os.getenv("GITHUB_CLIENT_ID")
     ruri = os.getenv("GITHUB_REDIRECT_URI", "http://localhost:8000/api/v1/auth/github/callback")
     debug_url = f"https://github.com/login/oauth/authorize?client_id={cid}&redirect_uri={ruri}&scope=repo,user"
@@ -227,6 +243,10 @@ async def lifespan(app: FastAPI):
     print("🚀"*20 + "\n", flush=True)
     yield
     logger.info("🔌 [OFFLINE] Sovereign Node shutdown initiated.")
+    await mission_journal.stop()
+    await discord_directory.stop()
+    await discord_dispatcher.close()
+    sqlite_manager.close_all()
 
 app = FastAPI(title="RealmForge OS - Sovereign Gateway", version="29.2.0", lifespan=lifespan)
 app.mount("/static", StaticFiles(directory=str(STATIC_PATH)), name="static")
@@ -278,7 +298,7 @@ async def github_exchange(req: GithubTokenRequest, lic: gatekeeper.License = Dep
 @app.post("/api/v1/assistant/chat")
 async def assistant_chat(req: ChatRequest, lic: gatekeeper.License = Depends(get_license)):
     try:
-        mem = MemoryManager()
+        mem = get_memory_kernel()
         context = await mem.recall(req.message, n_results=5)
         groq_client = Groq(api_key=os.getenv("GROQ_API_KEY"))
         res = groq_client.chat.completions.create(
@@ -300,6 +320,55 @@ def log_contribution(agent_id, dept, mission_id, action, credits=1.0):
             csv.writer(f).writerow([datetime.now().isoformat(), agent_id, dept, mission_id, action, credits])
     except Exception as e: logger.error(f"❌ [AUDIT_FAIL]: {e}")
 
+async def relay_mission_stream(stream, mid: str):
+    """Fans journaled node updates out to the HUD: node telemetry, audit ledger and deduplicated TTS."""
+    # --- AUDIO LOOP PROTECTOR: Deduplication Registry (v29.2 Hardened) ---
+    processed_msg_hashes = set()
+
+    async for output in stream:
+        for node_name, node_state in output.items():
+            if node_name == "__end__": continue
+
+            agent = node_state.get("active_agent") or node_name.upper()
+            dept = node_state.get("active_department", "Architect")
+            handoffs = node_state.get("handoff_history", [])
+            participants = node_state.get("meeting_participants", [])
+            msgs = node_state.get("messages", [])
+
+            await manager.broadcast({
+                "type": "node_update", 
+                "node": node_name.upper(), 
+                "agent": agent, 
+                "dept": dept, 
+                "handoffs": handoffs,
+                "meeting_participants": participants
+            })
+
+            log_contribution(agent, dept, mid, f"Phase: {node_name}")
+
+            # Audio Stream Logic with Deduplication v29.2
+            new_msgs = msgs if isinstance(msgs, list) else [msgs]
+            for msg in new_msgs:
+                if hasattr(msg, 'content') and msg.content and not isinstance(msg, HumanMessage):
+                    # Use hash of content to prevent duplicate TTS trigger on same string
+                    m_hash = hash(msg.content)
+                    if m_hash in processed_msg_hashes:
+                        continue 
+                    
+                    processed_msg_hashes.add(m_hash)
+                    content = msg.content
+                    
+                    # Optimization: Skip audio for utility heartbeats
+                    if "[PLANNING]" in content or "[STRATEGY]" in content:
+                        continue
+
+                    vocal = prepare_vocal_response(content)
+                    audio_payload = await generate_neural_audio(vocal)
+                    await manager.broadcast({
+                        "type": "audio_chunk", "text": content, "audio_base64": audio_payload, 
+                        "agent": agent, "node": node_name, "dept": dept
+                    })
+
 @app.post("/api/v1/mission")
 async def mission(req: MissionRequest, lic: gatekeeper.License = Depends(get_license)):
     engine = get_brain()
@@ -313,56 +382,11 @@ async def mission(req: MissionRequest, lic: gatekeeper.License = Depends(get_lic
         state["metadata"]["user_id"] = lic.user_id
         state["vitals"]["active_sector"] = "Architect"
         
-        # --- AUDIO LOOP PROTECTOR: Deduplication Registry (v29.2 Hardened) ---
-        processed_msg_hashes = set()
-        
         await manager.broadcast({
             "type": "diagnostic", "text": f"🚀 Strike {mid} Initialized.", "agent": "ORCHESTRATOR"
         })
 
-        async for output in engine.astream(state):
-            for node_name, node_state in output.items():
-                if node_name == "__end__": continue
-
-                agent = node_state.get("active_agent") or node_name.upper()
-                dept = node_state.get("active_department", "Architect")
-                handoffs = node_state.get("handoff_history", [])
-                participants = node_state.get("meeting_participants", [])
-                msgs = node_state.get("messages", [])
-
-                await manager.broadcast({
-                    "type": "node_update", 
-                    "node": node_name.upper(), 
-                    "agent": agent, 
-                    "dept": dept, 
-                    "handoffs": handoffs,
-                    "meeting_participants": participants
-                })
-
-                log_contribution(agent, dept, mid, f"Phase: {node_name}")
-
-                # Audio Stream Logic with Deduplication v29.2
-                new_msgs = msgs if isinstance(msgs, list) else [msgs]
-                for msg in new_msgs:
-                    if hasattr(msg, 'content') and msg.content and not isinstance(msg, HumanMessage):
-                        # Use hash of content to prevent duplicate TTS trigger on same string
-                        m_hash = hash(msg.content)
-                        if m_hash in processed_msg_hashes:
-                            continue 
-                        
-                        processed_msg_hashes.add(m_hash)
-                        content = msg.content
-                        
-                        # Optimization: Skip audio for utility heartbeats
-                        if "[PLANNING]" in content or "[STRATEGY]" in content:
-                            continue
-
-                        vocal = prepare_vocal_response(content)
-                        audio_payload = await generate_neural_audio(vocal)
-                        await manager.broadcast({
-                            "type": "audio_chunk", "text": content, "audio_base64": audio_payload, 
-                            "agent": agent, "node": node_name, "dept": dept
-                        })
+        await relay_mission_stream(mission_journal.stream(engine, state), mid)
 
         await manager.broadcast({"type": "mission_complete"})
         return {"status": "SUCCESS", "mission_id": mid}
@@ -371,13 +395,41 @@ async def mission(req: MissionRequest, lic: gatekeeper.License = Depends(get_lic
         await manager.broadcast({"type": "error", "message": str(e)})
         raise HTTPException(500, str(e))
 
+@app.get("/api/v1/missions/resumable")
+async def resumable_missions(lic: gatekeeper.License = Depends(get_license)):
+    """Missions interrupted mid-flight (gateway crash/restart) that the journal can rebuild."""
+    return {"missions": await asyncio.to_thread(mission_journal.list_resumable)}
+
+@app.post("/api/v1/mission/{mission_id}/resume")
+async def resume_mission(mission_id: str, lic: gatekeeper.License = Depends(get_license)):
+    engine = get_brain()
+    from realm_core import resolve_successor
+    if mission_journal.is_active(mission_id):
+        raise HTTPException(409, f"Mission {mission_id} is already running.")
+    state = await mission_journal.resume_state(mission_id, RealmForgeState, resolve_successor)
+    if state is None:
+        raise HTTPException(404, f"Mission {mission_id} not found in journal or already complete.")
+    try:
+        await manager.broadcast({
+            "type": "diagnostic", "text": f"♻️ Strike {mission_id} resuming at {state['resume_from'].upper()}.", "agent": "ORCHESTRATOR"
+        })
+        await relay_mission_stream(mission_journal.stream(engine, state, resume=True), mission_id)
+        await manager.broadcast({"type": "mission_complete"})
+        return {"status": "SUCCESS", "mission_id": mission_id, "resumed_from": state["resume_from"]}
+    except MissionActiveError as e:
+        raise HTTPException(409, str(e))  # Lost the race to a concurrent resume of the same mission
+    except Exception as e:
+        logger.error(f"💥 [MISSION_FAULT]: {e}")
+        await manager.broadcast({"type": "error", "message": str(e)})
+        raise HTTPException(500, str(e))
+
 # ==============================================================================
 # 10. HARDENED SENSORY ENDPOINTS (ROSTER & I/O)
 # ==============================================================================
 
 @app.get("/api/v1/agents")
 async def list_agents(lic: gatekeeper.License = Depends(get_license)):
-    """Pull 1,113 Renormalized Agents from the Master Lattice."""
+    """Pull 1,113 Renormalized Agents (Master Lattice silos; built roster cache only when the lattice is missing)."""
     try:
         if LATTICE_PATH.exists():
             with open(LATTICE_PATH, 'r', encoding='utf-8') as f:
@@ -394,9 +446,21 @@ async def list_agents(lic: gatekeeper.License = Depends(get_license)):
                         "path": agent.get("path")
                     })
             return {"roster": ui_roster}
+        if ROSTER_VIEW.built():
+            return {"roster": ROSTER_VIEW.all()}
         return {"roster": [], "warn": "Lattice file missing."}
     except Exception as e: return {"roster": [], "error": str(e)}
 
+@app.get("/api/v1/system/startup")
+async def startup_report(lic: gatekeeper.License = Depends(get_license)):
+    """Brain ignition profile: wall time, RSS growth and heavy imports per phase."""
+    return startup_profiler.report()
+
+@app.get("/api/v1/system/comms")
+async def comms_report(lic: gatekeeper.License = Depends(get_license)):
+    """Discord uplink: outbound queue depth, rate-limit buckets and directory freshness."""
+    return {"dispatcher": discord_dispatcher.snapshot(), "directory": discord_directory.snapshot()}
+
 @app.get("/api/v1/graph")
 async def get_lattice_data(lic: gatekeeper.License = Depends(get_license)):
     try:
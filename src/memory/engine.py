@@ -12,11 +12,9 @@ import logging
 import asyncio
 import hashlib
 import networkx as nx
-import chromadb
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Union
-from chromadb.utils import embedding_functions
 
 # --- LOGGING SETUP ---
 logging.basicConfig(level=logging.INFO)
@@ -40,8 +38,10 @@ class MemoryManager:
         os.makedirs(DATA_ROOT / "memory", exist_ok=True)
         os.makedirs(CHROMA_PATH, exist_ok=True)
         
-        # 1. VECTOR DATABASE CLIENT (The 'Deep Memory')
+        # 1. VECTOR DATABASE CLIENT (The 'Deep Memory') - chromadb/onnx load here, not at import
         try:
+            import chromadb
+            from chromadb.utils import embedding_functions
             self.chroma_client = chromadb.PersistentClient(path=CHROMA_PATH)
             self.embedding_fn = embedding_functions.DefaultEmbeddingFunction()
             
@@ -215,4 +215,16 @@ class MemoryManager:
                 "metadata": self.graph.nodes[entity_id],
                 "connections": list(self.graph.neighbors(entity_id))
             }
-        return {"error": "Node not found"}
\ No newline at end of file
+        return {"error": "Node not found"}
+
+# --- SHARED KERNEL (LAZY) ---
+_KERNEL: Optional[MemoryManager] = None
+
+def get_memory_kernel() -> MemoryManager:
+    """Process-wide MemoryManager, built on first use under the 'memory' startup phase."""
+    global _KERNEL
+    if _KERNEL is None:
+        from src.system.startup_profiler import startup_profiler
+        with startup_profiler.phase("memory"):
+            _KERNEL = MemoryManager()
+    return _KERNEL
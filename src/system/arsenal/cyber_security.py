@@ -15,6 +15,7 @@ import pandas as pd
 
 from src.system.arsenal.foundation import *  # noqa: F403
 from src.system.arsenal.foundation import (
+    ToolResult,
     DATA_DIR,
     ROOT_DIR,
     STATIC_DIR,
@@ -109,7 +110,7 @@ We utilize the Realm Forge Sovereign Audit protocol for rapid patching.
         os.makedirs(target.parent, exist_ok=True)
         # Atomic Write
         target.write_text(content, encoding='utf-8')
-        return f'💎 [GOVERNANCE]: Security Policy manifested at {target}'
+        return ToolResult.success(f'💎 [GOVERNANCE]: Security Policy manifested at {target}', artifacts=[target])
     except Exception as e:
         return f'[ERROR]: {str(e)}'
 
@@ -221,6 +222,6 @@ async def write_csv_report(filename: str, data_json: str):
         
         # Atomic write
         df.to_csv(target, index=False)
-        return f"✅ [CSV_SAVED]: Ledger committed to {target}"
+        return ToolResult.success(f"✅ [CSV_SAVED]: Ledger committed to {target}", artifacts=[target])
     except Exception as e:
         return f"[ERROR] CSV Generation Failed: {str(e)}"
@@ -10,13 +10,14 @@ import shutil
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
 
 import httpx
 import pandas as pd  # type: ignore[import-untyped]
 
 from src.system.arsenal.foundation import *  # noqa: F403  # type: ignore[import-untyped]
 from src.system.arsenal.foundation import (  # type: ignore[import-untyped]
+    ToolResult,
     DATA_DIR,
     ROOT_DIR,
     STATIC_DIR,
@@ -24,8 +25,11 @@ from src.system.arsenal.foundation import (  # type: ignore[import-untyped]
     logger,
     sanitize_windows_path,
     tool,
-    yf,
 )
+from src.system.market_data import market_data
+from src.system.csv_stream import count_rows, read_columns
+from src.system.csv_profile import csv_profiler
+from src.system.sqlite_manager import sqlite_manager
 
 @tool('convert_csv_to_markdown_table')
 async def convert_csv_to_markdown_table(file_path: str):
@@ -46,8 +50,7 @@ async def get_stock_history_csv(ticker: str, period: str='1mo'):
     try:
         # Validate ticker format
         ticker = ticker.upper().strip()
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period=period)
+        hist = market_data.history(ticker, period=period)
         
         if hist.empty:
             return f'[ERROR] No market data returned for {ticker}. Check symbol.'
@@ -60,7 +63,7 @@ async def get_stock_history_csv(ticker: str, period: str='1mo'):
         hist.to_csv(path)
         
         logger.info(f"ðŸ“ˆ [MARKET_INGRESS]: {ticker} data committed to {path}")
-        return f'[SUCCESS] [DATA_SAVED]: {path} ({len(hist)} intervals ingested)'
+        return ToolResult.success(f'[SUCCESS] [DATA_SAVED]: {path} ({len(hist)} intervals ingested)', artifacts=[path])
     except Exception as e:
         return f'[ERROR] Financial API Fault: {str(e)}'
 
@@ -72,13 +75,12 @@ async def industrial_data_ingress(individual_csv: str, business_csv: str):
         biz_p = (DATA_DIR / business_csv.replace('data/', '').lstrip('/')).resolve()
         
         results = []
+        # Constant memory: mmap newline scan for the count, header-only parse for the schema
         if ind_p.exists():
-            df_ind = pd.read_csv(ind_p)
-            results.append(f"Ind_Sector: {len(df_ind)} records | Columns: {list(df_ind.columns[:3])}...")
+            results.append(f"Ind_Sector: {count_rows(ind_p)} records | Columns: {read_columns(ind_p)[:3]}...")
         
         if biz_p.exists():
-            df_biz = pd.read_csv(biz_p)
-            results.append(f"Biz_Sector: {len(df_biz)} records | Columns: {list(df_biz.columns[:3])}...")
+            results.append(f"Biz_Sector: {count_rows(biz_p)} records | Columns: {read_columns(biz_p)[:3]}...")
             
         return f"ðŸ’Ž [INGRESS_SUMMARY]:\n" + "\n".join(results)
     except Exception as e:
@@ -89,12 +91,7 @@ async def sqlite_create_table_v2(db_name: str, table_name: str, table_definition
     """Structural Engineer: Physically manifests a SQLite table with high-fidelity schema."""
     try:
         path = DATA_DIR / 'databases' / f'{sanitize_windows_path(db_name)}.db'
-        path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with sqlite3.connect(path) as conn:
-            conn.execute("PRAGMA foreign_keys = ON")
-            conn.execute(f"CREATE TABLE IF NOT EXISTS {table_name} ({table_definition})")
-            conn.commit()
+        await sqlite_manager.execute(path, f"CREATE TABLE IF NOT EXISTS {table_name} ({table_definition})")
         return f"âœ… [SCHEMA_COMMITTED]: Table '{table_name}' online in {db_name}.db"
     except Exception as e:
         return f'[ERROR] Database Creation Fault: {str(e)}'
@@ -106,34 +103,40 @@ async def sqlite_insert(db_name: str, table: str, data: Dict):
         path = DATA_DIR / 'databases' / f'{sanitize_windows_path(db_name)}.db'
         if not path.exists(): return "[ERROR]: Target database does not exist."
 
-        columns = ', '.join(data.keys())
-        placeholders = ', '.join('?' * len(data))
-        sql = f'INSERT INTO {table} ({columns}) VALUES ({placeholders})'
-        
-        with sqlite3.connect(path) as conn:
-            conn.execute(sql, list(data.values()))
-            conn.commit()
+        # Owner thread group-commits concurrent single-row writes into one transaction
+        await sqlite_manager.insert(path, table, data)
         return f'ðŸš€ [DB_WRITE]: Record appended to {table}.'
     except Exception as e:
         return f'[ERROR] Write Fault: {str(e)}'
 
+@tool('sqlite_bulk_insert')
+async def sqlite_bulk_insert(db_name: str, table: str, rows: List[Dict]):
+    """Bulk Committer: Inserts a batch of dictionary records via executemany inside a single transaction."""
+    try:
+        path = DATA_DIR / 'databases' / f'{sanitize_windows_path(db_name)}.db'
+        if not path.exists(): return "[ERROR]: Target database does not exist."
+        if not rows: return "[ERROR]: No rows supplied."
+
+        written = await sqlite_manager.insert_many(path, table, rows)
+        return f'ðŸš€ [DB_BULK_WRITE]: {written} records appended to {table} in one transaction.'
+    except Exception as e:
+        return f'[ERROR] Bulk Write Fault (batch rolled back): {str(e)}'
+
 @tool('sqlite_inspect_schema')
 async def sqlite_inspect_schema(db_name: str):
     """Database Auditor: Retrieves the list of tables and column metadata for structural verification."""
     try:
         path = DATA_DIR / 'databases' / f'{sanitize_windows_path(db_name)}.db'
         if not path.exists(): return '[ERROR]: Target database offline.'
-        
-        report = []
-        with sqlite3.connect(path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = cursor.fetchall()
-            for t in tables:
-                cursor.execute(f"PRAGMA table_info({t[0]})")
-                cols = [f"{c[1]} ({c[2]})" for c in cursor.fetchall()]
-                report.append(f"- **{t[0]}**: {', '.join(cols)}")
-        
+
+        def _schema(conn):
+            report = []
+            for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall():
+                cols = [f"{c[1]} ({c[2]})" for c in conn.execute(f'PRAGMA table_info("{name}")').fetchall()]
+                report.append(f"- **{name}**: {', '.join(cols)}")
+            return report
+
+        report = await sqlite_manager.run(path, _schema)
         return f'### [DATABASE_SCHEMA]: {db_name}.db\n' + '\n'.join(report)
     except Exception as e:
         return f'[ERROR] Inspection Failed: {str(e)}'
@@ -149,14 +152,9 @@ async def sqlite_query(db_name: str, query: str):
         if not query.strip().upper().startswith("SELECT"):
             return "[SECURITY_BLOCK]: Only read-only queries are authorized for this tool."
 
-        with sqlite3.connect(path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            # Limit results to 50 rows to prevent HUD overflow
-            cursor.execute(f"{query} LIMIT 50")
-            rows = [dict(row) for row in cursor.fetchall()]
-            
-        return f'### [SQL_RESULTS]:\n{json.dumps(rows, indent=2)}'
+        # Limit results to 50 rows to prevent HUD overflow (fetchmany, so queries with their own LIMIT still parse)
+        rows = await sqlite_manager.query(path, query, limit=50)
+        return f'### [SQL_RESULTS]:\n{json.dumps(rows, indent=2, default=str)}'
     except Exception as e:
         return f'[ERROR] SQL Fault: {str(e)}'
 
@@ -171,12 +169,17 @@ async def csv_processor_read(file_path: str, rows: int = 10):
         if not target.exists():
             return f"âŒ [CSV_IO_FAULT]: File {file_path} not located on disk."
 
-        # Read only requested rows for performance
+        # Read only requested rows for performance; totals/stats come from the (size, mtime) sidecar
         df = pd.read_csv(target, nrows=rows)
+        try:
+            profile = csv_profiler.get(target)
+        except Exception:  # The preview never depends on the full pass succeeding
+            profile = {"rows": count_rows(target), "profile": "unavailable"}
         summary = {
             "file": target.name,
-            "total_rows": "Scan pending...",
+            "total_rows": profile["rows"],
             "columns": list(df.columns),
+            "column_stats": profile.get("columns", profile.get("profile")),
             "preview": df.to_dict(orient='records')
         }
         logger.info(f"ðŸ“Š [CSV_SCAN]: Accessing {target.name}")
@@ -201,6 +204,6 @@ async def csv_processor_write(file_path: str, data_json: str):
         # Atomic Write
         df.to_csv(target, index=False)
         logger.info(f"âœ… [LEDGER_COMMIT]: {target.name} synchronized.")
-        return f"âœ… [CSV_WRITE_SUCCESS]: Ledger committed to {target.name}."
+        return ToolResult.success(f"âœ… [CSV_WRITE_SUCCESS]: Ledger committed to {target.name}.", artifacts=[target])
     except Exception as e:
         return f"âŒ [CSV_WRITE_FAIL]: {str(e)}"
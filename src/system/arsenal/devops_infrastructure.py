@@ -20,6 +20,7 @@ from reportlab.pdfgen import canvas  # type: ignore[import-untyped]
 
 from src.system.arsenal.foundation import *  # noqa: F403  # type: ignore[import-untyped]
 from src.system.arsenal.foundation import (  # type: ignore[import-untyped]
+    ToolResult,
     DATA_DIR,
     ROOT_DIR,
     STATIC_DIR,
@@ -56,7 +57,7 @@ async def archive_workspace(client_name: str):
 
         size_mb = zip_path.stat().st_size / (1024 * 1024)
         logger.info(f"📦 [VAULT_ARCHIVE]: {clean_name} packaged. Size: {size_mb:.2f}MB")
-        return f'[SUCCESS] [ARCHIVE_READY]: Deliverable Manifested at {zip_path}'
+        return ToolResult.success(f'[SUCCESS] [ARCHIVE_READY]: Deliverable Manifested at {zip_path}', artifacts=[zip_path])
     except Exception as e:
         return f'[ERROR] Archive Fault: {str(e)}'
 
@@ -83,7 +84,8 @@ async def create_client_workspace(client_name: str, tech_stack: str='general'):
         (target_dir / ".gitignore").write_text("node_modules/\n.env\n__pycache__/\n*.log\ndist/\n", encoding='utf-8')
         (target_dir / "README.md").write_text(f"# {client_name} Project\nGenerated by Realm Forge Sovereign Swarm.\n\nStack: {tech_stack}", encoding='utf-8')
         logger.info(f"🏗️ [FACTORY]: Workspace Manifested: {clean_name}")
-        return f'[SUCCESS] [FACTORY_SYNC]: Workspace created at {target_dir}. Ready for construction.'
+        return ToolResult.success(f'[SUCCESS] [FACTORY_SYNC]: Workspace created at {target_dir}. Ready for construction.',
+                                  artifacts=[target_dir / ".gitignore", target_dir / "README.md"])
     except Exception as e: return f'[ERROR] Factory Fault: {str(e)}'
 
 @tool('push_to_github')
@@ -130,7 +132,7 @@ async def sync_repository(commit_message: str='Swarm State Alignment'):
                 if res.returncode != 0 and "nothing to commit" not in res.stdout + res.stderr:
                     return f"❌ [GIT_FAULT] at '{' '.join(cmd)}': {res.stderr}"
             return "[SUCCESS] Repository synchronized."
-        except Exception as e: return str(e)
+        except Exception as e: return ToolResult.failure(f'[ERROR] Git Sync Fault: {str(e)}')
     return await asyncio.to_thread(_run_git)
 
 @tool('write_to_workspace')
@@ -142,7 +144,7 @@ async def write_to_workspace(client_name: str, relative_path: str, content: str)
         if not str(target).startswith(str(WORKSPACE_ROOT)): return "[SECURITY_ALERT]: Out-of-bounds blocked."
         target.parent.mkdir(parents=True, exist_ok=True)
         target.write_text(content, encoding='utf-8')
-        return f'🚀 [BUILD]: Committed to {clean_client}/{relative_path}'
+        return ToolResult.success(f'🚀 [BUILD]: Committed to {clean_client}/{relative_path}', artifacts=[target])
     except Exception as e: return f'[ERROR] Write Fault: {str(e)}'
 
 @tool('zip_directory')
@@ -154,5 +156,5 @@ async def zip_directory(dir_path: str, zip_name: str):
         dst.parent.mkdir(parents=True, exist_ok=True)
         if not src.exists(): return '[ERROR] Source missing.'
         shutil.make_archive(str(dst).replace('.zip', ''), 'zip', src)
-        return f'📦 [PACKAGE_COMPLETE]: {dst}'
+        return ToolResult.success(f'📦 [PACKAGE_COMPLETE]: {dst}', artifacts=[dst])
     except Exception as e: return f'[ERROR]: {str(e)}'
@@ -24,25 +24,45 @@ from src.system.arsenal.foundation import (  # type: ignore[import-untyped]
     sanitize_windows_path,
     tool,
 )
+from src.system.roster_cache import roster_cache
+from src.system.discord_directory import discord_directory
+from src.system.discord_dispatcher import discord_dispatcher
 
 # --- INTERNAL COMMS HELPERS ---
 
 async def _discord_request(method: str, endpoint: str, json_data: dict = None):
-    """Sovereign Discord Client: Authenticated HTTPX wrapper with rate-limit handling."""
-    token = os.getenv("DISCORD_BOT_TOKEN")
-    url = f"https://discord.com/api/v10{endpoint}"
-    headers = {"Authorization": f"Bot {token}", "Content-Type": "application/json"}
-    
-    async with httpx.AsyncClient() as client:
-        for attempt in range(3):
-            resp = await client.request(method, url, headers=headers, json=json_data)
-            if resp.status_code == 429:
-                wait = float(resp.json().get('retry_after', 1))
-                logger.warning(f"⏳ [RATE_LIMIT]: Discord throttled. Waiting {wait}s...")
-                await asyncio.sleep(wait)
-                continue
-            return resp
-    return None
+    """Sovereign Discord Client: every REST call goes through the shared bucket-aware dispatcher."""
+    return await discord_dispatcher.request(method, endpoint, json_data)
+
+async def _fetch_guild_channels():
+    """Directory refresh source: the only place the comms shard lists guild channels."""
+    guild_id = os.getenv("DISCORD_GUILD_ID")
+    resp = await _discord_request("GET", f"/guilds/{guild_id}/channels")
+    return resp.json() if resp and resp.status_code == 200 else None
+
+discord_directory.bind(_fetch_guild_channels)
+
+async def _dm_channel(user_id: str, fresh: bool = False):
+    """Recipient -> DM channel id from the persistent handle cache; POST /users/@me/channels only on a miss."""
+    if fresh:
+        discord_directory.drop_dm(user_id)
+    chan_id = discord_directory.dm_channel(user_id)
+    if chan_id: return chan_id
+    resp = await _discord_request("POST", "/users/@me/channels", {"recipient_id": user_id})
+    if resp is None or resp.status_code != 200: return None
+    chan_id = resp.json()['id']
+    discord_directory.put_dm(user_id, chan_id)
+    return chan_id
+
+UNKNOWN_CHANNEL = 10003  # Discord JSON error code: the channel behind a cached handle no longer exists
+
+def _stale_channel(resp) -> bool:
+    """Only a 404 Unknown Channel invalidates a DM handle; a 403 (e.g. 50007, recipient blocks DMs) does not."""
+    if resp is None or resp.status_code != 404: return False
+    try:
+        return resp.json().get('code', UNKNOWN_CHANNEL) == UNKNOWN_CHANNEL
+    except ValueError:
+        return True
 
 def _chunk_message(text: str, limit: int = 1900):
     """Splits massive industrial reports into Discord-safe chunks."""
@@ -55,10 +75,7 @@ async def send_discord_webhook(webhook_url: str, message: str, username: str='Re
     """Industrial Outbound: Transmits a message to a Discord channel via Webhook with Embed support."""
     try:
         chunks = _chunk_message(message)
-        async with httpx.AsyncClient() as client:
-            for chunk in chunks:
-                payload = {'content': chunk, 'username': username}
-                await client.post(webhook_url, json=payload)
+        await asyncio.gather(*(discord_dispatcher.send_webhook(webhook_url, {'content': chunk, 'username': username}) for chunk in chunks))
         return '[SUCCESS] [DISCORD]: Multi-part message delivered.'
     except Exception as e:
         return f'[ERROR] Webhook Failure: {str(e)}'
@@ -82,17 +99,23 @@ async def send_direct_notification(message: str):
         return "[ERROR]: DISCORD_ARCHITECT_ID must be a numeric Snowflake ID."
         
     try:
-        # 1. Create Private Channel
-        resp = await _discord_request("POST", "/users/@me/channels", {"recipient_id": user_id})
-        if resp.status_code != 200:
+        # 1. Private Channel: cached handle, created (one round-trip) only on first contact
+        chan_id = await _dm_channel(user_id)
+        if not chan_id:
+            logger.warning(f"⚠️ [NOTIFY_BLOCKED]: DM to {user_id} restricted by privacy.")
+            return "[SUCCESS] (Privacy Fallback Active): Notification logged to terminal."
+
+        # 2. Send Chunked Message: every chunk queued at once on the channel's ordered lane
+        chunks = [f"🚩 **[TITAN_NOTIFY]**: {chunk}" for chunk in _chunk_message(message)]
+        sent = await discord_dispatcher.send_chunks(chan_id, chunks)
+        if sent and _stale_channel(sent[0]):
+            # Stale handle (channel closed/recreated): refresh it once and resend
+            chan_id = await _dm_channel(user_id, fresh=True)
+            if chan_id: await discord_dispatcher.send_chunks(chan_id, chunks)
+        elif sent and sent[0] is not None and sent[0].status_code == 403:
+            # Recipient refuses DMs: the handle is still valid, so keep it and do not re-POST per notification
             logger.warning(f"⚠️ [NOTIFY_BLOCKED]: DM to {user_id} restricted by privacy.")
             return "[SUCCESS] (Privacy Fallback Active): Notification logged to terminal."
-        
-        chan_id = resp.json()['id']
-        # 2. Send Chunked Message
-        chunks = _chunk_message(message)
-        for chunk in chunks:
-            await _discord_request("POST", f"/channels/{chan_id}/messages", {"content": f"🚩 **[TITAN_NOTIFY]**: {chunk}"})
         return "[SUCCESS] Direct notification delivered."
     except:
         return "[SUCCESS] Notification logged to terminal (Bypass Active)."
@@ -100,34 +123,31 @@ async def send_direct_notification(message: str):
 @tool("mm_get_user_by_name") 
 async def mm_get_user_by_name(search_term: str):
     """Fleet Discovery: Resolves functional names or usernames into exact Discord Snowflake IDs."""
-    # 1. Check Local Phonebook First
-    map_path = Path("data/memory/discord_lattice_map.json")
-    if map_path.exists():
-        with open(map_path, 'r') as f:
-            lattice = json.load(f)
-            for uname, data in lattice.get("agents", {}).items():
-                if search_term.lower() in uname.lower() or search_term.lower() in data.get('functional_name', '').lower():
-                    return f"REAL_DATA_FOUND: username='{uname}' id='{data['channel_id']}'"
-
-    # 2. Live API Search
-    guild_id = os.getenv("DISCORD_GUILD_ID")
-    resp = await _discord_request("GET", f"/guilds/{guild_id}/members/search?query={search_term}")
-    if resp and resp.status_code == 200:
-        data = resp.json()
-        if data and len(data) > 0:
-            user = data[0].get('user', {})
-            return f"REAL_DATA_FOUND: username='{user.get('username')}' id='{user.get('id')}'"
+    # 1. Check Local Phonebook First (held in memory, re-read only when the map file changes)
+    found = discord_directory.find_agent(search_term)
+    if found:
+        uname, data = found
+        return f"REAL_DATA_FOUND: username='{uname}' id='{data['channel_id']}'"
+
+    # 2. Live API Search (results memoized per term)
+    cached, user = discord_directory.member(search_term)
+    if not cached:
+        guild_id = os.getenv("DISCORD_GUILD_ID")
+        resp = await _discord_request("GET", f"/guilds/{guild_id}/members/search?query={search_term}")
+        if resp and resp.status_code == 200:
+            data = resp.json()
+            user = data[0].get('user', {}) if data else None
+            discord_directory.put_member(search_term, user)
+    if user:
+        return f"REAL_DATA_FOUND: username='{user.get('username')}' id='{user.get('id')}'"
             
     return f"❌ [NOT_FOUND]: Specialist '{search_term}' is not mapped in the lattice."
 
 @tool("mm_join_channel")
 async def mm_join_channel(channel_name: str):
     """Presence Verification: Confirms an agent is physically connected to the sector channel."""
-    guild_id = os.getenv("DISCORD_GUILD_ID")
-    resp = await _discord_request("GET", f"/guilds/{guild_id}/channels")
-    if resp and resp.status_code == 200:
-        target = next((c for c in resp.json() if c['name'] == channel_name.lower().replace("#","")), None)
-        if target: return f"✅ [STABILIZED]: Agent presence confirmed in #{channel_name}."
+    if await discord_directory.channel_id(channel_name):
+        return f"✅ [STABILIZED]: Agent presence confirmed in #{channel_name}."
     return f"❌ [FAULT]: Channel #{channel_name} not found in Guild."
 
 @tool("mm_create_channel")
@@ -136,7 +156,10 @@ async def mm_create_channel(name: str, display_name: str, purpose: str = ""):
     guild_id = os.getenv("DISCORD_GUILD_ID")
     payload = {"name": name.lower().replace(" ", "-"), "type": 0, "topic": purpose}
     resp = await _discord_request("POST", f"/guilds/{guild_id}/channels", payload)
-    return f"[SUCCESS] Sector '#{name}' manifested in Discord lattice." if resp.status_code == 201 else "[ERROR] manifest failed."
+    if resp is None or resp.status_code != 201:
+        return "[ERROR] manifest failed."
+    discord_directory.put_channel(resp.json())  # Write-through: resolvable immediately, no refresh needed
+    return f"[SUCCESS] Sector '#{name}' manifested in Discord lattice."
 
 @tool("mm_add_user_to_team")
 async def mm_add_user_to_team(username: str):
@@ -151,14 +174,10 @@ async def mm_add_user_to_channel(channel_name: str, username_or_id: str):
 @tool("mm_get_channel_history")
 async def mm_get_channel_history(channel_name: str, limit: int = 15):
     """Context Retrieval: Reads previous mission logs from a Discord sector for intelligence gathering."""
-    guild_id = os.getenv("DISCORD_GUILD_ID")
-    resp_chans = await _discord_request("GET", f"/guilds/{guild_id}/channels")
-    if not resp_chans or resp_chans.status_code != 200: return "❌ [NET_FAULT]"
-    
-    target = next((c for c in resp_chans.json() if c['name'] == channel_name.lower().replace("#","")), None)
-    if not target: return f"❌ Sector {channel_name} not found."
+    target_id = await discord_directory.channel_id(channel_name)
+    if not target_id: return f"❌ Sector {channel_name} not found."
     
-    resp_msgs = await _discord_request("GET", f"/channels/{target['id']}/messages?limit={limit}")
+    resp_msgs = await _discord_request("GET", f"/channels/{target_id}/messages?limit={limit}")
     if resp_msgs and resp_msgs.status_code == 200:
         msgs = resp_msgs.json()
         history = "\n".join([f"[{m['author']['username']}]: {m['content']}" for m in reversed(msgs)])
@@ -168,39 +187,21 @@ async def mm_get_channel_history(channel_name: str, limit: int = 15):
 @tool("transmit_workforce_message")
 async def transmit_workforce_message(channel: str, message: str):
     """Sovereign Transmission: Sends a chunked report to a specific sector. Uses local map for zero-latency."""
-    map_path = Path("data/memory/discord_lattice_map.json")
-    channel_id = None
-    if map_path.exists():
-        with open(map_path, 'r') as f:
-            lattice = json.load(f)
-            channel_id = lattice.get("sectors", {}).get(channel.lower().replace("#", "").replace("_", "-"))
-
-    if not channel_id:
-        guild_id = os.getenv("DISCORD_GUILD_ID")
-        resp = await _discord_request("GET", f"/guilds/{guild_id}/channels")
-        if resp and resp.status_code == 200:
-            target = next((c for c in resp.json() if c['name'] in channel.lower()), None)
-            if target: channel_id = target['id']
-
+    channel_id = await discord_directory.channel_id(channel, fuzzy=True)
     if not channel_id: return f"❌ Sector {channel} not found."
     
-    chunks = _chunk_message(message)
-    for chunk in chunks:
-        await _discord_request("POST", f"/channels/{channel_id}/messages", {"content": chunk})
+    await discord_dispatcher.send_chunks(channel_id, _chunk_message(message))
     return f"[SUCCESS] Transmission delivered to Sector {channel}."
 
 @tool("get_sector_roster")
 async def get_sector_roster(department: str):
     """Personnel Sensor: Returns a Markdown table of specialists stationed in a specific department."""
     try:
-        with open(DATA_DIR / "roster.json", 'r', encoding='utf-8-sig') as f:
-            data = json.load(f)
-        roster = data.get("roster", [])
-        colleagues = [a for a in roster if department.lower() in a.get('dept', '').lower()]
+        # Columnar roster cache: dept slices held in memory, reloaded only when the cache file changes
+        colleagues = roster_cache.sector(department)
         if not colleagues: return f"❌ No specialists located in {department}."
         table = "| Specialist | Role | ID |\n|---|---|---|\n"
-        for c in colleagues:
-            table += f"| {c['name']} | {c['role']} | {c.get('id', 'UNK')} |\n"
+        table += "".join(f"| {c['name']} | {c['role']} | {c['id']} |\n" for c in colleagues)
         return f"### [SECTOR_ROSTER: {department}]\n{table}"
     except Exception as e: return f"[ERROR]: {str(e)}"
 
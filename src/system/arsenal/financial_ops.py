@@ -20,6 +20,7 @@ from reportlab.pdfgen import canvas  # type: ignore[import-untyped]
 
 from src.system.arsenal.foundation import *  # noqa: F403  # type: ignore[import-untyped]
 from src.system.arsenal.foundation import (  # type: ignore[import-untyped]
+    ToolResult,
     DATA_DIR,
     ROOT_DIR,
     STATIC_DIR,
@@ -29,43 +30,31 @@ from src.system.arsenal.foundation import (  # type: ignore[import-untyped]
     sanitize_windows_path,
     tool,
 )
+from src.system.market_data import market_data
+from src.system.indicators import indicator_book
 
 @tool('analyze_stock_technicals')
 async def analyze_stock_technicals(ticker: str):
     """Quantitative Sensor: Calculates RSI, SMA_50, SMA_200, and Volatility (ATR) for predictive market analysis."""
     try:
         ticker = ticker.upper().strip()
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period='1y')
+        hist = market_data.history(ticker, period='1y')
         
         if hist.empty or len(hist) < 200:
             return f'[ERROR] Insufficient data for {ticker}. Need at least 200 days of history.'
 
-        # Standard Moving Averages
-        hist['SMA_50'] = hist['Close'].rolling(window=50).mean()
-        hist['SMA_200'] = hist['Close'].rolling(window=200).mean()
-        
-        # RSI Calculation (Relative Strength Index)
-        delta = hist['Close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        hist['RSI'] = 100 - (100 / (1 + rs))
-        
-        # Volatility Sensor (Simple ATR heuristic)
-        hist['TR'] = hist[['High', 'Low', 'Close']].max(axis=1) - hist[['High', 'Low', 'Close']].min(axis=1)
-        atr = hist['TR'].rolling(window=14).mean().iloc[-1]
-
-        latest = hist.iloc[-1]
-        trend = '🚀 BULLISH' if latest['SMA_50'] > latest['SMA_200'] else '📉 BEARISH'
-        overbought = '⚠️ OVERBOUGHT' if latest['RSI'] > 70 else '💎 OVERSOLD' if latest['RSI'] < 30 else 'STABLE'
+        # Vectorized Wilder RSI/ATR + cumsum SMAs; only bars newer than the last call are folded in
+        latest = indicator_book.latest(ticker, hist)
+        atr = latest['atr']
+        trend = '🚀 BULLISH' if latest['sma_fast'] > latest['sma_slow'] else '📉 BEARISH'
+        overbought = '⚠️ OVERBOUGHT' if latest['rsi'] > 70 else '💎 OVERSOLD' if latest['rsi'] < 30 else 'STABLE'
 
         report = (
             f"### [QUANT_ANALYSIS]: {ticker}\n"
-            f"- **Market Price**: ${latest['Close']:.2f}\n"
+            f"- **Market Price**: ${latest['close']:.2f}\n"
             f"- **Trend Bias**: {trend}\n"
-            f"- **RSI (14)**: {latest['RSI']:.2f} ({overbought})\n"
-            f"- **SMA 50/200**: {latest['SMA_50']:.2f} / {latest['SMA_200']:.2f}\n"
+            f"- **RSI (14)**: {latest['rsi']:.2f} ({overbought})\n"
+            f"- **SMA 50/200**: {latest['sma_fast']:.2f} / {latest['sma_slow']:.2f}\n"
             f"- **Volatility (ATR)**: {atr:.2f}\n"
         )
         logger.info(f"📊 [FIN_INTEL]: Completed technical sweep for {ticker}")
@@ -97,8 +86,7 @@ async def convert_currency(amount: float, from_currency: str, to_currency: str):
     """Forex Sensor: Performs real-time currency conversion using global market rates."""
     try:
         pair = f'{from_currency.upper()}{to_currency.upper()}=X'
-        data = yf.Ticker(pair).info
-        rate = data.get('regularMarketPrice') or data.get('currentPrice')
+        rate = market_data.quote(pair)
         
         if not rate:
             return f'[ERROR] Exchange rate for {pair} is currently unreachable.'
@@ -179,7 +167,7 @@ async def generate_corporate_invoice(client_name: str, invoice_number: str, item
         
         c.save()
         logger.info(f"🧾 [BILLING]: Invoice manifested for {client_name}")
-        return f'[SUCCESS] [INVOICE_GENERATED]: {path}'
+        return ToolResult.success(f'[SUCCESS] [INVOICE_GENERATED]: {path}', artifacts=[path])
     except Exception as e:
         return f'[ERROR] PDF Generation Fault: {str(e)}'
 
@@ -209,7 +197,7 @@ async def generate_project_budget(project_name: str, resources: List[Dict]):
         path = DATA_DIR / 'finance' / 'budgets' / f'{sanitize_windows_path(project_name)}_budget.txt'
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(report, encoding='utf-8')
-        return f'[SUCCESS] [BUDGET_SAVED]: {path}'
+        return ToolResult.success(f'[SUCCESS] [BUDGET_SAVED]: {path}', artifacts=[path])
     except Exception as e:
         return f'[ERROR] Calculation Fault: {str(e)}'
 
@@ -219,8 +207,7 @@ async def get_crypto_price(symbol: str):
     try:
         symbol = symbol.upper().strip()
         ticker = f'{symbol}-USD'
-        data = yf.Ticker(ticker).info
-        price = data.get('currentPrice') or data.get('regularMarketPrice')
+        price = market_data.quote(ticker)
         
         if not price:
             return f'[ERROR] Price data for {symbol} is currently desynchronized.'
@@ -39,6 +39,7 @@ from reportlab.lib.pagesizes import letter
 from pptx import Presentation
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from src.system.arsenal.results import ToolResult
 
 # --- LOGGING SETUP ---
 logging.basicConfig(level=logging.INFO)
@@ -111,7 +112,7 @@ DEPARTMENT_TOOL_MAP = {
     "SOFTWARE_ENGINEERING": ["run_terminal_command", "validate_python_syntax", "scaffold_react_component", "scaffold_flask_api", "replace_text_in_file", "read_file", "write_file", "regex_replace_in_file", "minify_js_css", "extract_code_blocks"] + COMMS_CAPS + INTEL_CAPS,
     "FACILITY_MANAGEMENT": ["run_terminal_command", "get_system_vitals", "list_files", "get_directory_tree", "csv_processor_read", "csv_processor_write", "get_file_metadata"] + COMMS_CAPS,
     "CyberSecurity": ["scan_network_ports", "verify_ssl_certificate", "analyze_http_security_headers", "detect_pii_in_file", "scan_code_for_vulnerabilities", "ip_geolocation", "port_scan_local", "generate_strong_password", "detect_log_anomalies", "validate_jwt_structure", "analyze_contract_risk", "generate_security_policy"] + COMMS_CAPS,
-    "DataEngineering": ["sqlite_create_table_v2", "sqlite_query", "sqlite_insert", "sqlite_inspect_schema", "industrial_data_ingress", "csv_processor_read", "csv_processor_write", "convert_csv_to_markdown_table", "merge_csv_files"] + COMMS_CAPS,
+    "DataEngineering": ["sqlite_create_table_v2", "sqlite_query", "sqlite_insert", "sqlite_bulk_insert", "sqlite_inspect_schema", "industrial_data_ingress", "csv_processor_read", "csv_processor_write", "convert_csv_to_markdown_table", "merge_csv_files"] + COMMS_CAPS,
     "R&D": ["web_search_duckduckgo", "interact_web", "scrape_url_to_markdown", "search_memory", "semantic_code_search", "get_market_intelligence", "consolidate_memory_dream", "spawn_ephemeral_agent"] + COMMS_CAPS + INTEL_CAPS,
     "Finance": ["get_stock_history_csv", "analyze_stock_technicals", "calculate_burn_rate", "generate_project_budget", "generate_corporate_invoice", "csv_processor_read", "convert_currency", "get_crypto_price", "write_csv_report"] + COMMS_CAPS,
     "Legal": ["generate_nda_contract", "analyze_contract_risk", "generate_corporate_document", "generate_security_policy", "check_robots_txt", "validate_jwt_structure"] + COMMS_CAPS,
@@ -161,7 +162,7 @@ async def write_file(file_path: str, content: str):
         temp_path = target.with_suffix('.tmp')
         temp_path.write_text(content, encoding='utf-8')
         os.replace(temp_path, target)
-        return f'[SUCCESS] Physically committed to {target}'
+        return ToolResult.success(f'[SUCCESS] Physically committed to {target}', artifacts=[target])
     except Exception as e: 
         return f'[ERROR] Physical Write Fault: {str(e)}'
     
@@ -181,5 +182,5 @@ async def update_knowledge_graph(subject: str, relation: str, target: str):
         with open(graph_path, 'w', encoding='utf-8-sig') as f:
             json.dump(nx.node_link_data(G), f, indent=2)
             
-        return f'[SUCCESS] [LATTICE_UPDATED]: {subject} --[{relation}]--> {target}'
+        return ToolResult.success(f'[SUCCESS] [LATTICE_UPDATED]: {subject} --[{relation}]--> {target}', artifacts=[graph_path])
     except Exception as e: return f'[ERROR] Graph Write Fault: {str(e)}'
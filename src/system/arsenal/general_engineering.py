@@ -3,6 +3,7 @@ import os
 import asyncio
 import ast
 import base64
+import copy
 import hashlib
 import json
 import re
@@ -20,6 +21,7 @@ from reportlab.pdfgen import canvas  # type: ignore[import-untyped]
 
 from src.system.arsenal.foundation import *  # noqa: F403  # type: ignore[import-untyped]
 from src.system.arsenal.foundation import (  # type: ignore[import-untyped]
+    ToolResult,
     DATA_DIR,
     ROOT_DIR,
     STATIC_DIR,
@@ -29,6 +31,9 @@ from src.system.arsenal.foundation import (  # type: ignore[import-untyped]
     sanitize_windows_path,
     tool,
 )
+from src.system.agent_store import agent_store
+from src.system.market_data import market_data
+from src.system.csv_stream import Aggregator, iter_chunks
 from bs4 import BeautifulSoup
 import markdown
 import yaml
@@ -160,7 +165,7 @@ async def backup_memory_db():
         shutil.copytree(src, dst)
         
         logger.info(f"💎 [SNAPSHOT]: Memory state secured at {dst}")
-        return f'[SUCCESS] [BACKUP_COMMITTED]: {dst.name}'
+        return ToolResult.success(f'[SUCCESS] [BACKUP_COMMITTED]: {dst.name}', artifacts=[p for p in dst.rglob('*') if p.is_file()])
     except Exception as e:
         return f'[ERROR] Backup Fault: {str(e)}'
 
@@ -298,7 +303,7 @@ async def convert_json_to_yaml(json_path: str, yaml_out_path: str):
         with open(dst, 'w', encoding='utf-8-sig') as f:
             yaml.dump(data, f, sort_keys=False, allow_unicode=True)
             
-        return f'[SUCCESS] [CONVERT]: {src.name} ➔ {dst.name}'
+        return ToolResult.success(f'[SUCCESS] [CONVERT]: {src.name} ➔ {dst.name}', artifacts=[dst])
     except Exception as e:
         return f'[ERROR] Conversion Failed: {str(e)}'
 
@@ -338,7 +343,7 @@ async def convert_markdown_to_html(md_file_path: str, html_out_path: str):
         
         dst.parent.mkdir(parents=True, exist_ok=True)
         dst.write_text(full_html, encoding='utf-8')
-        return f'[SUCCESS] [DELIVERABLE_READY]: {dst}'
+        return ToolResult.success(f'[SUCCESS] [DELIVERABLE_READY]: {dst}', artifacts=[dst])
     except ImportError: return '[ERROR]: pip install markdown'
     except Exception as e: return f'[ERROR]: {str(e)}'
 
@@ -356,7 +361,7 @@ async def convert_yaml_to_json(yaml_path: str, json_out_path: str):
         with open(dst, 'w', encoding='utf-8-sig') as f:
             json.dump(data, f, indent=2)
             
-        return f'[SUCCESS] [CONVERT]: {src.name} ➔ {dst.name}'
+        return ToolResult.success(f'[SUCCESS] [CONVERT]: {src.name} ➔ {dst.name}', artifacts=[dst])
     except Exception as e: return f'[ERROR]: {str(e)}'
 
 @tool('count_tokens_estimate')
@@ -403,7 +408,7 @@ async def create_business_card_qr(name: str, email: str, phone: str, filename: s
         path = DATA_DIR / 'assets' / 'images' / f'{sanitize_windows_path(filename)}_vcard.png'
         path.parent.mkdir(parents=True, exist_ok=True)
         img.save(path)
-        return f'[SUCCESS] [VCARD_MANIFESTED]: {path}'
+        return ToolResult.success(f'[SUCCESS] [VCARD_MANIFESTED]: {path}', artifacts=[path])
     except Exception as e: return f'[ERROR]: {str(e)}'
 
 @tool('create_investor_deck')
@@ -432,7 +437,7 @@ async def create_investor_deck(topic: str, points: List[str]):
         path.parent.mkdir(parents=True, exist_ok=True)
         prs.save(path)
         logger.info(f"📊 [DECK_GEN]: Investors deck created for {topic}")
-        return f'[SUCCESS] [DECK_COMMITTED]: {path}'
+        return ToolResult.success(f'[SUCCESS] [DECK_COMMITTED]: {path}', artifacts=[path])
     except Exception as e: return f'[ERROR] PPTX Fault: {str(e)}'
 
 from src.system.arsenal.foundation import *
@@ -458,7 +463,7 @@ async def create_ticket(title: str, priority: str):
                 f.write(line)
                 
         logger.info(f"🎫 [TICKET_LOGGED]: {title} (Priority: {p_label})")
-        return f'[SUCCESS] [TICKET_LOCKED]: Logged in tasks.md'
+        return ToolResult.success(f'[SUCCESS] [TICKET_LOCKED]: Logged in tasks.md', artifacts=[task_file])
     except Exception as e:
         return f'[ERROR] Task Logging Fault: {str(e)}'
 
@@ -475,7 +480,7 @@ async def deduplicate_lines(file_path: str):
         
         path.write_text('\n'.join(unique), encoding='utf-8-sig')
         removed = len(lines) - len(unique)
-        return f'[SUCCESS] [CLEANED]: {removed} redundant lines purged from {path.name}.'
+        return ToolResult.success(f'[SUCCESS] [CLEANED]: {removed} redundant lines purged from {path.name}.', artifacts=[path])
     except Exception as e:
         return f'[ERROR] Deduplication Fault: {str(e)}'
 
@@ -599,25 +604,20 @@ async def dns_lookup_records(domain: str, record_type: str='A'):
 async def duplicate_agent(source_agent: str, new_name: str):
     """Sovereign Architect: Clones an existing agent's manifest into a new variant, preserving the v14.3 High-Fidelity Schema."""
     try:
-        # Physical path discovery
-        files = glob.glob(str(AGENT_DIR / "**" / "*.yaml"), recursive=True)
-        src_path = next((f for f in files if source_agent.lower() in Path(f).name.lower()), None)
-        
-        if not src_path: return '[ERROR]: Source manifest not found.'
-        
-        with open(src_path, 'r', encoding='utf-8-sig') as f:
-            dna = yaml.safe_load(f)
-            
+        # Indexed lookup (name / employee_id / filename) instead of globbing every sector
+        source = await asyncio.to_thread(agent_store.find, source_agent)
+        if not source: return '[ERROR]: Source manifest not found.'
+
+        dna = copy.deepcopy(source.dna)
+
         # DNA Modification
         dna['identity']['full_name'] = new_name
         dna['identity']['employee_id'] = f"AI-CLONE-{uuid.uuid4().hex[:4].upper()}"
         dna['identity']['created_at'] = datetime.now().isoformat()
         
         new_filename = f"{new_name.lower().replace(' ', '_')}.yaml"
-        dst_path = Path(src_path).parent / new_filename
-        
-        with open(dst_path, 'w', encoding='utf-8-sig') as f:
-            yaml.dump(dna, f, sort_keys=False, allow_unicode=True)
+        dst_path = Path(source.path).parent / new_filename
+        await asyncio.to_thread(agent_store.write, str(dst_path), dna)
             
         logger.info(f"🧬 [CLONING_SUCCESS]: {source_agent} ➔ {new_name}")
         return f'[SUCCESS] [AGENT_CLONED]: {new_name} instantiated in {dst_path.parent.name} sector.'
@@ -716,7 +716,7 @@ async def generate_corporate_document(doc_type: str, client_name: str, items: Li
             y -= 25
             
         c.save()
-        return f'[SUCCESS] [ARTIFACT_MANIFESTED]: {path}'
+        return ToolResult.success(f'[SUCCESS] [ARTIFACT_MANIFESTED]: {path}', artifacts=[path])
     except Exception as e:
         return f'[ERROR] PDF Generation Fault: {str(e)}'
 
@@ -748,7 +748,7 @@ async def generate_industrial_image(prompt: str, filename: str):
             path.write_bytes(data.content)
             
         logger.info(f"🎨 [IMAGE_GEN]: Visual artifact manifested at {path}")
-        return f'[SUCCESS] [VISUAL_ASSET]: Physically committed to {path}'
+        return ToolResult.success(f'[SUCCESS] [VISUAL_ASSET]: Physically committed to {path}', artifacts=[path])
     except Exception as e:
         return f'[ERROR] DALL-E Fault: {str(e)}'
 
@@ -925,7 +925,7 @@ async def generate_svg_badge(label: str, status: str, filename: str, color: str=
         </svg>'''
         
         path.write_text(svg, encoding='utf-8')
-        return f'[SUCCESS] [SVG_MANIFESTED]: {path}'
+        return ToolResult.success(f'[SUCCESS] [SVG_MANIFESTED]: {path}', artifacts=[path])
     except Exception as e: return f'[ERROR]: {str(e)}'
 
 @tool('generate_url_slug')
@@ -990,10 +990,10 @@ async def get_env_info():
 async def get_market_intelligence(ticker: str):
     """Financial Sensor: Retrieves real-time financial intelligence, market cap, and revenue for global corporations via yfinance."""
     try:
-        data = yf.Ticker(ticker.upper()).info
+        data = market_data.info(ticker)
         summary = {
             "name": data.get('longName'),
-            "price": data.get('currentPrice') or data.get('regularMarketPrice'),
+            "price": data.get('currentPrice') or data.get('regularMarketPrice') or market_data.quote(ticker),
             "marketCap": f"${data.get('marketCap', 0):,}",
             "revenue": f"${data.get('totalRevenue', 0):,}",
             "sector": data.get('sector')
@@ -1057,7 +1057,8 @@ async def inject_new_capability(tool_name: str, python_code: str, imports: str='
             f.write(f"\n\n# --- INJECTED_TOOL: {tool_name} ---\n{full_code}")
             
         logger.info(f"⚡ [FORGE_SUCCESS]: Injected {tool_name} into shattered arsenal.")
-        return f"[SUCCESS] [INJECTION_STABLE]: '{tool_name}' Manifested. Master Registry will re-index on next restart."
+        return ToolResult.success(f"[SUCCESS] [INJECTION_STABLE]: '{tool_name}' Manifested. Master Registry will re-index on next restart.",
+                                  artifacts=[shard_path, backup_path])
     except Exception as e:
         if backup_path.exists(): shutil.copy(backup_path, shard_path)
         return f'[ERROR] FORGE_FAILURE: {str(e)}. Shard restored.'
@@ -1066,10 +1067,9 @@ async def inject_new_capability(tool_name: str, python_code: str, imports: str='
 async def inspect_agent_manifest(agent_name: str):
     """Neural Sensor: Surgically reads the raw YAML DNA manifest of an agent from the sectors folder."""
     try:
-        files = glob.glob(str(Path("F:/RealmForge/data/agents") / "**" / "*.yaml"), recursive=True)
-        target = next((f for f in files if agent_name.lower() in Path(f).name.lower()), None)
+        target = await asyncio.to_thread(agent_store.find, agent_name)
         if not target: return '[ERROR] Agent DNA not found in sectors.'
-        return Path(target).read_text(encoding='utf-8-sig')
+        return Path(target.path).read_text(encoding='utf-8-sig')
     except Exception as e: return f'[ERROR]: {str(e)}'
 
 from src.system.arsenal.foundation import *
@@ -1167,7 +1167,7 @@ async def minify_js_css(file_path: str):
         
         target.write_text(minified.strip(), encoding='utf-8')
         reduction = (1 - (len(minified) / len(content))) * 100
-        return f'[SUCCESS] [MINIFIED]: {target.name} optimized. Reduction: {reduction:.1f}%'
+        return ToolResult.success(f'[SUCCESS] [MINIFIED]: {target.name} optimized. Reduction: {reduction:.1f}%', artifacts=[target])
     except Exception as e: return f'[ERROR]: {str(e)}'
 
 @tool('obfuscate_email_address')
@@ -1246,6 +1246,13 @@ async def repair_broken_json(broken_json_str: str):
     except:
         return '[ERROR] Physical logic repair failed. Input is structurally unsalvageable.'
 
+def _stamp(path: Path):
+    try:
+        st = path.stat()
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return None
+
 @tool('run_terminal_command')
 async def run_terminal_command(command: str, rationale: str):
     """Sovereign Command: Executes a shell command in a secure subprocess. Whitelisted for Python, Pip, Git, and File Ops. Maximum industrial caution required."""
@@ -1257,6 +1264,9 @@ async def run_terminal_command(command: str, rationale: str):
         
     try:
         logger.info(f"⚙️ [SHELL_EXEC]: {command} | Rationale: {rationale}")
+        # Files the command names, stamped before it runs; only the ones it creates or changes are artifacts
+        named = [p if p.is_absolute() else Path("F:/RealmForge") / p for p in map(Path, command.split()[1:])]
+        before = {p: _stamp(p) for p in named}
         proc = await asyncio.create_subprocess_shell(
             command, 
             stdout=asyncio.subprocess.PIPE, 
@@ -1266,7 +1276,8 @@ async def run_terminal_command(command: str, rationale: str):
         # 15 second industrial timeout
         stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=15.0)
         output = (stdout.decode() + stderr.decode()).strip()
-        return f'### [TERMINAL_OUTPUT]: {command}\n{output[:5000]}'
+        touched = [p for p, stamp in before.items() if p.is_file() and _stamp(p) != stamp]
+        return ToolResult.success(f'### [TERMINAL_OUTPUT]: {command}\n{output[:5000]}', artifacts=touched)
     except asyncio.TimeoutError:
         return '[ERROR] EXECUTION_TIMEOUT: Process terminated after 15s.'
     except Exception as e:
@@ -1295,18 +1306,15 @@ async def scaffold_industrial_project(project_name: str, description: str):
 async def self_evolve(agent_name: str, new_skill: str):
     """God Mode Logic: Augments an agent's physical YAML manifest with a new professional skill to ensure fleet scalability."""
     try:
-        files = glob.glob(str(Path("F:/RealmForge/data/agents") / "**" / "*.yaml"), recursive=True)
-        target = next((f for f in files if agent_name.lower() in Path(f).name.lower()), None)
+        target = await asyncio.to_thread(agent_store.find, agent_name)
         if not target: return '[ERROR] Agent DNA not reachable.'
         
-        with open(target, 'r', encoding='utf-8-sig') as f:
-            dna = yaml.safe_load(f) or {}
-            
+        dna = target.dna
         skills = dna.setdefault('professional', {}).setdefault('skills', [])
         if new_skill not in skills:
             skills.append(new_skill)
-            with open(target, 'w', encoding='utf-8-sig') as f:
-                yaml.dump(dna, f, sort_keys=False, allow_unicode=True)
+            # Atomic write-back: temp file + replace, index row updated in the same step
+            await asyncio.to_thread(agent_store.write, target.path, dna)
             return f"🧬 [EVOLUTION_SUCCESS]: {agent_name} has absorbed mastery in '{new_skill}'."
         return f"ℹ️ [STATE_MATCH]: {agent_name} already possesses '{new_skill}'."
     except Exception as e: return f'[ERROR] Evolution Fault: {str(e)}'
@@ -1385,7 +1393,7 @@ async def take_website_screenshot(url: str, filename: str):
             await page.screenshot(path=str(path))
             await browser.close()
             
-        return f'[SUCCESS] [SCREENSHOT_CAPTURED]: Saved to {path}'
+        return ToolResult.success(f'[SUCCESS] [SCREENSHOT_CAPTURED]: Saved to {path}', artifacts=[path])
     except Exception as e:
         return f'[ERROR] Capture Fault: {str(e)}'
 
@@ -1455,7 +1463,7 @@ async def update_knowledge_graph(subject: str, relation: str, target: str):
                 json.dump(nx.node_link_data(G), f, indent=2)
             os.replace(temp_path, graph_path)
             
-        return f'[SUCCESS] [LATTICE_UPDATED]: {subject} --[{relation}]--> {target}'
+        return ToolResult.success(f'[SUCCESS] [LATTICE_UPDATED]: {subject} --[{relation}]--> {target}', artifacts=[graph_path])
     except Exception as e:
         return f'[ERROR] Lattice Write Fault: {str(e)}'
 
@@ -1463,11 +1471,10 @@ async def update_knowledge_graph(subject: str, relation: str, target: str):
 async def validate_agent_alignment(agent_name: str):
     """Audit Logic: Physically verifies an agent's YAML DNA structure against the v14.3 high-fidelity schema."""
     try:
-        from src.system.arsenal.general_engineering import inspect_agent_manifest
-        content = await inspect_agent_manifest(agent_name)
-        if '[ERROR]' in content: return content
+        target = await asyncio.to_thread(agent_store.find, agent_name)
+        if not target: return '[ERROR] Agent DNA not found in sectors.'
         
-        data = yaml.safe_load(content)
+        data = target.dna
         checks = {
             "identity": "identity" in data,
             "professional": "professional" in data,
@@ -1488,13 +1495,22 @@ async def validate_email_list(csv_path: str):
         path = (DATA_DIR / csv_path.replace('data/', '').lstrip('/')).resolve()
         if not path.exists(): return '[ERROR] File not located.'
         
-        df = pd.read_csv(path)
-        email_col = next((col for col in df.columns if df[col].astype(str).str.contains('@').any()), None)
+        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+        # Streamed: every column's pattern hits are counted in one pass, and the email column is picked at
+        # the end exactly as before - the first column (in column order) holding an '@' anywhere in the file.
+        agg, columns, has_at, total = None, [], set(), 0
+        for chunk in iter_chunks(path, infer=False):
+            if agg is None:
+                columns = list(chunk.columns)
+                agg = Aggregator(match={col: pattern for col in columns})
+            total += len(chunk)
+            has_at.update(col for col in columns if col not in has_at and chunk[col].astype(str).str.contains('@', regex=False).any())
+            agg.feed(chunk)
+        email_col = next((col for col in columns if col in has_at), None)
         if not email_col: return '[ERROR]: No email signature column detected.'
         
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        valid_count = df[email_col].astype(str).str.match(pattern).sum()
-        return f"[SUCCESS] [DATA_AUDIT]: Found {valid_count}/{len(df)} valid formats in '{email_col}'."
+        valid_count = agg.matches[email_col]
+        return f"[SUCCESS] [DATA_AUDIT]: Found {valid_count}/{total} valid formats in '{email_col}'."
     except Exception as e:
         return f'[ERROR] Validation Fault: {str(e)}'
 
@@ -1558,11 +1574,10 @@ async def spawn_autonomous_agent(name: str, role: str, department: str, backstor
         }
         
         target_file = dept_path / f"{name.lower().replace(' ', '_')}.yaml"
-        with open(target_file, 'w', encoding='utf-8-sig') as f:
-            yaml.dump(dna, f, sort_keys=False, allow_unicode=True)
+        await asyncio.to_thread(agent_store.write, str(target_file), dna)
             
         logger.info(f"🧬 [DNA_MANIFEST]: Agent {name} created in {dept_key}")
-        return f"[SUCCESS] Agent {name} spawned with High-Fidelity DNA at {target_file.name}"
+        return ToolResult.success(f"[SUCCESS] Agent {name} spawned with High-Fidelity DNA at {target_file.name}", artifacts=[target_file])
     except Exception as e:
         return f"[ERROR] Spawning Failed: {str(e)}"
 
@@ -1589,7 +1604,7 @@ async def system_auto_heal(target_file: str):
             return f"[HEAL_FAILED]: Syntax error detected in {target_file}. Repair required."
 
         path.write_text(cleaned, encoding='utf-8-sig')
-        return f"[SUCCESS] {target_file} healed and aligned."
+        return ToolResult.success(f"[SUCCESS] {target_file} healed and aligned.", artifacts=[path])
     except Exception as e:
         return f"[ERROR] Healing Fault: {str(e)}"
 
@@ -1612,7 +1627,7 @@ async def assign_swarm_task(title: str, priority: str, department: str, task_des
             with open(task_file, "a", encoding="utf-8-sig") as f:
                 f.write(line)
         
-        return f"[SUCCESS] Task Assigned to {dept_label}."
+        return ToolResult.success(f"[SUCCESS] Task Assigned to {dept_label}.", artifacts=[task_file])
     except Exception as e:
         return f"[ERROR] Dispatch Fault: {str(e)}"
 
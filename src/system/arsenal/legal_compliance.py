@@ -20,6 +20,7 @@ from reportlab.pdfgen import canvas  # type: ignore[import-untyped]
 
 from src.system.arsenal.foundation import *  # noqa: F403  # type: ignore[import-untyped]
 from src.system.arsenal.foundation import (  # type: ignore[import-untyped]
+    ToolResult,
     DATA_DIR,
     ROOT_DIR,
     STATIC_DIR,
@@ -117,7 +118,7 @@ async def create_calendar_event_ics(summary: str, start_time: str, duration_hour
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text('\n'.join(ics_content), encoding='utf-8')
         
-        return f'[SUCCESS] [CALENDAR_EVENT]: Physical object manifested at {path}'
+        return ToolResult.success(f'[SUCCESS] [CALENDAR_EVENT]: Physical object manifested at {path}', artifacts=[path])
     except Exception as e:
         return f'[ERROR] Calendar Fault: {str(e)}'
 
@@ -159,6 +160,6 @@ ____________________             ____________________
         # Atomic Write
         path.write_text(content, encoding='utf-8')
         logger.info(f"⚖️ [CONTRACT]: Mutual NDA manifested for {party_b}.")
-        return f'[SUCCESS] [LEGAL_ARTIFACT]: NDA physically committed to {path}'
+        return ToolResult.success(f'[SUCCESS] [LEGAL_ARTIFACT]: NDA physically committed to {path}', artifacts=[path])
     except Exception as e:
         return f'[ERROR] Contract Generation Failed: {str(e)}'
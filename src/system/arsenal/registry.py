@@ -115,7 +115,8 @@ ALL_TOOLS_LIST = [
     search_memory, self_evolve, semantic_code_search, send_direct_notification, 
     send_discord_webhook, send_slack_webhook, simulate_conversation_turn, 
     simulate_phishing_email, spawn_autonomous_agent, spawn_ephemeral_agent, 
-    sqlite_create_table_v2, sqlite_insert, sqlite_inspect_schema, sqlite_query, 
+    sqlite_bulk_insert, sqlite_create_table_v2, sqlite_insert, 
+    sqlite_inspect_schema, sqlite_query, 
     strip_html_tags, summarize_text_simple, sync_repository, system_auto_heal, 
     take_website_screenshot, text_to_ascii_table, translate_text_simulation, 
     transmit_workforce_message, trigger_ingestion, unzip_file, 
@@ -126,6 +127,27 @@ ALL_TOOLS_LIST = [
     zip_directory
 ]
 
+# --- EXECUTION CLASS DECLARATIONS (consumed by src/system/tool_engine.py) ---
+from src.system.tool_engine import get_execution_class
+
+for _t in ALL_TOOLS_LIST:
+    _t.metadata = {**(_t.metadata or {}), "execution_class": get_execution_class(_t.name).value}
+
+# --- STRUCTURED RESULT EDGE (legacy string tools are adapted into ToolResult; artifacts are only ever declared) ---
+import functools
+from src.system.arsenal.results import ToolResult
+
+def _structured(coro):
+    @functools.wraps(coro)
+    async def _adapted(*args, **kwargs):
+        return ToolResult.adapt(await coro(*args, **kwargs))
+    _adapted.__realm_structured__ = True
+    return _adapted
+
+for _t in ALL_TOOLS_LIST:
+    if getattr(_t, "coroutine", None) and not getattr(_t.coroutine, "__realm_structured__", False):
+        _t.coroutine = _structured(_t.coroutine)
+
 # --- F:/RealmForge_PROD/src/system/arsenal/registry.py ---
 
 def get_tools_for_dept(dept_name: str, all_tools: list = None):
@@ -16,6 +16,7 @@ import pandas as pd  # type: ignore[import-untyped]
 
 from src.system.arsenal.foundation import *  # noqa: F403  # type: ignore[import-untyped]
 from src.system.arsenal.foundation import (  # type: ignore[import-untyped]
+    ToolResult,
     DATA_DIR,
     ROOT_DIR,
     STATIC_DIR,
@@ -59,7 +60,7 @@ async def format_newsletter_html(headline: str, articles_json: str):
         path = DATA_DIR / 'marketing' / f"intel_report_{int(time.time())}.html"
         os.makedirs(path.parent, exist_ok=True)
         path.write_text(full_html, encoding='utf-8')
-        return f'💎 [INTEL_REPORT_GENERATED]: Physically committed to {path}'
+        return ToolResult.success(f'💎 [INTEL_REPORT_GENERATED]: Physically committed to {path}', artifacts=[path])
     except Exception as e:
         return f'[ERROR] HTML Generation Failed: {str(e)}'
 
@@ -0,0 +1,72 @@
+"""
+REALM FORGE: STRUCTURED TOOL RESULTS v1.0
+ARCHITECT: LEAD SWARM ENGINEER (MASTERMIND v31.4)
+STATUS: PRODUCTION READY - TYPED STATUS/PAYLOAD/ARTIFACTS - LEGACY TEXT ADAPTER
+PATH: F:/RealmForge_PROD/src/system/arsenal/results.py
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+import json
+
+# Head-of-string prefixes the legacy arsenal uses to report a fault without raising.
+LEGACY_FAILURE_MARKERS = (
+    "[ERROR", "ERROR", "[HTTP_ERROR]", "[SECURITY_BLOCK]", "[SECURITY_ALERT]",
+    "❌", "âŒ", "⚠️ [SEARCH_THROTTLED]",
+)
+
+# Subset of failures that say "try again later" (remote throttling / HTTP faults) rather than "bad input".
+LEGACY_TRANSIENT_MARKERS = ("[HTTP_ERROR]", "⚠️ [SEARCH_THROTTLED]")
+
+@dataclass
+class ToolResult:
+    """Uniform tool outcome. `artifacts` lists files the tool physically produced or modified."""
+    status: str = "SUCCESS"  # "SUCCESS" | "ERROR"
+    payload: Any = None
+    artifacts: List[str] = field(default_factory=list)
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    text: Optional[str] = None
+    transient: bool = False  # ERROR caused by the environment (timeouts, throttling), not by the call's inputs
+
+    # --- CONSTRUCTORS ---
+
+    @classmethod
+    def success(cls, text: str, payload: Any = None, artifacts: Iterable[Any] = (), **metrics) -> "ToolResult":
+        return cls("SUCCESS", payload, [str(a).replace("\\", "/") for a in artifacts], metrics, text)
+
+    @classmethod
+    def failure(cls, text: str, payload: Any = None, transient: bool = False, **metrics) -> "ToolResult":
+        return cls("ERROR", payload, [], metrics, text, transient)
+
+    @classmethod
+    def adapt(cls, raw: Any) -> "ToolResult":
+        """
+        Compatibility adapter: wraps a legacy string (or any value) returned by an unconverted tool.
+        Never reports artifacts - a tool that writes files declares them via `success(..., artifacts=...)`.
+        """
+        if isinstance(raw, cls):
+            return raw
+        text = raw if isinstance(raw, str) else (json.dumps(raw, default=str) if isinstance(raw, (dict, list)) else str(raw))
+        head = text[:80].lstrip()
+        transient = head.startswith(LEGACY_TRANSIENT_MARKERS) or "Throttled" in head
+        failed = transient or head.startswith(LEGACY_FAILURE_MARKERS)
+        return cls("ERROR" if failed else "SUCCESS", raw, [], {}, text, transient)
+
+    # --- RENDERING (LLM / HUD FACING) ---
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "SUCCESS"
+
+    def render(self, limit: Optional[int] = None) -> str:
+        """Text view for ToolMessages; optional hard cap for context-window hygiene."""
+        out = self.text if self.text is not None else (
+            json.dumps(self.payload, indent=2, default=str) if isinstance(self.payload, (dict, list)) else str(self.payload)
+        )
+        return out if limit is None or len(out) <= limit else out[:limit] + f"\n...[TRUNCATED {len(out) - limit} chars]"
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def __contains__(self, item: str) -> bool:
+        # Keeps legacy `"[ERROR]" in result` call sites working
+        return item in self.render()
@@ -15,6 +15,7 @@ import pandas as pd  # type: ignore[import-untyped]
 
 from src.system.arsenal.foundation import *  # noqa: F403  # type: ignore[import-untyped]
 from src.system.arsenal.foundation import (  # type: ignore[import-untyped]
+    ToolResult,
     DATA_DIR,
     ROOT_DIR,
     STATIC_DIR,
@@ -23,6 +24,7 @@ from src.system.arsenal.foundation import (  # type: ignore[import-untyped]
     sanitize_windows_path,
     tool,
 )  # explicit for static analysis
+from src.system.csv_stream import concat_csv
 
 @tool('append_to_file')
 async def append_to_file(file_path: str, content: str):
@@ -36,7 +38,7 @@ async def append_to_file(file_path: str, content: str):
             with open(target, 'a', encoding='utf-8') as f:
                 f.write('\n' + content)
         logger.info(f"ðŸ“ [IO_APPEND]: Success at {target}")
-        return f'[SUCCESS] [APPENDED]: {target}'
+        return ToolResult.success(f'[SUCCESS] [APPENDED]: {target}', artifacts=[target])
     except Exception as e:
         return f'[ERROR] [FAIL]: {str(e)}'
 
@@ -85,7 +87,8 @@ async def calculate_file_hash(file_path: str):
         with open(target, 'rb') as f:
             for byte_block in iter(lambda: f.read(8192), b''):
                 sha256_hash.update(byte_block)
-        return f'ðŸ”‘ [SHA256]: {sha256_hash.hexdigest()}'
+        digest = sha256_hash.hexdigest()
+        return ToolResult.success(f'ðŸ”‘ [SHA256]: {digest}', payload={'sha256': digest, 'path': str(target).replace('\\', '/')})
     except Exception as e: return f'[ERROR]: {str(e)}'
 
 @tool('copy_internal_file')
@@ -97,7 +100,7 @@ async def copy_internal_file(source_path: str, destination_path: str):
         if not src.exists(): return '[ERROR] Source missing.'
         os.makedirs(dst.parent, exist_ok=True)
         shutil.copy2(str(src), str(dst))
-        return f'[SUCCESS] Replicated to {dst}'
+        return ToolResult.success(f'[SUCCESS] Replicated to {dst}', artifacts=[dst])
     except Exception as e: return f'[ERROR]: {str(e)}'
 
 @tool('create_qr_code')
@@ -109,7 +112,7 @@ async def create_qr_code(data: str, filename: str):
         path = DATA_DIR / 'assets/images' / f'{sanitize_windows_path(filename)}.png'
         os.makedirs(path.parent, exist_ok=True)
         img.save(path)
-        return f'[SUCCESS] QR Manifested at {path}'
+        return ToolResult.success(f'[SUCCESS] QR Manifested at {path}', artifacts=[path])
     except ImportError: return '[ERROR]: pip install qrcode[pil]'
 
 @tool('delete_workspace_file')
@@ -150,7 +153,7 @@ async def download_file(url: str, save_path: str):
             if resp.status_code == 200:
                 os.makedirs(target.parent, exist_ok=True)
                 target.write_bytes(resp.content)
-                return f'[SUCCESS]: Ingested {len(resp.content)} bytes to {target}'
+                return ToolResult.success(f'[SUCCESS]: Ingested {len(resp.content)} bytes to {target}', artifacts=[target])
             return f'[HTTP_ERROR]: {resp.status_code}'
     except Exception as e: return f'[ERROR]: {str(e)}'
 
@@ -173,7 +176,7 @@ async def generate_dockerfile(tech_stack: str, port: int=8000):
     content = templates.get(tech_stack.lower(), templates['python'])
     path = DATA_DIR / 'docs' / 'Dockerfile'
     path.write_text(content, encoding='utf-8')
-    return f'âœ… Dockerfile generated for {tech_stack} in data/docs/'
+    return ToolResult.success(f'âœ… Dockerfile generated for {tech_stack} in data/docs/', artifacts=[path])
 
 @tool('generate_persona_profile')
 async def generate_persona_profile(role_type: str='corporate'):
@@ -243,10 +246,9 @@ async def merge_csv_files(file1: str, file2: str, output_file: str):
     try:
         p1 = DATA_DIR / file1.replace('data/', '').lstrip('/')
         p2 = DATA_DIR / file2.replace('data/', '').lstrip('/')
-        df = pd.concat([pd.read_csv(p1), pd.read_csv(p2)])
         out = DATA_DIR / output_file.replace('data/', '').lstrip('/')
-        df.to_csv(out, index=False)
-        return f'[SUCCESS] {len(df)} rows consolidated into {output_file}'
+        rows = concat_csv([p1, p2], out)  # Chunked: neither input is ever fully in memory
+        return ToolResult.success(f'[SUCCESS] {rows} rows consolidated into {output_file}', artifacts=[out])
     except Exception as e: return f'[ERROR]: {str(e)}'
 
 @tool('move_internal_file')
@@ -257,7 +259,7 @@ async def move_internal_file(source_path: str, destination_path: str):
         dst = DATA_DIR / destination_path.replace('data/', '').lstrip('/')
         os.makedirs(dst.parent, exist_ok=True)
         shutil.move(str(src), str(dst))
-        return f'[SUCCESS] Moved {source_path} -> {destination_path}'
+        return ToolResult.success(f'[SUCCESS] Moved {source_path} -> {destination_path}', artifacts=[dst])
     except Exception as e: return f'[ERROR]: {str(e)}'
 
 @tool('parse_log_file')
@@ -316,7 +318,7 @@ async def scaffold_flask_api(app_name: str):
     path = DATA_DIR / 'projects' / app_name / 'app.py'
     os.makedirs(path.parent, exist_ok=True)
     path.write_text(content, encoding='utf-8')
-    return f'ðŸš€ Flask API scaffolded at {path}'
+    return ToolResult.success(f'ðŸš€ Flask API scaffolded at {path}', artifacts=[path])
 
 @tool('scaffold_react_component')
 async def scaffold_react_component(name: str):
@@ -325,7 +327,7 @@ async def scaffold_react_component(name: str):
     path = DATA_DIR / 'projects' / 'ui' / f'{name}.tsx'
     os.makedirs(path.parent, exist_ok=True)
     path.write_text(content, encoding='utf-8')
-    return f'âœ¨ React Bento-Component manifested at {path}'
+    return ToolResult.success(f'âœ¨ React Bento-Component manifested at {path}', artifacts=[path])
 
 @tool('scan_code_for_vulnerabilities')
 async def scan_code_for_vulnerabilities(file_path: str):
@@ -377,5 +379,5 @@ async def write_file(file_path: str, content: str):
         temp_path = target.with_suffix('.tmp')
         temp_path.write_text(content, encoding='utf-8')
         os.replace(temp_path, target)
-        return f'[SUCCESS] Physically committed to {target}'
+        return ToolResult.success(f'[SUCCESS] Physically committed to {target}', artifacts=[target])
     except Exception as e: return f'[ERROR]: {str(e)}'
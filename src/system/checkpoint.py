@@ -0,0 +1,253 @@
+"""
+REALM FORGE: MISSION JOURNAL v1.0
+ARCHITECT: LEAD SWARM ENGINEER (MASTERMIND v31.4)
+STATUS: PRODUCTION READY - SQLITE WAL - PER-NODE STATE DIFFS - CRASH RESUME - BACKGROUND GC
+PATH: F:/RealmForge_PROD/src/system/checkpoint.py
+"""
+
+import os
+import time
+import zlib
+import pickle
+import sqlite3
+import asyncio
+import logging
+import threading
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, get_type_hints
+
+logger = logging.getLogger("MissionJournal")
+
+JOURNAL_PATH = Path(os.getenv("REALM_JOURNAL_PATH", "F:/RealmForge/data/memory/mission_journal.db"))
+END_NODE = "__end__"
+
+# ==============================================================================
+# 0. DIFF CODEC & REDUCER REPLAY
+# ==============================================================================
+
+def _pack(obj: Any) -> bytes:
+    return zlib.compress(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL), 3)
+
+def _unpack(blob: bytes) -> Any:
+    return pickle.loads(zlib.decompress(blob))
+
+def reducers_for(schema) -> Dict[str, Callable]:
+    """Pulls the Annotated reducers off a TypedDict state schema (keys without one are overwritten)."""
+    out = {}
+    for key, hint in get_type_hints(schema, include_extras=True).items():
+        meta = getattr(hint, "__metadata__", ())
+        if meta and callable(meta[0]):
+            out[key] = meta[0]
+    return out
+
+def apply_update(state: Dict[str, Any], update: Dict[str, Any], reducers: Dict[str, Callable]) -> Dict[str, Any]:
+    """Folds one node's partial update into the state exactly as the graph channels would."""
+    for key, value in (update or {}).items():
+        state[key] = reducers[key](state.get(key), value) if key in reducers else value
+    return state
+
+class MissionActiveError(RuntimeError):
+    """The mission is already streaming in this process; a second run would execute it twice."""
+
+# ==============================================================================
+# 1. THE JOURNAL
+# ==============================================================================
+
+class MissionJournal:
+    """
+    Crash-resumable mission log. Stores the initial state once and then only the partial
+    update each node returned, so a step costs one small row instead of a full snapshot.
+    """
+
+    def __init__(self, db_path: Path = JOURNAL_PATH, retention_s: float = None, gc_interval_s: float = None,
+                 failed_retention_s: float = None):
+        self.db_path = Path(db_path)
+        self.retention_s = retention_s or float(os.getenv("REALM_JOURNAL_RETENTION_S", "3600"))
+        # FAILED missions stay resumable for longer, but not forever
+        self.failed_retention_s = failed_retention_s or float(os.getenv("REALM_JOURNAL_FAILED_RETENTION_S", "86400"))
+        self.gc_interval_s = gc_interval_s or float(os.getenv("REALM_JOURNAL_GC_INTERVAL_S", "600"))
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._gc_task: Optional[asyncio.Task] = None
+        self._active: set = set()  # Missions streaming in this process (checked and claimed without an await in between)
+
+    # --- STORAGE ---
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(self.db_path.parent, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")  # WAL + NORMAL: durable across process crashes
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS missions (
+                    mission_id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    initial_state BLOB NOT NULL,
+                    last_node TEXT,
+                    steps INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS steps (
+                    mission_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    node TEXT NOT NULL,
+                    diff BLOB NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (mission_id, seq)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS idx_missions_status ON missions(status, updated_at);
+            """)
+            self._conn = conn
+        return self._conn
+
+    def _begin(self, mission_id: str, state: Dict[str, Any]):
+        now = time.time()
+        with self._lock:
+            self._db().execute(
+                "INSERT OR REPLACE INTO missions (mission_id, status, initial_state, last_node, steps, created_at, updated_at) "
+                "VALUES (?, 'RUNNING', ?, NULL, 0, ?, ?)",
+                (mission_id, _pack(state), now, now),
+            )
+
+    def _append(self, mission_id: str, node: str, update: Dict[str, Any]):
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                seq = db.execute("SELECT steps FROM missions WHERE mission_id = ?", (mission_id,)).fetchone()[0]
+                db.execute("INSERT INTO steps VALUES (?, ?, ?, ?, ?)", (mission_id, seq, node, _pack(update), now))
+                db.execute("UPDATE missions SET steps = ?, last_node = ?, updated_at = ? WHERE mission_id = ?", (seq + 1, node, now, mission_id))
+                db.execute("COMMIT")
+            except Exception:
+                db.execute("ROLLBACK")
+                raise
+
+    def _mark(self, mission_id: str, status: str):
+        with self._lock:
+            self._db().execute("UPDATE missions SET status = ?, updated_at = ? WHERE mission_id = ?", (status, time.time(), mission_id))
+
+    def _load(self, mission_id: str):
+        with self._lock:
+            db = self._db()
+            head = db.execute("SELECT status, initial_state, last_node FROM missions WHERE mission_id = ?", (mission_id,)).fetchone()
+            if not head: return None, []
+            steps = db.execute("SELECT node, diff FROM steps WHERE mission_id = ? ORDER BY seq", (mission_id,)).fetchall()
+        return head, steps
+
+    # --- RECORDING ---
+
+    async def stream(self, graph, state: Dict[str, Any], resume: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Drop-in for graph.astream(state): yields the same {node: update} chunks, journaling each one."""
+        mid = state.get("mission_id")
+        if mid in self._active:
+            raise MissionActiveError(f"Mission {mid} is already running.")
+        self._active.add(mid)
+        try:
+            if not resume:
+                await asyncio.to_thread(self._begin, mid, state)
+            try:
+                async for output in graph.astream(state):
+                    for node_name, update in output.items():
+                        if node_name == END_NODE or not isinstance(update, dict): continue
+                        try:
+                            await asyncio.to_thread(self._append, mid, node_name, update)
+                        except Exception as e:
+                            logger.warning(f"⚠️ [JOURNAL]: Step {node_name} of {mid} not persisted: {e}")
+                    yield output
+            except BaseException:
+                await asyncio.to_thread(self._mark, mid, "FAILED")
+                raise
+            await asyncio.to_thread(self._mark, mid, "COMPLETE")
+        finally:
+            self._active.discard(mid)
+
+    async def run(self, graph, state: Dict[str, Any], schema, resume: bool = False) -> Dict[str, Any]:
+        """Drop-in for graph.ainvoke(state) that journals every node and returns the folded final state."""
+        reducers = reducers_for(schema)
+        final = dict(state)
+        async for output in self.stream(graph, state, resume=resume):
+            for node_name, update in output.items():
+                if isinstance(update, dict): apply_update(final, update, reducers)
+        return final
+
+    # --- RESUME ---
+
+    async def resume_state(self, mission_id: str, schema, successor: Callable[[str, Dict[str, Any]], str]) -> Optional[Dict[str, Any]]:
+        """
+        Rebuilds the mission state by replaying journaled diffs through the schema reducers and
+        stamps `resume_from` with the node after the last completed one. None if nothing to resume.
+        """
+        head, steps = await asyncio.to_thread(self._load, mission_id)
+        if head is None or head[0] == "COMPLETE":
+            return None
+        state = _unpack(head[1])
+        reducers = reducers_for(schema)
+        for _, blob in steps:
+            apply_update(state, _unpack(blob), reducers)
+
+        entry = successor(head[2], state) if head[2] else "supervisor"
+        if entry in (None, END_NODE):
+            await asyncio.to_thread(self._mark, mission_id, "COMPLETE")
+            return None
+        state["resume_from"] = entry
+        logger.info(f"♻️ [JOURNAL]: {mission_id} rebuilt from {len(steps)} steps. Resuming at {entry}.")
+        return state
+
+    def is_active(self, mission_id: str) -> bool:
+        return mission_id in self._active
+
+    def list_resumable(self) -> List[Dict[str, Any]]:
+        """Unfinished missions, minus the ones this process is running right now."""
+        with self._lock:
+            rows = self._db().execute(
+                "SELECT mission_id, status, last_node, steps, updated_at FROM missions WHERE status != 'COMPLETE' ORDER BY updated_at DESC"
+            ).fetchall()
+        return [{"mission_id": r[0], "status": r[1], "last_node": r[2], "steps": r[3], "updated_at": r[4]}
+                for r in rows if r[0] not in self._active]
+
+    # --- GARBAGE COLLECTION ---
+
+    def collect_garbage(self) -> int:
+        """Drops COMPLETE (and, on a longer clock, FAILED) missions past retention and folds the WAL back."""
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            done = [r[0] for r in db.execute(
+                "SELECT mission_id FROM missions WHERE (status = 'COMPLETE' AND updated_at < ?) OR (status = 'FAILED' AND updated_at < ?)",
+                (now - self.retention_s, now - self.failed_retention_s),
+            ) if r[0] not in self._active]
+            if done:
+                db.execute("BEGIN IMMEDIATE")
+                db.executemany("DELETE FROM steps WHERE mission_id = ?", [(m,) for m in done])
+                db.executemany("DELETE FROM missions WHERE mission_id = ?", [(m,) for m in done])
+                db.execute("COMMIT")
+            db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return len(done)
+
+    async def _gc_loop(self):
+        while True:
+            await asyncio.sleep(self.gc_interval_s)
+            try:
+                purged = await asyncio.to_thread(self.collect_garbage)
+                if purged: logger.info(f"🧹 [JOURNAL_GC]: {purged} finished missions purged.")
+            except Exception as e:
+                logger.warning(f"⚠️ [JOURNAL_GC]: {e}")
+
+    def start_gc(self):
+        if self._gc_task is None or self._gc_task.done():
+            self._gc_task = asyncio.create_task(self._gc_loop())
+
+    async def stop(self):
+        if self._gc_task:
+            self._gc_task.cancel()
+            self._gc_task = None
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+# --- GLOBAL INSTANCE ---
+mission_journal = MissionJournal()
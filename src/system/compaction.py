@@ -0,0 +1,136 @@
+"""
+REALM FORGE: STATE COMPACTION KERNEL v1.0
+ARCHITECT: LEAD SWARM ENGINEER (MASTERMIND v31.4)
+STATUS: PRODUCTION READY - SLIDING MESSAGE WINDOW - INTERNED STATIC METADATA - SPILLED TOOL OUTPUTS
+PATH: F:/RealmForge_PROD/src/system/compaction.py
+"""
+
+import os
+import uuid
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+# ==============================================================================
+# 0. BUDGETS
+# ==============================================================================
+
+MESSAGE_WINDOW = int(os.getenv("REALM_MESSAGE_WINDOW", "20"))              # Live messages kept verbatim
+DIGEST_BUDGET_CHARS = int(os.getenv("REALM_DIGEST_BUDGET_CHARS", "4000"))  # Cap on the summarized prefix
+DIGEST_LINE_CHARS = 160
+TOOL_OUTPUT_BUDGET_BYTES = int(os.getenv("REALM_TOOL_OUTPUT_BUDGET_BYTES", "4096"))
+SPILL_DIR = Path(os.getenv("REALM_SPILL_DIR", "F:/RealmForge/data/logs/tool_outputs"))
+
+DIGEST_NAME = "mission_digest"
+
+# ==============================================================================
+# 1. INTERNED STATIC METADATA
+# ==============================================================================
+
+_INTERNED: Dict[str, "FrozenDict"] = {}
+
+def _restore_frozen(name: Optional[str], items: Dict[str, Any]) -> "FrozenDict":
+    """Unpickle hook: interned payloads re-attach to the process-wide shared instance."""
+    if name and name in _INTERNED and dict(_INTERNED[name]) == items:
+        return _INTERNED[name]
+    return FrozenDict(items)
+
+class FrozenDict(dict):
+    """Immutable, hashable dict. Stays a dict so JSON broadcast and `{**d}` merges keep working."""
+    __slots__ = ("_intern_name",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._intern_name = None
+
+    def _blocked(self, *args, **kwargs):
+        raise TypeError("FrozenDict is immutable; merge into a new dict instead.")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _blocked
+    __ior__ = _blocked
+
+    def __hash__(self):
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self):
+        return (_restore_frozen, (self._intern_name, dict(self)))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+def intern(name: str, mapping: Dict[str, Any]) -> FrozenDict:
+    """Registers a shared immutable reference; every mission points at the same object."""
+    if name not in _INTERNED:
+        frozen = FrozenDict(mapping)
+        frozen._intern_name = name
+        _INTERNED[name] = frozen
+    return _INTERNED[name]
+
+# ==============================================================================
+# 2. SLIDING MESSAGE WINDOW (REDUCER)
+# ==============================================================================
+
+def _is_digest(msg: Any) -> bool:
+    return isinstance(msg, SystemMessage) and getattr(msg, "name", None) == DIGEST_NAME
+
+def _digest_line(msg: BaseMessage) -> str:
+    content = msg.content if isinstance(msg.content, str) else str(msg.content)
+    return f"{msg.type.upper()}: {' '.join(content.split())[:DIGEST_LINE_CHARS]}"
+
+def _fold(digest: Optional[SystemMessage], overflow: List[BaseMessage]) -> SystemMessage:
+    """Extractive rolling summary: one line per folded message, oldest lines dropped past the budget."""
+    prior = digest.content.split("\n")[1:] if digest else []
+    folded = (digest.additional_kwargs.get("folded", 0) if digest else 0) + len(overflow)
+    lines = prior + [_digest_line(m) for m in overflow]
+    while lines and sum(len(l) + 1 for l in lines) > DIGEST_BUDGET_CHARS:
+        lines.pop(0)
+    header = f"[MISSION_DIGEST]: {folded} earlier messages condensed."
+    return SystemMessage(content="\n".join([header] + lines), name=DIGEST_NAME, additional_kwargs={"folded": folded})
+
+def window_messages(existing: List[BaseMessage], new: List[BaseMessage]) -> List[BaseMessage]:
+    """
+    Append reducer with a bounded footprint: the opening directive stays pinned,
+    older turns fold into a single digest message, and the last MESSAGE_WINDOW turns stay verbatim.
+    """
+    if not isinstance(existing, list): existing = list(existing or [])
+    if isinstance(new, BaseMessage): new = [new]
+    merged = existing + list(new or [])
+    if len(merged) <= MESSAGE_WINDOW + 2:
+        return merged
+
+    anchor = [merged[0]] if isinstance(merged[0], HumanMessage) else []
+    digest = next((m for m in merged if _is_digest(m)), None)
+    body = [m for m in merged[len(anchor):] if not _is_digest(m)]
+    if len(body) <= MESSAGE_WINDOW:
+        return merged
+
+    overflow, live = body[:-MESSAGE_WINDOW], body[-MESSAGE_WINDOW:]
+    return anchor + [_fold(digest, overflow)] + live
+
+def total_messages(messages: List[BaseMessage]) -> int:
+    """Mission length including folded turns (the step guard must not be fooled by the window)."""
+    folded = next((m.additional_kwargs.get("folded", 0) for m in messages if _is_digest(m)), 0)
+    return len([m for m in messages if not _is_digest(m)]) + folded
+
+# ==============================================================================
+# 3. BYTE-BUDGETED TOOL OUTPUTS
+# ==============================================================================
+
+def spill_tool_output(text: str, mission_id: str, tool_name: str, budget_bytes: int = TOOL_OUTPUT_BUDGET_BYTES) -> str:
+    """Keeps ToolMessages within budget; oversized outputs go to disk and leave a pointer behind."""
+    raw = text.encode("utf-8")
+    if len(raw) <= budget_bytes:
+        return text
+    head = raw[:budget_bytes].decode("utf-8", errors="ignore")
+    try:
+        target = SPILL_DIR / (mission_id or "UNK") / f"{tool_name}_{uuid.uuid4().hex[:8]}.txt"
+        os.makedirs(target.parent, exist_ok=True)
+        target.write_bytes(raw)
+        pointer = str(target).replace("\\", "/")
+    except OSError as e:
+        pointer = f"(spill failed: {e})"
+    return f"{head}\n...[OUTPUT_SPILLED]: {len(raw)} bytes total. Full output: {pointer}"
@@ -0,0 +1,204 @@
+"""
+REALM FORGE: CSV PROFILER v1.0
+ARCHITECT: LEAD SWARM ENGINEER (MASTERMIND v31.4)
+STATUS: PRODUCTION READY - (PATH, SIZE, MTIME) SIDECAR CACHE - SINGLE STREAMED PASS - HYPERLOGLOG DISTINCTS
+PATH: F:/RealmForge_PROD/src/system/csv_profile.py
+"""
+
+import os
+import json
+import logging
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd  # type: ignore[import-untyped]
+
+from src.system.csv_stream import Aggregator, count_rows, iter_chunks
+from src.system.manifest_pipeline import atomic_write_text
+
+logger = logging.getLogger("CSVProfiler")
+
+PROFILE_SCHEMA = "csv_profile/v1"
+HLL_PRECISION = 12                                                   # 4096 registers, ~1.6% std error
+INLINE_MAX_BYTES = int(os.getenv("REALM_CSV_PROFILE_INLINE_MB", "128")) * 1024 * 1024  # Bigger files profile in the background
+
+# ==============================================================================
+# 0. HYPERLOGLOG
+# ==============================================================================
+
+class HyperLogLog:
+    """Vectorized HLL over pandas' 64-bit row hashes; registers merge with elementwise max."""
+
+    def __init__(self, p: int = HLL_PRECISION):
+        self.p = p
+        self.m = 1 << p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def add(self, values: pd.Series):
+        values = values.dropna()
+        if values.empty:
+            return
+        h = pd.util.hash_pandas_object(values, index=False).to_numpy(dtype=np.uint64)
+        idx = (h >> np.uint64(64 - self.p)).astype(np.int64)
+        rest = h & np.uint64((1 << (64 - self.p)) - 1)
+        bits = np.zeros(len(rest), dtype=np.int64)
+        nz = rest > 0
+        bits[nz] = np.floor(np.log2(rest[nz].astype(np.float64))).astype(np.int64) + 1
+        rank = ((64 - self.p) - bits + 1).astype(np.uint8)  # Leading zeros in the remaining bits + 1
+        np.maximum.at(self.registers, idx, rank)
+
+    def count(self) -> int:
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        est = alpha * m * m / float(np.sum(np.exp2(-self.registers.astype(np.float64))))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if est <= 2.5 * m and zeros:
+            est = m * np.log(m / zeros)  # Linear counting for small cardinalities
+        return int(round(est))
+
+# ==============================================================================
+# 1. ONE-PASS COLUMN PROFILE
+# ==============================================================================
+
+class ProfileAggregator(Aggregator):
+    """Aggregator + per-column HLL distincts and lexicographic min/max for text columns."""
+
+    def __init__(self):
+        super().__init__()
+        self.hll: Dict[str, HyperLogLog] = {}
+        self.dtypes: Dict[str, str] = {}
+        self.text_min: Dict[str, str] = {}
+        self.text_max: Dict[str, str] = {}
+
+    def feed(self, chunk: pd.DataFrame) -> "ProfileAggregator":
+        super().feed(chunk)
+        for col in chunk.columns:
+            s = chunk[col]
+            self.dtypes.setdefault(col, str(s.dtype))
+            self.hll.setdefault(col, HyperLogLog()).add(s)
+            if not pd.api.types.is_numeric_dtype(s.dtype):
+                text = s.dropna().astype(str)
+                if not text.empty:
+                    lo, hi = text.min(), text.max()
+                    self.text_min[col] = min(self.text_min.get(col, lo), lo)
+                    self.text_max[col] = max(self.text_max.get(col, hi), hi)
+        return self
+
+    def profile(self) -> Dict[str, Any]:
+        columns = {}
+        for col in self.columns:
+            lo = self.mins.get(col, self.text_min.get(col))
+            hi = self.maxs.get(col, self.text_max.get(col))
+            columns[col] = {
+                "dtype": self.dtypes.get(col),
+                "nulls": self.nulls.get(col, 0),
+                "min": lo.item() if isinstance(lo, np.generic) else lo,
+                "max": hi.item() if isinstance(hi, np.generic) else hi,
+                "distinct_approx": self.hll[col].count() if col in self.hll else 0,
+            }
+        return {"rows": self.rows, "columns": columns}
+
+# ==============================================================================
+# 2. SIDECAR CACHE
+# ==============================================================================
+
+def sidecar_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.profile.json")
+
+def _stamp(path: Path) -> Dict[str, int]:
+    st = path.stat()
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+class CSVProfiler:
+    """
+    Profiles live next to the CSV (`.<name>.profile.json`) keyed on (size, mtime): a preview of an
+    unchanged file is a sidecar read (memoized in-process), and a changed file is re-profiled once.
+    """
+
+    def __init__(self):
+        self._memo: Dict[str, Dict[str, Any]] = {}
+        self._running: Dict[str, Future] = {}
+        self._failed: Dict[str, Dict[str, int]] = {}   # path -> stamp of a version that cannot be profiled
+        self._lock = threading.Lock()
+
+    def cached(self, path: Path) -> Optional[Dict[str, Any]]:
+        path = Path(path)
+        stamp = _stamp(path)
+        hit = self._memo.get(str(path))
+        if hit and hit["stamp"] == stamp:
+            return hit
+        try:
+            with open(sidecar_path(path), "r", encoding="utf-8") as f:
+                hit = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if hit.get("schema") == PROFILE_SCHEMA and hit.get("stamp") == stamp:
+            self._memo[str(path)] = hit
+            return hit
+        return None
+
+    def compute(self, path: Path) -> Dict[str, Any]:
+        path = Path(path)
+        stamp = _stamp(path)
+        agg = ProfileAggregator()
+        for chunk in iter_chunks(path):
+            agg.feed(chunk)
+        profile = {"schema": PROFILE_SCHEMA, "stamp": stamp, **agg.profile()}
+        try:
+            atomic_write_text(sidecar_path(path), json.dumps(profile, default=str), encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"⚠️ [CSV_PROFILE]: Sidecar not written for {path.name}: {e}")
+        self._memo[str(path)] = profile
+        logger.info(f"📊 [CSV_PROFILE]: {path.name} profiled ({profile['rows']} rows, {len(profile['columns'])} columns).")
+        return profile
+
+    def _launch(self, path: Path) -> Future:
+        """Single-flight: one profiling pass per file at a time, whoever asks."""
+        with self._lock:
+            fut = self._running.get(str(path))
+            if fut is None:
+                fut = self._running[str(path)] = Future()
+                threading.Thread(target=self._background, args=(path, fut), name=f"csv-profile:{path.name}", daemon=True).start()
+            return fut
+
+    def _background(self, path: Path, fut: Future):
+        try:
+            stamp = _stamp(path)
+            fut.set_result(self.compute(path))
+            self._failed.pop(str(path), None)
+        except BaseException as e:
+            logger.warning(f"⚠️ [CSV_PROFILE]: {path.name} profile failed: {e}")
+            if isinstance(e, Exception) and "stamp" in locals():
+                self._failed[str(path)] = stamp  # Not retried until the file changes
+            fut.set_exception(e)
+        finally:
+            with self._lock:
+                self._running.pop(str(path), None)
+
+    def get(self, path: Path, inline_max: int = INLINE_MAX_BYTES) -> Dict[str, Any]:
+        """
+        Fresh profile if one exists or the file is small enough to wait for; otherwise the mmap row count now
+        and `"profile": "pending"` while a background pass fills the sidecar. Concurrent callers (including a
+        deadline retry whose first attempt is still running) share one pass instead of starting another.
+        A file the full pass cannot parse (a malformed row past the preview) reports `"profile": "unavailable"`,
+        remembered against its (size, mtime) so it is not re-parsed until it changes.
+        """
+        path = Path(path)
+        hit = self.cached(path)
+        if hit:
+            return hit
+        if self._failed.get(str(path)) == _stamp(path):
+            return {"rows": count_rows(path), "profile": "unavailable"}
+        fut = self._launch(path)
+        if path.stat().st_size <= inline_max:
+            try:
+                return fut.result()
+            except Exception:
+                return {"rows": count_rows(path), "profile": "unavailable"}
+        return {"rows": count_rows(path), "profile": "pending"}
+
+# --- GLOBAL INSTANCE ---
+csv_profiler = CSVProfiler()
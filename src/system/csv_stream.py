@@ -0,0 +1,184 @@
+"""
+REALM FORGE: STREAMING CSV ENGINE v1.0
+ARCHITECT: LEAD SWARM ENGINEER (MASTERMIND v31.4)
+STATUS: PRODUCTION READY - MMAP ROW COUNT - SAMPLED DTYPES - COLUMN PROJECTION - CONSTANT-MEMORY AGGREGATES
+PATH: F:/RealmForge_PROD/src/system/csv_stream.py
+"""
+
+import os
+import re
+import mmap
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd  # type: ignore[import-untyped]
+
+logger = logging.getLogger("CSVStream")
+
+CHUNK_ROWS = int(os.getenv("REALM_CSV_CHUNK_ROWS", "100000"))
+SAMPLE_ROWS = int(os.getenv("REALM_CSV_SAMPLE_ROWS", "10000"))
+SCAN_BLOCK = 16 * 1024 * 1024  # Bytes per mmap window when counting newlines (multiple of the allocation granularity)
+
+# ==============================================================================
+# 0. SHAPE (NO PARSING)
+# ==============================================================================
+
+def count_rows(path: Path, header: bool = True) -> int:
+    """
+    Data rows by newline scan over an mmap: no parsing, no Python per row. Exact unless quoted fields
+    embed newlines (then it counts physical lines; `Aggregator.rows` from a streamed pass is exact).
+    """
+    path = Path(path)
+    size = path.stat().st_size
+    if size == 0:
+        return 0
+    lines, last = 0, b""
+    with open(path, "rb") as f:
+        # One window mapped at a time, so resident pages stay bounded on multi-GB files
+        for offset in range(0, size, SCAN_BLOCK):
+            with mmap.mmap(f.fileno(), min(SCAN_BLOCK, size - offset), offset=offset, access=mmap.ACCESS_READ) as mm:
+                lines += mm[:].count(b"\n")
+                last = mm[-1:]
+    if last != b"\n":
+        lines += 1  # Last row without a trailing newline
+    return max(0, lines - (1 if header else 0))
+
+def read_columns(path: Path) -> List[str]:
+    return list(pd.read_csv(path, nrows=0).columns)
+
+def infer_dtypes(path: Path, usecols: Optional[Sequence[str]] = None, sample_rows: int = SAMPLE_ROWS) -> Dict[str, Any]:
+    """
+    dtypes from the head of the file so every chunk parses the same way (no per-chunk re-inference,
+    no mixed-type object columns). Numerics are pinned to float64, so later NaNs cannot break an int cast.
+    """
+    sample = pd.read_csv(path, nrows=sample_rows, usecols=usecols)
+    dtypes: Dict[str, Any] = {}
+    for col, dt in sample.dtypes.items():
+        if pd.api.types.is_bool_dtype(dt):
+            dtypes[col] = "boolean"
+        elif pd.api.types.is_numeric_dtype(dt):
+            dtypes[col] = "float64"
+        else:
+            dtypes[col] = "object"
+    return dtypes
+
+# ==============================================================================
+# 1. CHUNKED READER
+# ==============================================================================
+
+def iter_chunks(path: Path, chunksize: int = CHUNK_ROWS, usecols: Optional[Sequence[str]] = None,
+                dtypes: Optional[Dict[str, Any]] = None, infer: bool = True) -> Iterator[pd.DataFrame]:
+    """
+    Yields DataFrames of at most `chunksize` rows, projected to `usecols`. If a pinned dtype stops fitting
+    further down the file, the reader resumes after the rows already yielded with pandas' own inference.
+    """
+    path = Path(path)
+    if dtypes is None and infer:
+        dtypes = infer_dtypes(path, usecols=usecols)
+    done = 0
+    try:
+        with pd.read_csv(path, chunksize=chunksize, usecols=usecols, dtype=dtypes) as reader:
+            for chunk in reader:
+                done += len(chunk)
+                yield chunk
+        return
+    except (ValueError, TypeError) as e:
+        if not dtypes:
+            raise
+        logger.warning(f"⚠️ [CSV_STREAM]: {path.name} outgrew sampled dtypes after {done} rows ({e}); resuming untyped.")
+    # Callable, not range(): pandas turns a skiprows list-like into a set, which is O(rows) memory on big files
+    with pd.read_csv(path, chunksize=chunksize, usecols=usecols, skiprows=lambda i: 0 < i <= done) as reader:
+        yield from reader
+
+# ==============================================================================
+# 2. INCREMENTAL AGGREGATION
+# ==============================================================================
+
+class Aggregator:
+    """
+    Folds chunks into running totals: rows, per-column nulls, numeric sum/min/max, optional regex hit
+    counts and value counts. Memory is bounded by the number of columns (and distinct tracked values).
+    """
+
+    def __init__(self, match: Optional[Dict[str, str]] = None, value_counts: Sequence[str] = ()):
+        self.rows = 0
+        self.columns: List[str] = []
+        self.nulls: Dict[str, int] = {}
+        self.sums: Dict[str, float] = {}
+        self.mins: Dict[str, Any] = {}
+        self.maxs: Dict[str, Any] = {}
+        self.match = {col: re.compile(p) for col, p in (match or {}).items()}
+        self.matches: Dict[str, int] = {col: 0 for col in self.match}
+        self.value_counts: Dict[str, pd.Series] = {col: pd.Series(dtype="int64") for col in value_counts}
+
+    def feed(self, chunk: pd.DataFrame) -> "Aggregator":
+        if not self.columns:
+            self.columns = list(chunk.columns)
+        self.rows += len(chunk)
+        for col, n in chunk.isna().sum().items():
+            self.nulls[col] = self.nulls.get(col, 0) + int(n)
+        numeric = chunk.select_dtypes(include=[np.number])
+        if not numeric.empty:
+            for col, v in numeric.sum().items():
+                self.sums[col] = self.sums.get(col, 0.0) + float(v)
+            for col, v in numeric.min().items():
+                if pd.notna(v): self.mins[col] = v if col not in self.mins else min(self.mins[col], v)
+            for col, v in numeric.max().items():
+                if pd.notna(v): self.maxs[col] = v if col not in self.maxs else max(self.maxs[col], v)
+        for col, rx in self.match.items():
+            if col in chunk:
+                self.matches[col] += int(chunk[col].astype(str).str.match(rx).sum())
+        for col in self.value_counts:
+            if col in chunk:
+                self.value_counts[col] = self.value_counts[col].add(chunk[col].value_counts(), fill_value=0)
+        return self
+
+    def result(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"rows": self.rows, "columns": self.columns, "nulls": self.nulls}
+        if self.sums:
+            out["numeric"] = {c: {"sum": s, "mean": s / max(1, self.rows - self.nulls.get(c, 0)),
+                                  "min": self.mins.get(c), "max": self.maxs.get(c)} for c, s in self.sums.items()}
+        if self.match:
+            out["matches"] = self.matches
+        if self.value_counts:
+            out["value_counts"] = {c: {k: int(v) for k, v in s.sort_values(ascending=False).items()}
+                                   for c, s in self.value_counts.items()}
+        return out
+
+def aggregate(path: Path, usecols: Optional[Sequence[str]] = None, chunksize: int = CHUNK_ROWS, **aggregator_kwargs) -> Dict[str, Any]:
+    agg = Aggregator(**aggregator_kwargs)
+    for chunk in iter_chunks(path, chunksize=chunksize, usecols=usecols):
+        agg.feed(chunk)
+    return agg.result()
+
+# ==============================================================================
+# 3. STREAMED WRITES
+# ==============================================================================
+
+def concat_csv(sources: Sequence[Path], target: Path, chunksize: int = CHUNK_ROWS) -> int:
+    """
+    Streams `sources` into `target` with the column union in first-seen order (pd.concat's layout),
+    writing to a temp file that replaces `target` only when complete. Returns rows written.
+    """
+    target = Path(target)
+    columns: List[str] = []
+    for src in sources:
+        columns += [c for c in read_columns(src) if c not in columns]
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=str(target.parent), prefix=f".{target.stem}.", suffix=".tmp")
+    written = 0
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as out:
+            pd.DataFrame(columns=columns).to_csv(out, index=False)
+            for src in sources:
+                for chunk in iter_chunks(src, chunksize=chunksize, infer=False):
+                    chunk.reindex(columns=columns).to_csv(out, index=False, header=False)
+                    written += len(chunk)
+        os.replace(tmp, target)
+    except BaseException:
+        if os.path.exists(tmp): os.remove(tmp)
+        raise
+    return written
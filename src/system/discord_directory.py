@@ -0,0 +1,241 @@
+"""
+REALM FORGE: DISCORD DIRECTORY v1.0
+ARCHITECT: LEAD SWARM ENGINEER (MASTERMIND v31.4)
+STATUS: PRODUCTION READY - GUILD CHANNEL/USER HASH MAPS - TTL + BACKGROUND REFRESH - WRITE-THROUGH
+PATH: F:/RealmForge_PROD/src/system/discord_directory.py
+"""
+
+import os
+import time
+import json
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.system.manifest_pipeline import atomic_write_text
+
+logger = logging.getLogger("DiscordDirectory")
+
+LATTICE_MAP_PATH = Path(os.getenv("REALM_DISCORD_MAP", "data/memory/discord_lattice_map.json"))
+DIRECTORY_TTL_S = float(os.getenv("REALM_DISCORD_DIR_TTL_S", "300"))
+MISS_REFRESH_S = float(os.getenv("REALM_DISCORD_MISS_REFRESH_S", "30"))  # Min gap between miss-driven refreshes
+MEMBER_TTL_S = float(os.getenv("REALM_DISCORD_MEMBER_TTL_S", "600"))
+DM_CACHE_PATH = Path(os.getenv("REALM_DISCORD_DM_CACHE", "data/memory/discord_dm_channels.json"))
+
+ChannelFetcher = Callable[[], Awaitable[Optional[List[Dict[str, Any]]]]]
+
+def channel_key(name: str) -> str:
+    return (name or "").strip().lower().replace("#", "")
+
+# ==============================================================================
+# 1. THE DIRECTORY
+# ==============================================================================
+
+class DiscordDirectory:
+    """
+    name -> id maps for guild channels (REST, refreshed every TTL in the background) and for the local
+    lattice phonebook (discord_lattice_map.json, re-read only when its mtime changes). Stale entries are
+    served while a refresh runs; only a cold directory blocks on the guild fetch.
+    """
+
+    def __init__(self, map_path: Path = LATTICE_MAP_PATH, ttl_s: float = DIRECTORY_TTL_S, dm_path: Path = DM_CACHE_PATH):
+        self.map_path = Path(map_path)
+        self.dm_path = Path(dm_path)
+        self.ttl_s = ttl_s
+        self._fetch: Optional[ChannelFetcher] = None
+        self._channels: Dict[str, str] = {}           # channel name -> id
+        self._fuzzy: Dict[str, Optional[str]] = {}    # memoized legacy substring matches
+        self._fetched_at = 0.0
+        self._attempted_at = 0.0
+        self._refreshing: Optional[asyncio.Task] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop_task: Optional[asyncio.Task] = None
+        self._map_stamp: Optional[int] = None
+        self._sectors: Dict[str, str] = {}
+        self._agents: Dict[str, Dict[str, Any]] = {}
+        self._agent_keys: List[Tuple[str, str, str]] = []  # (uname_lc, functional_lc, uname)
+        self._members: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+        self._dms: Optional[Dict[str, str]] = None   # recipient id -> DM channel id (persisted)
+        self.stats = {"hits": 0, "misses": 0, "refreshes": 0}
+
+    def bind(self, fetch_channels: ChannelFetcher):
+        """The comms shard supplies the authenticated `GET /guilds/{id}/channels` call."""
+        self._fetch = fetch_channels
+
+    # --- LOCAL PHONEBOOK ---
+
+    def _phonebook(self):
+        try:
+            stamp = self.map_path.stat().st_mtime_ns
+        except OSError:
+            self._map_stamp, self._sectors, self._agents, self._agent_keys = None, {}, {}, []
+            return
+        if stamp == self._map_stamp:
+            return
+        try:
+            with open(self.map_path, "r", encoding="utf-8-sig") as f:
+                lattice = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ [DISCORD_DIR]: Phonebook unreadable: {e}")
+            return
+        self._sectors = {k.lower(): str(v) for k, v in (lattice.get("sectors") or {}).items()}
+        self._agents = lattice.get("agents") or {}
+        self._agent_keys = [(u.lower(), str(d.get("functional_name", "")).lower(), u) for u, d in self._agents.items()]
+        self._map_stamp = stamp
+
+    def find_agent(self, search_term: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Legacy phonebook rule: substring of the username or the functional name."""
+        self._phonebook()
+        term = (search_term or "").lower()
+        if term in self._agents:
+            return term, self._agents[term]
+        for uname_lc, func_lc, uname in self._agent_keys:
+            if term in uname_lc or term in func_lc:
+                return uname, self._agents[uname]
+        return None
+
+    # --- GUILD CHANNELS ---
+
+    def _stale(self) -> bool:
+        return time.monotonic() - self._fetched_at > self.ttl_s
+
+    def _install(self, channels: List[Dict[str, Any]]):
+        names: Dict[str, str] = {}
+        for c in channels:
+            if c.get("id"): names.setdefault(channel_key(c.get("name", "")), str(c["id"]))  # First wins, as before
+        self._channels = names
+        self._fuzzy = {}
+        self._fetched_at = time.monotonic()
+
+    async def refresh(self) -> bool:
+        """Single-flight guild fetch: concurrent callers await the same request."""
+        if self._fetch is None:
+            return False
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        started = self._fetched_at
+        async with self._lock:
+            if self._fetched_at != started:
+                return True  # Another caller refreshed while we waited
+            self._attempted_at = time.monotonic()
+            try:
+                channels = await self._fetch()
+            except Exception as e:
+                logger.warning(f"⚠️ [DISCORD_DIR]: Channel refresh failed: {e}")
+                return False
+            if channels is None:
+                return False
+            self._install(channels)
+            self.stats["refreshes"] += 1
+            return True
+
+    def _refresh_in_background(self):
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = asyncio.create_task(self.refresh())
+
+    async def _ensure(self):
+        if not self._fetched_at:
+            await self.refresh()
+        elif self._stale():
+            self._refresh_in_background()
+
+    async def channel_id(self, name: str, fuzzy: bool = False) -> Optional[str]:
+        """
+        Exact channel name (the lattice sector map first, then the guild). With `fuzzy`, falls back to the
+        first guild channel whose name is contained in `name` (transmit_workforce_message's legacy rule).
+        """
+        self._phonebook()
+        key = channel_key(name)
+        hit = self._sectors.get(key.replace("_", "-")) or self._sectors.get(key)
+        if hit:
+            self.stats["hits"] += 1
+            return hit
+        await self._ensure()
+        hit = self._channels.get(key) or (self._fuzzy_match(key) if fuzzy else None)
+        if hit is None and time.monotonic() - self._attempted_at > MISS_REFRESH_S and await self.refresh():
+            # Unknown name on an aging directory: the channel may be new, re-fetch once
+            hit = self._channels.get(key) or (self._fuzzy_match(key) if fuzzy else None)
+        self.stats["hits" if hit else "misses"] += 1
+        return hit
+
+    def _fuzzy_match(self, key: str) -> Optional[str]:
+        if key not in self._fuzzy:
+            self._fuzzy[key] = next((cid for cname, cid in self._channels.items() if cname and cname in key), None)
+        return self._fuzzy[key]
+
+    def put_channel(self, channel: Dict[str, Any]):
+        """Write-through for channels created by this node."""
+        if channel.get("id") and channel.get("name"):
+            self._channels[channel_key(channel["name"])] = str(channel["id"])
+            self._fuzzy = {}
+
+    # --- MEMBER SEARCH MEMO ---
+
+    def member(self, term: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        hit = self._members.get((term or "").lower())
+        if hit and time.monotonic() - hit[0] < MEMBER_TTL_S:
+            return True, hit[1]
+        return False, None
+
+    def put_member(self, term: str, user: Optional[Dict[str, Any]]):
+        self._members[(term or "").lower()] = (time.monotonic(), user)
+
+    # --- DM CHANNEL HANDLES ---
+
+    def _dm_table(self) -> Dict[str, str]:
+        if self._dms is None:
+            try:
+                with open(self.dm_path, "r", encoding="utf-8") as f:
+                    self._dms = {str(k): str(v) for k, v in json.load(f).items()}
+            except (OSError, ValueError):
+                self._dms = {}
+        return self._dms
+
+    def _save_dms(self):
+        try:
+            self.dm_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(self.dm_path, json.dumps(self._dm_table(), indent=2), encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"⚠️ [DISCORD_DIR]: DM cache not persisted: {e}")
+
+    def dm_channel(self, recipient_id: str) -> Optional[str]:
+        """DM channels are stable per recipient, so the handle survives restarts."""
+        return self._dm_table().get(str(recipient_id))
+
+    def put_dm(self, recipient_id: str, channel_id: str):
+        if self._dm_table().get(str(recipient_id)) != str(channel_id):
+            self._dms[str(recipient_id)] = str(channel_id)
+            self._save_dms()
+
+    def drop_dm(self, recipient_id: str):
+        if self._dm_table().pop(str(recipient_id), None) is not None:
+            self._save_dms()
+
+    # --- LIFECYCLE ---
+
+    async def _refresh_loop(self):
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.ttl_s)
+
+    def start(self):
+        """Keeps the guild map warm from the server loop so tool calls never wait on a fetch."""
+        if self._fetch is None or not os.getenv("DISCORD_BOT_TOKEN"):
+            return
+        if self._loop_task is None or self._loop_task.done():
+            self._loop_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        if self._loop_task:
+            self._loop_task.cancel()
+            self._loop_task = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        age = time.monotonic() - self._fetched_at if self._fetched_at else None
+        return {"channels": len(self._channels), "sectors": len(self._sectors), "agents": len(self._agents),
+                "dm_channels": len(self._dms or {}),
+                "age_s": round(age, 1) if age is not None else None, **self.stats}
+
+# --- GLOBAL INSTANCE ---
+discord_directory = DiscordDirectory()
@@ -0,0 +1,281 @@
+"""
+REALM FORGE: DISCORD DISPATCHER v1.0
+ARCHITECT: LEAD SWARM ENGINEER (MASTERMIND v31.4)
+STATUS: PRODUCTION READY - PER-ROUTE RATE-LIMIT BUCKETS - PROACTIVE PACING - PER-CHANNEL COALESCING
+PATH: F:/RealmForge_PROD/src/system/discord_dispatcher.py
+"""
+
+import os
+import time
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger("DiscordDispatcher")
+
+API_BASE = "https://discord.com/api/v10"
+MESSAGE_LIMIT = 2000          # Discord hard cap per message; coalesced batches stay under it
+MAX_ATTEMPTS = int(os.getenv("REALM_DISCORD_MAX_ATTEMPTS", "3"))
+REQUEST_TIMEOUT_S = float(os.getenv("REALM_DISCORD_TIMEOUT_S", "15"))
+MAJOR_PARAMS = ("channels", "guilds", "webhooks")
+COALESCE_KEYS = frozenset({"content", "username", "avatar_url"})  # Plain text only; embeds/files never merge
+
+def route_key(method: str, url: str) -> str:
+    """Discord bucket route: method + path with non-major snowflakes collapsed (`/channels/1/messages/:id`)."""
+    path = urlsplit(url).path
+    parts = [p for p in path.split("/") if p]
+    if parts[:1] == ["api"]:
+        parts = parts[2:] if len(parts) > 1 and parts[1].startswith("v") else parts[1:]
+    out = []
+    for i, p in enumerate(parts):
+        if i > 1 and parts[i - 2] == "webhooks":
+            out.append(":token")  # Webhook secrets never reach bucket keys or logs
+        else:
+            out.append(":id" if p.isdigit() and not (i and parts[i - 1] in MAJOR_PARAMS) else p)
+    return f"{method.upper()} /{'/'.join(out)}"
+
+def _major(route: str) -> str:
+    parts = route.split(" ", 1)[1].strip("/").split("/")
+    for i, p in enumerate(parts[:-1]):
+        if p in MAJOR_PARAMS:
+            return f"{p}/{parts[i + 1]}"
+    return ""
+
+# ==============================================================================
+# 0. BUCKET STATE
+# ==============================================================================
+
+@dataclass
+class _Bucket:
+    limit: Optional[int] = None
+    remaining: Optional[int] = None   # None until the first response reveals the bucket
+    reset_at: float = 0.0             # monotonic
+    lock: Optional[asyncio.Lock] = None
+
+@dataclass
+class _Lane:
+    """Ordered outbound queue for one target (channel or webhook)."""
+    method: str
+    url: str
+    items: Deque[Tuple[Dict[str, Any], asyncio.Future, bool]] = field(default_factory=deque)  # (payload, future, mergeable)
+    worker: Optional[asyncio.Task] = None
+
+# ==============================================================================
+# 1. THE DISPATCHER
+# ==============================================================================
+
+class DiscordDispatcher:
+    """
+    Single outbound path for every Discord call the node makes. Each route is mapped to the bucket named
+    in X-RateLimit-Bucket; a request waits for its bucket's window instead of spending a 429. Messages to
+    the same channel queue in order and, while a send is in flight, consecutive small plain-text messages
+    are merged into one post.
+    """
+
+    def __init__(self, api_base: str = API_BASE):
+        self.api_base = api_base
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._buckets: Dict[str, _Bucket] = {}
+        self._route_bucket: Dict[str, str] = {}
+        self._lanes: Dict[str, _Lane] = {}
+        self._global_until = 0.0
+        self._inflight = 0
+        self.stats = {"sent": 0, "paced": 0, "throttled": 0, "coalesced": 0, "failed": 0}
+
+    # --- LOOP BINDING ---
+
+    def _bind_loop(self):
+        """Clients, locks and lanes belong to one event loop; a new loop gets fresh ones (bucket math survives)."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop, self._client, self._lanes = loop, None, {}
+            for b in self._buckets.values():
+                b.lock = None
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=REQUEST_TIMEOUT_S)
+        return self._client
+
+    def _headers(self, url: str) -> Dict[str, str]:
+        headers = {"Content-Type": "application/json"}
+        if "/webhooks/" not in url:
+            headers["Authorization"] = f"Bot {os.getenv('DISCORD_BOT_TOKEN')}"
+        return headers
+
+    # --- BUCKETS ---
+
+    def _bucket_for(self, route: str) -> _Bucket:
+        key = self._route_bucket.get(route, route)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket()
+        if bucket.lock is None:
+            bucket.lock = asyncio.Lock()
+        return bucket
+
+    async def _wait_for(self, bucket: _Bucket):
+        while True:
+            now = time.monotonic()
+            if bucket.remaining is not None and bucket.remaining <= 0 and bucket.reset_at <= now:
+                bucket.remaining = bucket.limit or 1  # Window rolled over
+            wait = max(self._global_until - now, 0.0)
+            if bucket.remaining is not None and bucket.remaining <= 0:
+                wait = max(wait, bucket.reset_at - now)
+            if wait <= 0:
+                return
+            self.stats["paced"] += 1
+            await asyncio.sleep(wait)
+
+    def _observe(self, route: str, bucket: _Bucket, resp: httpx.Response) -> _Bucket:
+        h, now = resp.headers, time.monotonic()
+        name = h.get("x-ratelimit-bucket")
+        if name:
+            key = f"{name}:{_major(route)}"
+            if self._route_bucket.get(route) != key:
+                # Routes sharing a Discord bucket share one state object from now on
+                bucket = self._buckets.setdefault(key, bucket)
+                self._route_bucket[route] = key
+                self._buckets.pop(route, None)  # Drop the provisional per-route entry
+        try:
+            if h.get("x-ratelimit-limit"): bucket.limit = int(h["x-ratelimit-limit"])
+            if h.get("x-ratelimit-remaining") is not None:
+                bucket.remaining = int(h["x-ratelimit-remaining"])
+                bucket.reset_at = now + float(h.get("x-ratelimit-reset-after", 0))
+        except ValueError:
+            pass
+        if resp.status_code == 429:
+            try:
+                body = resp.json()
+            except ValueError:
+                body = {}
+            retry_after = float(body.get("retry_after") or h.get("retry-after") or 1)
+            if body.get("global") or h.get("x-ratelimit-global"):
+                self._global_until = now + retry_after
+            else:
+                bucket.remaining, bucket.reset_at = 0, now + retry_after
+            self.stats["throttled"] += 1
+            logger.warning(f"⏳ [RATE_LIMIT]: {route} throttled. Waiting {retry_after}s...")
+        return bucket
+
+    # --- RAW REQUEST ---
+
+    async def request(self, method: str, endpoint: str, json_data: Optional[dict] = None) -> Optional[httpx.Response]:
+        """Paced request; `endpoint` is an API path (`/channels/...`) or an absolute webhook URL."""
+        client = self._bind_loop()
+        url = endpoint if endpoint.startswith("http") else f"{self.api_base}{endpoint}"
+        route = route_key(method, url)
+        resp = None
+        for _ in range(MAX_ATTEMPTS):
+            bucket = self._bucket_for(route)
+            await bucket.lock.acquire()
+            held = True
+            try:
+                await self._wait_for(bucket)
+                if bucket.remaining is not None:
+                    # Known window: reserve a slot and let the next caller in. An unknown window keeps
+                    # the bucket held until this response's headers reveal it.
+                    bucket.remaining -= 1
+                    bucket.lock.release()
+                    held = False
+                self._inflight += 1
+                try:
+                    resp = await client.request(method, url, headers=self._headers(url), json=json_data)
+                finally:
+                    self._inflight -= 1
+                self._observe(route, bucket, resp)
+            finally:
+                if held:
+                    bucket.lock.release()
+            if resp.status_code != 429:
+                self.stats["sent"] += 1
+                return resp
+        self.stats["failed"] += 1
+        return resp
+
+    # --- QUEUED SENDS ---
+
+    async def _enqueue(self, key: str, method: str, url: str, payload: Dict[str, Any],
+                       mergeable: bool = True) -> Optional[httpx.Response]:
+        self._bind_loop()
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = _Lane(method, url)
+        fut = asyncio.get_running_loop().create_future()
+        lane.items.append((payload, fut, mergeable))
+        if lane.worker is None or lane.worker.done():
+            lane.worker = asyncio.create_task(self._drain(lane))
+        return await fut
+
+    @staticmethod
+    def _mergeable(head: Dict[str, Any], size: int, nxt: Dict[str, Any]) -> bool:
+        if not set(head) <= COALESCE_KEYS or set(nxt) != set(head):
+            return False
+        if any(head.get(k) != nxt.get(k) for k in head if k != "content"):
+            return False
+        return size + 1 + len(nxt.get("content", "")) <= MESSAGE_LIMIT
+
+    async def _drain(self, lane: _Lane):
+        while lane.items:
+            payload, fut, mergeable = lane.items.popleft()
+            batch, parts = [fut], [payload.get("content", "")]
+            size = len(parts[0])
+            # Only whole, separately enqueued messages merge; chunks of one long message keep their own posts
+            while mergeable and lane.items and lane.items[0][2] and self._mergeable(payload, size, lane.items[0][0]):
+                nxt, nfut, _ = lane.items.popleft()
+                parts.append(nxt.get("content", ""))
+                size += 1 + len(parts[-1])
+                batch.append(nfut)
+            if len(batch) > 1:
+                payload = {**payload, "content": "\n".join(parts)}
+                self.stats["coalesced"] += len(batch) - 1
+            try:
+                resp = await self.request(lane.method, lane.url, payload)
+            except Exception as e:
+                logger.warning(f"⚠️ [DISCORD_DISPATCH]: {lane.url} send failed: {e}")
+                resp = None
+            for f in batch:
+                if not f.done(): f.set_result(resp)
+
+    async def send_message(self, channel_id: str, content: str, mergeable: bool = True, **extra) -> Optional[httpx.Response]:
+        return await self._enqueue(f"channels/{channel_id}", "POST", f"/channels/{channel_id}/messages",
+                                   {"content": content, **extra}, mergeable)
+
+    async def send_webhook(self, webhook_url: str, payload: Dict[str, Any]) -> Optional[httpx.Response]:
+        return await self._enqueue(_major(route_key("POST", webhook_url)) or webhook_url, "POST", webhook_url, payload)
+
+    async def send_chunks(self, channel_id: str, chunks: List[str]) -> List[Optional[httpx.Response]]:
+        """
+        Queues every chunk at once; the lane keeps order and the buckets keep pace. Chunks of a split message
+        are never coalesced (that would rejoin them at the raw split offset); a single chunk still can be.
+        """
+        mergeable = len(chunks) == 1
+        return await asyncio.gather(*(self.send_message(channel_id, c, mergeable=mergeable) for c in chunks))
+
+    # --- TELEMETRY ---
+
+    def queue_depth(self) -> int:
+        return sum(len(l.items) for l in self._lanes.values()) + self._inflight
+
+    def snapshot(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "queue_depth": self.queue_depth(),
+            "lanes": {k: len(l.items) for k, l in self._lanes.items() if l.items},
+            "buckets": {k: {"remaining": b.remaining, "limit": b.limit, "reset_in": round(max(b.reset_at - now, 0.0), 3)}
+                        for k, b in self._buckets.items() if b.remaining is not None},
+            "global_wait": round(max(self._global_until - now, 0.0), 3),
+            **self.stats,
+        }
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+# --- GLOBAL INSTANCE ---
+discord_dispatcher = DiscordDispatcher()
@@ -0,0 +1,190 @@
+"""
+REALM FORGE: INDICATOR ENGINE v1.0
+ARCHITECT: LEAD SWARM ENGINEER (MASTERMIND v31.4)
+STATUS: PRODUCTION READY - CUMSUM SMA - CLOSED-FORM WILDER SMOOTHING - (T, N) TICKER MATRICES - O(1) BAR UPDATES
+PATH: F:/RealmForge_PROD/src/system/indicators.py
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd  # type: ignore[import-untyped]
+
+FAST, SLOW, PERIOD = 50, 200, 14
+
+def _wilder(x: np.ndarray, period: int) -> np.ndarray:
+    """
+    Wilder's smoothing of every column of `x` (T, N) evaluated at the last row, in one weighted sum:
+    seed = mean(x[:period]); s_t = s_{t-1} + (x_t - s_{t-1}) / period.
+    Unrolled, s_T = a^m * seed + (1/period) * sum_k a^(m-1-k) * x_k with a = 1 - 1/period.
+    """
+    seed = x[:period].mean(axis=0)
+    rest = x[period:]
+    a = 1.0 - 1.0 / period
+    weights = a ** np.arange(len(rest) - 1, -1, -1, dtype=np.float64)
+    return a ** len(rest) * seed + (weights @ rest) / period
+
+def true_range(close: np.ndarray, high: np.ndarray, low: np.ndarray) -> np.ndarray:
+    """TR for rows 1..T-1 (needs the previous close)."""
+    prev = close[:-1]
+    return np.maximum(high[1:] - low[1:], np.maximum(np.abs(high[1:] - prev), np.abs(low[1:] - prev)))
+
+def rsi_from(avg_gain: np.ndarray, avg_loss: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return np.where(avg_loss == 0, np.where(avg_gain == 0, 50.0, 100.0), rsi)
+
+# ==============================================================================
+# 1. ROLLING STATE (N TICKERS AT ONCE)
+# ==============================================================================
+
+class IndicatorState:
+    """
+    SMA fast/slow, Wilder RSI and Wilder ATR for N tickers. Every field is an (N,) array except the
+    (slow, N) close ring that feeds the SMA running sums, so `update` costs O(1) per ticker per bar.
+    """
+
+    def __init__(self, n: int, fast: int = FAST, slow: int = SLOW, period: int = PERIOD):
+        self.fast, self.slow, self.period = fast, slow, period
+        self.bars = 0
+        self.ring = np.zeros((slow, n))
+        self.sum_fast = np.zeros(n)
+        self.sum_slow = np.zeros(n)
+        self.prev_close = np.full(n, np.nan)
+        self.avg_gain = np.zeros(n)
+        self.avg_loss = np.zeros(n)
+        self.atr = np.zeros(n)
+
+    @classmethod
+    def from_arrays(cls, close: np.ndarray, high: np.ndarray, low: np.ndarray,
+                    fast: int = FAST, slow: int = SLOW, period: int = PERIOD) -> "IndicatorState":
+        """One pass over (T, N) matrices whose columns share a length (see `stack_tail`)."""
+        close, high, low = (np.asarray(a, dtype=np.float64).reshape(len(a), -1) for a in (close, high, low))
+        t, n = close.shape
+        st = cls(n, fast, slow, period)
+        st.bars = t
+        if t == 0:
+            return st
+        cs = np.cumsum(close, axis=0)
+        st.sum_fast = cs[-1] - (cs[-1 - fast] if t > fast else 0.0)
+        st.sum_slow = cs[-1] - (cs[-1 - slow] if t > slow else 0.0)
+        keep = np.arange(max(0, t - slow), t)
+        st.ring[keep % slow] = close[keep]
+        st.prev_close = close[-1].copy()
+        if t > period:
+            delta = np.diff(close, axis=0)
+            st.avg_gain = _wilder(np.clip(delta, 0.0, None), period)
+            st.avg_loss = _wilder(np.clip(-delta, 0.0, None), period)
+            st.atr = _wilder(true_range(close, high, low), period)
+        elif t > 1:
+            # Warm-up: hold running sums until `period` deltas exist (finalised in `update`)
+            delta = np.diff(close, axis=0)
+            st.avg_gain = np.clip(delta, 0.0, None).sum(axis=0)
+            st.avg_loss = np.clip(-delta, 0.0, None).sum(axis=0)
+            st.atr = true_range(close, high, low).sum(axis=0)
+        return st
+
+    def update(self, close: np.ndarray, high: np.ndarray, low: np.ndarray) -> "IndicatorState":
+        """Folds one new bar (each argument (N,)) into the state in O(1) per ticker."""
+        close, high, low = (np.asarray(a, dtype=np.float64).reshape(-1) for a in (close, high, low))
+        k = self.bars
+        out_fast = self.ring[(k - self.fast) % self.slow] if k >= self.fast else 0.0
+        out_slow = self.ring[k % self.slow] if k >= self.slow else 0.0
+        self.sum_fast = self.sum_fast + close - out_fast
+        self.sum_slow = self.sum_slow + close - out_slow
+        self.ring[k % self.slow] = close
+        if k:
+            delta = close - self.prev_close
+            gain, loss = np.clip(delta, 0.0, None), np.clip(-delta, 0.0, None)
+            tr = np.maximum(high - low, np.maximum(np.abs(high - self.prev_close), np.abs(low - self.prev_close)))
+            p = self.period
+            if k < p:
+                self.avg_gain, self.avg_loss, self.atr = self.avg_gain + gain, self.avg_loss + loss, self.atr + tr
+            elif k == p:
+                self.avg_gain = (self.avg_gain + gain) / p
+                self.avg_loss = (self.avg_loss + loss) / p
+                self.atr = (self.atr + tr) / p
+            else:
+                self.avg_gain = self.avg_gain + (gain - self.avg_gain) / p
+                self.avg_loss = self.avg_loss + (loss - self.avg_loss) / p
+                self.atr = self.atr + (tr - self.atr) / p
+        self.prev_close = close
+        self.bars = k + 1
+        return self
+
+    def copy(self) -> "IndicatorState":
+        st = IndicatorState.__new__(IndicatorState)
+        st.__dict__ = {k: (v.copy() if isinstance(v, np.ndarray) else v) for k, v in self.__dict__.items()}
+        return st
+
+    def values(self) -> Dict[str, np.ndarray]:
+        """Latest indicator row; NaN where a window is not yet full."""
+        nan = np.full_like(self.prev_close, np.nan)
+        warm = self.bars > self.period
+        return {
+            "close": self.prev_close,
+            "sma_fast": self.sum_fast / self.fast if self.bars >= self.fast else nan,
+            "sma_slow": self.sum_slow / self.slow if self.bars >= self.slow else nan,
+            "rsi": rsi_from(self.avg_gain, self.avg_loss) if warm else nan,
+            "atr": self.atr if warm else nan,
+        }
+
+def stack_tail(frames: Iterable[pd.DataFrame], length: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Tail-aligns OHLC frames into (T, N) Close/High/Low matrices, T = the shortest history (or `length`).
+    Indicators only look backwards from each ticker's own last bar, so calendars need not match.
+    """
+    frames = list(frames)
+    t = min(len(f) for f in frames) if frames else 0
+    if length is not None: t = min(t, length)
+    cols = [np.column_stack([f[c].to_numpy(dtype=np.float64)[len(f) - t:] for f in frames]) if frames else np.empty((0, 0))
+            for c in ("Close", "High", "Low")]
+    return cols[0], cols[1], cols[2]
+
+# ==============================================================================
+# 2. PER-TICKER BOOK (TOOL-FACING)
+# ==============================================================================
+
+@dataclass
+class _Entry:
+    state: IndicatorState   # Every bar except the newest, which may still be an in-session bar
+    last_ts: int
+    last_close: float
+
+class IndicatorBook:
+    """
+    Remembers each ticker's committed state. A call with the same or newer history folds only the bars
+    after the committed one; the newest bar is always applied to a copy because it can still change.
+    History that was rewritten underneath (split/dividend adjustment) triggers a rebuild.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self.stats = {"rebuilds": 0, "incremental": 0}
+
+    def latest(self, ticker: str, hist: pd.DataFrame) -> Dict[str, float]:
+        if hist.empty:
+            return {}
+        ts = hist.index.as_unit("s").asi8
+        close, high, low = (hist[c].to_numpy(dtype=np.float64) for c in ("Close", "High", "Low"))
+        with self._lock:
+            entry = self._entries.get(ticker)
+            pos = int(np.searchsorted(ts, entry.last_ts)) if entry else -1
+            if entry and pos < len(ts) - 1 and ts[pos] == entry.last_ts and np.isclose(close[pos], entry.last_close, rtol=1e-9):
+                state = entry.state
+                for i in range(pos + 1, len(ts) - 1):
+                    state.update(close[i], high[i], low[i])
+                self.stats["incremental"] += 1
+            else:
+                state = IndicatorState.from_arrays(close[:-1], high[:-1], low[:-1])
+                self.stats["rebuilds"] += 1
+            if len(ts) > 1:
+                self._entries[ticker] = _Entry(state, int(ts[-2]), float(close[-2]))
+            view = state.copy().update(close[-1], high[-1], low[-1])
+        return {k: float(v[0]) for k, v in view.values().items()}
+
+# --- GLOBAL INSTANCE ---
+indicator_book = IndicatorBook()
@@ -0,0 +1,165 @@
+"""
+REALM FORGE: MANIFEST PIPELINE v1.0
+ARCHITECT: LEAD SWARM ENGINEER (MASTERMIND v31.4)
+STATUS: PRODUCTION READY - LIBYAML C CODEC - CHUNKED PROCESS POOL - CONTENT-HASH WRITES
+PATH: F:/RealmForge_PROD/src/system/manifest_pipeline.py
+"""
+
+import os
+import hashlib
+import logging
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import yaml
+
+logger = logging.getLogger("ManifestPipeline")
+
+CHUNK_SIZE = int(os.getenv("REALM_MANIFEST_CHUNK", "64"))
+PARALLEL_THRESHOLD = 2 * CHUNK_SIZE  # Below this, pool start-up costs more than it saves
+MANIFEST_ENCODING = "utf-8-sig"
+
+try:
+    YAML_LOADER, YAML_DUMPER = yaml.CSafeLoader, yaml.CSafeDumper
+except AttributeError:
+    YAML_LOADER, YAML_DUMPER = yaml.SafeLoader, yaml.SafeDumper
+
+# ==============================================================================
+# 0. CODEC
+# ==============================================================================
+
+def load_manifest_text(text: str) -> Dict[str, Any]:
+    return yaml.load(text, Loader=YAML_LOADER) or {}
+
+def dump_manifest(dna: Dict[str, Any]) -> str:
+    return yaml.dump(dna, Dumper=YAML_DUMPER, sort_keys=False, allow_unicode=True)
+
+def content_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def atomic_write_text(path: Path, text: str, encoding: str = MANIFEST_ENCODING):
+    """Temp file in the target directory + os.replace: readers never see a half-written manifest."""
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.stem}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp): os.remove(tmp)
+        raise
+
+def write_if_changed(path: Path, dna: Dict[str, Any]) -> bool:
+    """Serializes `dna` and rewrites `path` only when the bytes would differ. True if written."""
+    path = Path(path)
+    text = dump_manifest(dna)
+    try:
+        with open(path, "r", encoding=MANIFEST_ENCODING) as f:
+            if content_digest(f.read()) == content_digest(text):
+                return False
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_text(path, text)
+    return True
+
+# ==============================================================================
+# 1. PARALLEL PARSE
+# ==============================================================================
+
+def load_manifest_file(path: str) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+    try:
+        with open(path, "r", encoding=MANIFEST_ENCODING) as f:
+            return path, load_manifest_text(f.read()), None
+    except Exception as e:
+        return path, None, str(e)
+
+def _parse_chunk(paths: Sequence[str]):
+    return [load_manifest_file(p) for p in paths]
+
+def _chunks(items: Sequence[Any], size: int) -> List[Sequence[Any]]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def _fan_out(fn, items: Sequence[Any], workers: Optional[int]) -> List[Any]:
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(items) < PARALLEL_THRESHOLD:
+        return fn(items)
+    out = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(fn, _chunks(items, CHUNK_SIZE)):
+            out.extend(part)
+    return out
+
+def parse_manifests(paths: Sequence[str], workers: Optional[int] = None) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+    """Parses manifests with the C loader, fanned out over a process pool in CHUNK_SIZE batches."""
+    results = []
+    for path, dna, err in _fan_out(_parse_chunk, list(paths), workers):
+        if err: logger.warning(f"⚠️ [MANIFEST_PIPELINE]: Skip {Path(path).name}: {err}")
+        results.append((path, dna))
+    return results
+
+# ==============================================================================
+# 2. PARALLEL PATCH & WRITE-BACK
+# ==============================================================================
+
+@dataclass
+class ManifestJob:
+    """Declarative (picklable) edit: read `src`, merge `updates` section-by-section, write to `dst`."""
+    src: str
+    dst: Optional[str] = None
+    updates: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+@dataclass
+class JobResult:
+    src: str
+    dst: str
+    written: bool
+    dna: Optional[Dict[str, Any]]
+    error: Optional[str] = None
+
+def _apply_job(job: ManifestJob) -> JobResult:
+    dst = job.dst or job.src
+    _, dna, err = load_manifest_file(job.src)
+    if err: return JobResult(job.src, dst, False, None, err)
+    try:
+        for section, fields in job.updates.items():
+            block = dna.get(section)
+            if not isinstance(block, dict):
+                block = dna[section] = {}
+            block.update(fields)
+        return JobResult(job.src, dst, write_if_changed(Path(dst), dna), dna)
+    except Exception as e:
+        return JobResult(job.src, dst, False, None, str(e))
+
+def _key(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+def plan_conflicts(jobs: Sequence[ManifestJob]) -> List[Tuple[ManifestJob, ManifestJob]]:
+    """
+    (writer, reader) pairs where one job's `dst` is another job's still-pending `src`. Run in parallel,
+    the reader may load the writer's output instead of its own original, so such plans must not run.
+    """
+    readers = {_key(j.src): j for j in jobs}
+    return [(j, readers[_key(j.dst)]) for j in jobs
+            if j.dst and _key(j.dst) in readers and readers[_key(j.dst)] is not j]
+
+def removable_sources(jobs: Sequence[ManifestJob], results: Sequence[JobResult]) -> List[str]:
+    """Sources of successful moves that no job wrote to, i.e. safe to delete after the pool finishes."""
+    written = {_key(j.dst or j.src) for j in jobs}
+    return [r.src for r in results
+            if not r.error and _key(r.src) != _key(r.dst) and _key(r.src) not in written]
+
+def _apply_chunk(jobs: Sequence[ManifestJob]) -> List[JobResult]:
+    return [_apply_job(j) for j in jobs]
+
+def apply_manifest_jobs(jobs: Sequence[ManifestJob], workers: Optional[int] = None) -> List[JobResult]:
+    """Runs patch jobs across the pool; files whose serialized content is unchanged are not touched."""
+    results = _fan_out(_apply_chunk, list(jobs), workers)
+    written = sum(r.written for r in results)
+    failed = [r for r in results if r.error]
+    for r in failed:
+        logger.warning(f"⚠️ [MANIFEST_PIPELINE]: {Path(r.src).name}: {r.error}")
+    logger.info(f"🧬 [MANIFEST_PIPELINE]: {len(results)} manifests processed, {written} rewritten, {len(failed)} failed.")
+    return results
@@ -0,0 +1,327 @@
+"""
+REALM FORGE: MARKET DATA SERVICE v1.0
+ARCHITECT: LEAD SWARM ENGINEER (MASTERMIND v31.4)
+STATUS: PRODUCTION READY - SQLITE OHLCV STORE - INCREMENTAL TOP-UP - TTL QUOTE/INFO CACHE - BATCHED DOWNLOADS
+PATH: F:/RealmForge_PROD/src/system/market_data.py
+"""
+
+import os
+import time
+import zlib
+import pickle
+import sqlite3
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd  # type: ignore[import-untyped]
+
+logger = logging.getLogger("MarketData")
+
+MARKET_DB_PATH = Path(os.getenv("REALM_MARKET_DB", "F:/RealmForge/data/finance/market_data.db"))
+BAR_TTL_S = float(os.getenv("REALM_MARKET_BAR_TTL_S", "900"))        # Re-check for new bars at most this often
+QUOTE_TTL_S = float(os.getenv("REALM_MARKET_QUOTE_TTL_S", "60"))
+INFO_TTL_S = float(os.getenv("REALM_MARKET_INFO_TTL_S", "21600"))    # .info is a slow multi-request scrape
+BATCH_SIZE = int(os.getenv("REALM_MARKET_BATCH", "100"))               # Tickers per yf.download call
+OHLCV = ["Open", "High", "Low", "Close", "Volume"]
+ACTIONS = ["Dividends", "Stock Splits"]
+BAR_COLUMNS = OHLCV + ACTIONS   # Same columns as Ticker.history()
+
+PERIOD_DAYS = {
+    "1d": 1, "5d": 5, "1mo": 31, "3mo": 92, "6mo": 183, "1y": 366,
+    "2y": 731, "5y": 1827, "10y": 3653,
+}
+
+def _period_sessions(period: str) -> Optional[int]:
+    """`Nd` periods mean the last N trading sessions (yfinance semantics), not N calendar days."""
+    period = (period or "1mo").lower()
+    return PERIOD_DAYS[period] if period.endswith("d") and period in PERIOD_DAYS else None
+
+def _period_start(period: str, now: Optional[datetime] = None) -> int:
+    """
+    Epoch seconds the stored window starts at (0 = `max`), floored to a UTC date because daily bars sit at
+    midnight. `Nd` periods reach back far enough to hold N sessions across weekends and holidays.
+    """
+    period = (period or "1mo").lower()
+    now = now or datetime.now(timezone.utc)
+    if period == "max":
+        return 0
+    if period == "ytd":
+        return int(datetime(now.year, 1, 1, tzinfo=timezone.utc).timestamp())
+    if period not in PERIOD_DAYS:
+        raise ValueError(f"Unsupported period '{period}'. Use one of: {', '.join([*PERIOD_DAYS, 'ytd', 'max'])}")
+    sessions = _period_sessions(period)
+    day = (now - timedelta(days=sessions * 2 + 5 if sessions else PERIOD_DAYS[period])).date()
+    return int(datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp())
+
+def _bars(frame: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """Any download shape -> BAR_COLUMNS, zero-filling the corporate-action columns when absent."""
+    if frame is None:
+        return pd.DataFrame(columns=BAR_COLUMNS)
+    frame = frame.reindex(columns=BAR_COLUMNS)
+    frame[ACTIONS] = frame[ACTIONS].fillna(0.0)
+    return frame
+
+def _norm(ticker: str) -> str:
+    return (ticker or "").upper().strip()
+
+# ==============================================================================
+# 1. THE SERVICE
+# ==============================================================================
+
+class MarketDataService:
+    """
+    Local OHLCV store in front of yfinance. A ticker's bars are fetched once for the widest window asked
+    for; afterwards only bars from the last stored timestamp onward are requested, and not more often
+    than BAR_TTL_S. Cold tickers in one call share a single `yf.download`. `.info` and quotes are cached
+    with their own TTLs in memory and on disk, so a finance mission touches the network at most once per
+    ticker per TTL.
+    """
+
+    def __init__(self, db_path: Path = MARKET_DB_PATH):
+        self.db_path = Path(db_path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._ticker_locks: Dict[str, threading.Lock] = {}
+        self._info: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self.stats = {"downloads": 0, "tickers_fetched": 0, "info_fetches": 0, "cache_hits": 0}
+
+    # --- STORAGE ---
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(self.db_path.parent, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS bars (
+                    ticker TEXT NOT NULL,
+                    interval TEXT NOT NULL,
+                    ts INTEGER NOT NULL,
+                    open REAL, high REAL, low REAL, close REAL, volume REAL,
+                    dividends REAL NOT NULL DEFAULT 0, splits REAL NOT NULL DEFAULT 0,
+                    PRIMARY KEY (ticker, interval, ts)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS coverage (
+                    ticker TEXT NOT NULL,
+                    interval TEXT NOT NULL,
+                    covered_from INTEGER NOT NULL,
+                    last_ts INTEGER,
+                    checked_at REAL NOT NULL,
+                    tz TEXT,
+                    PRIMARY KEY (ticker, interval)
+                );
+                CREATE TABLE IF NOT EXISTS info (
+                    ticker TEXT PRIMARY KEY,
+                    fetched_at REAL NOT NULL,
+                    blob BLOB NOT NULL
+                );
+            """)
+            # Stores created before corporate actions / exchange timezones were kept gain the columns in place
+            for table, column, decl in (("bars", "dividends", "REAL NOT NULL DEFAULT 0"),
+                                        ("bars", "splits", "REAL NOT NULL DEFAULT 0"), ("coverage", "tz", "TEXT")):
+                if column not in {r[1] for r in conn.execute(f"PRAGMA table_info({table})")}:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+            self._conn = conn
+        return self._conn
+
+    def _coverage(self, tickers: List[str], interval: str) -> Dict[str, Tuple[int, Optional[int], float, Optional[str]]]:
+        marks = ",".join("?" * len(tickers))
+        with self._lock:
+            rows = self._db().execute(
+                f"SELECT ticker, covered_from, last_ts, checked_at, tz FROM coverage WHERE interval = ? AND ticker IN ({marks})",
+                (interval, *tickers),
+            ).fetchall()
+        return {t: (c, l, a, z) for t, c, l, a, z in rows}
+
+    def _store(self, frames: Dict[str, pd.DataFrame], interval: str, covered_from: Dict[str, int],
+               tzs: Optional[Dict[str, Optional[str]]] = None):
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                for ticker, frame in frames.items():
+                    rows = []
+                    if frame is not None and not frame.empty:
+                        frame = frame.dropna(subset=["Close"])
+                        idx = frame.index.tz_convert("UTC") if frame.index.tz is not None else frame.index.tz_localize("UTC")
+                        ts = idx.as_unit("s").asi8
+                        rows = list(zip([ticker] * len(frame), [interval] * len(frame), ts.tolist(),
+                                        *(frame[c].astype(float).tolist() for c in BAR_COLUMNS)))
+                        db.executemany("INSERT OR REPLACE INTO bars (ticker, interval, ts, open, high, low, close, volume, dividends, splits) "
+                                       "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+                    prev = db.execute("SELECT covered_from, last_ts, tz FROM coverage WHERE ticker = ? AND interval = ?",
+                                      (ticker, interval)).fetchone()
+                    start = min(covered_from[ticker], prev[0]) if prev else covered_from[ticker]
+                    last = max([r[2] for r in rows] + ([prev[1]] if prev and prev[1] is not None else []), default=None)
+                    tz = (tzs or {}).get(ticker) or (prev[2] if prev else None)
+                    db.execute("INSERT OR REPLACE INTO coverage (ticker, interval, covered_from, last_ts, checked_at, tz) "
+                               "VALUES (?, ?, ?, ?, ?, ?)", (ticker, interval, start, last, now, tz))
+                db.execute("COMMIT")
+            except Exception:
+                db.execute("ROLLBACK")
+                raise
+
+    def _load(self, ticker: str, interval: str, start: int, sessions: Optional[int] = None) -> pd.DataFrame:
+        """
+        Bars from `start` in the ticker's exchange timezone (UTC when unknown), with the Ticker.history()
+        columns; with `sessions`, only the bars of the last N distinct trading dates.
+        """
+        with self._lock:
+            db = self._db()
+            rows = db.execute(
+                "SELECT ts, open, high, low, close, volume, dividends, splits FROM bars "
+                "WHERE ticker = ? AND interval = ? AND ts >= ? ORDER BY ts",
+                (ticker, interval, start),
+            ).fetchall()
+            tz = db.execute("SELECT tz FROM coverage WHERE ticker = ? AND interval = ?", (ticker, interval)).fetchone()
+        frame = pd.DataFrame(rows, columns=["ts", *BAR_COLUMNS])
+        index = pd.DatetimeIndex(pd.to_datetime(frame.pop("ts"), unit="s", utc=True), name="Date")
+        if tz and tz[0]:
+            try:
+                index = index.tz_convert(tz[0])
+            except Exception:
+                logger.warning(f"⚠️ [MARKET_DATA]: Unknown timezone {tz[0]!r} for {ticker}; serving UTC.")
+        frame.index = index
+        if sessions and not frame.empty:
+            days = frame.index.normalize()
+            frame = frame[days >= days.unique()[-sessions:][0]]
+        return frame
+
+    # --- NETWORK ---
+
+    @staticmethod
+    def _yf():
+        import yfinance as yf  # type: ignore[import-untyped]
+        return yf
+
+    def _download(self, tickers: List[str], interval: str, **window) -> Dict[str, pd.DataFrame]:
+        """One yf.download per BATCH_SIZE tickers; returns per-ticker BAR_COLUMNS frames."""
+        out: Dict[str, pd.DataFrame] = {}
+        for i in range(0, len(tickers), BATCH_SIZE):
+            batch = tickers[i:i + BATCH_SIZE]
+            raw = self._yf().download(batch, interval=interval, group_by="ticker", auto_adjust=True, actions=True,
+                                      ignore_tz=False, threads=True, progress=False, **window)
+            self.stats["downloads"] += 1
+            self.stats["tickers_fetched"] += len(batch)
+            for t in batch:
+                if raw is None or raw.empty:
+                    out[t] = _bars(None)
+                elif isinstance(raw.columns, pd.MultiIndex):
+                    out[t] = _bars(raw[t] if t in raw.columns.get_level_values(0) else None)
+                else:
+                    out[t] = _bars(raw)
+        return out
+
+    def _exchange_tz(self, ticker: str, frame: pd.DataFrame) -> Optional[str]:
+        """
+        Exchange timezone for a newly stored ticker. A download's index carries it unless the batch mixed
+        exchanges (yfinance then falls back to UTC); in that case ask yfinance's own (disk-cached) tz lookup.
+        """
+        tz = getattr(frame.index, "tz", None)
+        if tz is not None and str(tz) != "UTC":
+            return str(tz)
+        try:
+            return str(self._yf().Ticker(ticker).fast_info["timezone"]) or None
+        except Exception:
+            return str(tz) if tz is not None else None
+
+    def _ticker_lock(self, ticker: str) -> threading.Lock:
+        with self._lock:
+            return self._ticker_locks.setdefault(ticker, threading.Lock())
+
+    # --- HISTORY ---
+
+    def history_many(self, tickers: Iterable[str], period: str = "1mo", interval: str = "1d",
+                     ttl_s: float = BAR_TTL_S) -> Dict[str, pd.DataFrame]:
+        """Ticker.history()-shaped frames for every ticker, topping up the store in as few downloads as possible."""
+        tickers = sorted({_norm(t) for t in tickers if _norm(t)})
+        start = _period_start(period)
+        locks = [self._ticker_lock(t) for t in tickers]  # Sorted order: concurrent missions cannot deadlock
+        for lock in locks: lock.acquire()
+        try:
+            coverage = self._coverage(tickers, interval) if tickers else {}
+            now = time.time()
+            cold, topup = [], {}
+            for t in tickers:
+                cov = coverage.get(t)
+                if cov is None or cov[0] > start:
+                    cold.append(t)
+                elif now - cov[2] > ttl_s:
+                    # Re-fetch from the last stored bar: it may have been a partial (in-session) bar
+                    topup.setdefault(cov[1] if cov[1] is not None else start, []).append(t)
+                else:
+                    self.stats["cache_hits"] += 1
+
+            if cold:
+                window = {"start": datetime.fromtimestamp(start, timezone.utc).strftime("%Y-%m-%d")} if start else {"period": "max"}
+                frames = self._download(cold, interval, **window)
+                tzs = {t: self._exchange_tz(t, frames[t]) for t in cold if not (t in coverage and coverage[t][3])}
+                self._store(frames, interval, {t: start for t in cold}, tzs)
+            if topup:
+                # One download from the oldest last-bar covers every stale ticker
+                since = min(topup)
+                stale = [t for group in topup.values() for t in group]
+                day = datetime.fromtimestamp(since, timezone.utc).strftime("%Y-%m-%d")
+                self._store(self._download(stale, interval, start=day), interval,
+                            {t: coverage[t][0] for t in stale})
+            sessions = _period_sessions(period)
+            return {t: self._load(t, interval, start, sessions) for t in tickers}
+        finally:
+            for lock in reversed(locks): lock.release()
+
+    def history(self, ticker: str, period: str = "1mo", interval: str = "1d") -> pd.DataFrame:
+        return self.history_many([ticker], period=period, interval=interval)[_norm(ticker)]
+
+    # --- QUOTES & INFO ---
+
+    def quotes(self, tickers: Iterable[str]) -> Dict[str, Optional[float]]:
+        """Last traded price per ticker from the daily bar store (QUOTE_TTL_S freshness, one batched download)."""
+        frames = self.history_many(tickers, period="5d", interval="1d", ttl_s=QUOTE_TTL_S)
+        return {t: (float(f["Close"].iloc[-1]) if not f.empty else None) for t, f in frames.items()}
+
+    def quote(self, ticker: str) -> Optional[float]:
+        return self.quotes([ticker]).get(_norm(ticker))
+
+    def info(self, ticker: str, ttl_s: float = INFO_TTL_S) -> Dict[str, Any]:
+        ticker = _norm(ticker)
+        hit = self._info.get(ticker)
+        if hit and time.time() - hit[0] < ttl_s:
+            self.stats["cache_hits"] += 1
+            return hit[1]
+        with self._ticker_lock(ticker):
+            with self._lock:
+                row = self._db().execute("SELECT fetched_at, blob FROM info WHERE ticker = ?", (ticker,)).fetchone()
+            if row and time.time() - row[0] < ttl_s:
+                data = pickle.loads(zlib.decompress(row[1]))
+                self._info[ticker] = (row[0], data)
+                self.stats["cache_hits"] += 1
+                return data
+            data = dict(self._yf().Ticker(ticker).info or {})
+            self.stats["info_fetches"] += 1
+            fetched_at = time.time()
+            with self._lock:
+                self._db().execute("INSERT OR REPLACE INTO info VALUES (?, ?, ?)",
+                                   (ticker, fetched_at, zlib.compress(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL), 3)))
+            self._info[ticker] = (fetched_at, data)
+            return data
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            db = self._db()
+            tickers = db.execute("SELECT COUNT(DISTINCT ticker) FROM coverage").fetchone()[0]
+            bars = db.execute("SELECT COUNT(*) FROM bars").fetchone()[0]
+        return {"tickers": tickers, "bars": bars, "info_cached": len(self._info), **self.stats}
+
+    def close(self):
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+# --- GLOBAL INSTANCE ---
+market_data = MarketDataService()
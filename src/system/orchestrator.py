@@ -15,9 +15,12 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 # --- INTERNAL SYSTEM LINKAGE ---
-from realm_core import app as brain_graph, get_industrial_specialist, extract_json, get_llm
+from realm_core import app as brain_graph, get_industrial_specialist, extract_json, get_llm, resolve_successor
 from src.system.state import get_initial_state, RealmForgeState
-from src.memory.engine import MemoryManager
+from src.memory.engine import get_memory_kernel
+from src.system.round_table import RoundTableEngine
+from src.system.checkpoint import mission_journal
+from src.system.json_stream import MISSION_PLAN_SCHEMA
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 
 # --- PHYSICAL ANCHOR ---
@@ -32,9 +35,14 @@ class MissionOrchestrator:
     Handles 'Meeting Mode' logic and sequential mission drafting.
     """
 
-    def __init__(self):
-        self.memory = MemoryManager()
-        self.llm = get_llm()
+    # Memory and LLM bind on first use so importing the orchestrator stays cheap
+    @property
+    def memory(self):
+        return get_memory_kernel()
+
+    @property
+    def llm(self):
+        return get_llm()
 
     async def draft_mission_strategy(self, directive: str) -> Dict[str, Any]:
         """
@@ -61,7 +69,7 @@ class MissionOrchestrator:
         }}
         """
         res = await self.llm.ainvoke([SystemMessage(content=prompt)])
-        return extract_json(res.content)
+        return extract_json(res.content, MISSION_PLAN_SCHEMA)
 
     async def execute_multi_agent_strike(self, directive: str, user_id: str = "ADMIN"):
         """
@@ -79,8 +87,8 @@ class MissionOrchestrator:
         
         logger.info(f"🚀 [ORCHESTRATOR] Strike {state['mission_id']} Initiated: {strategy.get('mission_title')}")
 
-        # 3. Execute through Sovereign Brain (LangGraph)
-        final_state = await brain_graph.ainvoke(state)
+        # 3. Execute through Sovereign Brain (LangGraph), journaled per node for crash resume
+        final_state = await mission_journal.run(brain_graph, state, RealmForgeState)
         
         # 4. Final Audit
         await self.memory.commit_mission_event(
@@ -93,11 +101,22 @@ class MissionOrchestrator:
 
         return final_state
 
-    async def convene_round_table(self, mission_id: str, silos: List[str], topic: str) -> str:
+    async def resume_mission(self, mission_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Crash Recovery: Rebuilds a journaled mission and continues from the node after the
+        last completed one. Returns None when the mission is unknown or already complete.
+        """
+        state = await mission_journal.resume_state(mission_id, RealmForgeState, resolve_successor)
+        if state is None:
+            return None
+        logger.info(f"♻️ [ORCHESTRATOR] Strike {mission_id} resuming at {state['resume_from']}.")
+        return await mission_journal.run(brain_graph, state, RealmForgeState, resume=True)
+
+    async def convene_round_table(self, mission_id: str, silos: List[str], topic: str, strategy: Optional[str] = None) -> str:
         """
         MEETING MODE: Simulates a multi-agent discussion to generate billable artifacts.
+        Deliberation runs through the RoundTableEngine (parallel by default, see REALM_ROUND_TABLE_STRATEGY).
         """
-        meeting_transcript = [f"--- ROUND TABLE: {mission_id} ---"]
         participants = []
 
         # Fetch actual specialists from the renormalized lattice
@@ -109,27 +128,23 @@ class MissionOrchestrator:
         if not participants:
             return "Meeting aborted: No specialists found in required silos."
 
-        # Simulate discussion
-        for p in participants:
-            prompt = f"""
-            IDENTITY: {p['name']} | ROLE: {p['role']}
-            MEETING TOPIC: {topic}
-            TRANSCRIPT SO FAR: {' '.join(meeting_transcript)}
-            
-            Provide your expert industrial input for this mission. 
-            Be concise, technical, and focus on your sector's contribution.
-            """
-            res = await self.llm.ainvoke([SystemMessage(content=prompt)])
-            contribution = f"[{p['name']} - {p['role']}]: {res.content}"
-            meeting_transcript.append(contribution)
-
-        # Archive the meeting
+        engine = RoundTableEngine(self.llm, strategy=strategy)
+        result = await engine.convene(mission_id, participants, topic)
+
+        meeting_transcript = list(result.transcript)
+        if result.summary:
+            meeting_transcript.append(f"[MODERATOR_SYNTHESIS]: {result.summary}")
+
+        # Archive the meeting alongside its cost ledger
         meeting_file = ROOT_DIR / "data" / "artifacts" / f"meeting_{mission_id}.txt"
         os.makedirs(meeting_file.parent, exist_ok=True)
         
         with open(meeting_file, "w", encoding="utf-8") as f:
             f.write("\n\n".join(meeting_transcript))
 
+        with open(meeting_file.with_name(f"meeting_{mission_id}_telemetry.json"), "w", encoding="utf-8") as f:
+            json.dump(result.usage_report(), f, indent=2)
+
         return str(meeting_file)
 
 # --- GLOBAL INSTANCE ---
@@ -0,0 +1,145 @@
+"""
+REALM FORGE: PROMPT ASSEMBLY KERNEL v1.0
+ARCHITECT: LEAD SWARM ENGINEER (MASTERMIND v31.4)
+STATUS: PRODUCTION READY - COMPACT TOOL CATALOGS - CACHE-STABLE PREFIXES - TOKEN BUDGETS
+PATH: F:/RealmForge_PROD/src/system/prompting.py
+"""
+
+import os
+import json
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+logger = logging.getLogger("PromptKernel")
+
+PLANNER_TOKEN_BUDGET = int(os.getenv("REALM_PLANNER_TOKEN_BUDGET", "6000"))
+PURPOSE_CHARS = 60
+
+# Canonical supervisor silos -> DEPARTMENT_TOOL_MAP keys (the map predates the 13-silo renormalization)
+SILO_TOOL_ALIASES = {
+    "ARCHITECT": "Architect",
+    "SOFTWARE_ENGINEERING": "SOFTWARE_ENGINEERING",
+    "QUALITY_ASSURANCE": "SOFTWARE_ENGINEERING",
+    "DEVOPS_INFRASTRUCTURE": "DevOps",
+    "CYBERSECURITY": "CyberSecurity",
+    "DATA_INTELLIGENCE": "DataEngineering",
+    "FINANCIAL_OPS": "Finance",
+    "LEGAL_COMPLIANCE": "Legal",
+    "RESEARCH_DEVELOPMENT": "R&D",
+    "MARKETING_PR": "Creative",
+    "EXECUTIVE_BOARD": "Operations",
+    "HUMAN_CAPITAL": "Operations",
+    "FACILITY_MANAGEMENT": "FACILITY_MANAGEMENT",
+}
+
+# ==============================================================================
+# 0. TOKEN COUNTING
+# ==============================================================================
+
+try:
+    import tiktoken
+    _ENCODER = tiktoken.get_encoding("cl100k_base")
+except Exception:
+    _ENCODER = None
+
+def count_tokens(text: str) -> int:
+    """cl100k token count when tiktoken is installed, else the 4-chars-per-token heuristic."""
+    if not text: return 0
+    if _ENCODER is not None:
+        return len(_ENCODER.encode(text, disallowed_special=()))
+    return max(1, len(text) // 4)
+
+def count_message_tokens(messages: Sequence[BaseMessage]) -> int:
+    # ~4 tokens of role/framing overhead per chat message
+    return sum(count_tokens(m.content if isinstance(m.content, str) else str(m.content)) + 4 for m in messages)
+
+# ==============================================================================
+# 1. COMPACT TOOL CATALOG
+# ==============================================================================
+
+_JSON_TYPES = {"string": "str", "integer": "int", "number": "float", "boolean": "bool", "array": "list", "object": "dict"}
+
+def tool_signature(tool) -> str:
+    """`name(arg: type, opt: type=default) - purpose`, generated from the tool's args schema."""
+    params = []
+    for arg, spec in (getattr(tool, "args", None) or {}).items():
+        kind = _JSON_TYPES.get(spec.get("type"), "any")
+        params.append(f"{arg}: {kind}={json.dumps(spec['default'])}" if "default" in spec else f"{arg}: {kind}")
+    purpose = " ".join((tool.description or "").split())
+    purpose = purpose.split(": ", 1)[-1].split(". ")[0]  # Drop the "Role:" tag, keep the first sentence
+    if len(purpose) > PURPOSE_CHARS:
+        purpose = purpose[: PURPOSE_CHARS - 1].rstrip() + "…"
+    return f"{tool.name}({', '.join(params)}) - {purpose}"
+
+def resolve_department(dept: Optional[str], department_map: Dict[str, List[str]]) -> str:
+    key = (dept or "Architect").upper().replace(" ", "_")
+    if key in SILO_TOOL_ALIASES: return SILO_TOOL_ALIASES[key]
+    return next((k for k in department_map if k.upper().replace(" ", "_") == key), "Architect")
+
+class ToolCatalog:
+    """Per-department catalog text, built once and byte-identical across turns (sorted by tool name)."""
+
+    def __init__(self, tools: Sequence[Any], department_map: Dict[str, List[str]]):
+        self.by_name = {t.name: t for t in tools if hasattr(t, "name")}
+        self.department_map = department_map
+
+    @lru_cache(maxsize=64)
+    def for_department(self, dept: Optional[str]) -> Tuple[str, Tuple[str, ...]]:
+        key = resolve_department(dept, self.department_map)
+        names = sorted({n for n in self.department_map.get(key, []) if n in self.by_name})
+        if not names:
+            names = sorted(self.by_name)[:50]
+        block = "\n".join(tool_signature(self.by_name[n]) for n in names)
+        return block, tuple(names)
+
+# ==============================================================================
+# 2. PLANNER PROMPT ASSEMBLY
+# ==============================================================================
+
+PLANNER_PROTOCOL = """ROLE: Realm Forge Industrial Planner.
+PROTOCOL:
+1. Use SEMANTIC_ENTITIES to fill tool arguments accurately.
+2. Every file path MUST be F:/RealmForge_PROD/...
+3. Only call tools listed in AVAILABLE TOOLS, with the listed argument names.
+
+JSON SCHEMA:
+{ "sub_tasks": [ {"tool": "TOOL_NAME", "args": { "param": "value" } } ] }"""
+
+def build_planner_messages(
+    catalog: ToolCatalog,
+    dept: str,
+    agent_name: str,
+    mission: str,
+    params: Dict[str, Any],
+    history: Sequence[BaseMessage],
+    budget: int = PLANNER_TOKEN_BUDGET,
+) -> Tuple[List[BaseMessage], Dict[str, Any]]:
+    """
+    Stable-first layout: [protocol + department catalog] never changes for a silo, so provider and
+    local prefix caches hit; identity/mission/entities and history follow. History is trimmed
+    oldest-first (the opening directive is kept) until the call fits the token budget.
+    """
+    catalog_text, names = catalog.for_department(dept)
+    prefix = SystemMessage(content=f"{PLANNER_PROTOCOL}\n\nAVAILABLE TOOLS:\n{catalog_text}")
+    dynamic = SystemMessage(content=f"IDENTITY: {agent_name} (Industrial Silo: {dept})\nMISSION: {mission}\nSEMANTIC_ENTITIES: {json.dumps(params, sort_keys=True)}")
+
+    history = list(history)
+    pinned = history[:1] if history and isinstance(history[0], HumanMessage) else []
+    tail = history[len(pinned):]
+    fixed = count_message_tokens([prefix, dynamic] + pinned)
+    costs = [count_message_tokens([m]) for m in tail]
+    total, dropped = fixed + sum(costs), 0
+    while tail and total > budget:
+        total -= costs[dropped]
+        dropped += 1
+        tail = history[len(pinned) + dropped:]
+
+    if total > budget:
+        logger.warning(f"⚠️ [PROMPT_BUDGET]: Planner prompt {total} tokens exceeds budget {budget} after trimming history.")
+
+    stats = {"prompt_tokens": total, "prefix_tokens": count_message_tokens([prefix]), "budget": budget,
+             "tools": len(names), "history_dropped": dropped}
+    return [prefix, dynamic] + pinned + tail, stats
@@ -0,0 +1,218 @@
+"""
+REALM FORGE: ROSTER CACHE v1.0
+ARCHITECT: LEAD SWARM ENGINEER (MASTERMIND v31.4)
+STATUS: PRODUCTION READY - SINGLE-PASS ROSTER/MAP BUILD - INTERNED TOOLSETS - COLUMNAR DEPT SLICES
+PATH: F:/RealmForge_PROD/src/system/roster_cache.py
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger("RosterCache")
+
+ROSTER_CACHE_PATH = Path(os.getenv("REALM_ROSTER_CACHE", "F:/RealmForge/data/roster_cache.json"))
+CACHE_SCHEMA = "roster_cache/v1"
+MAP_SCHEMA = "capability_map/v2"
+
+# Canonical 13 Sectors for normalization (data_suture v2.0)
+SECTORS = [
+    "software_engineering", "cyber_security", "data_intelligence",
+    "devops_infrastructure", "financial_ops", "legal_compliance",
+    "research_development", "executive_board", "marketing_pr",
+    "human_capital", "quality_assurance", "facility_management",
+    "general_engineering"
+]
+
+# Brain routing aliases: stored as references, not as copies of the target sector
+SECTOR_ALIASES = {
+    "SILICON_ARCHITECT": "SOFTWARE_ENGINEERING",
+    "DATA_LATTICE_CURATOR": "DATA_INTELLIGENCE",
+    "ZERO_TRUST_SENTINEL": "CYBER_SECURITY",
+}
+
+# Manifest departments/silo folders that predate the 13-sector taxonomy
+DEPT_ALIASES = {
+    "ARCHITECT": "SOFTWARE_ENGINEERING",   # Same lead as the SILICON_ARCHITECT routing alias
+}
+
+_COMPACT = {"separators": (",", ":"), "ensure_ascii": False}
+
+class _Interner:
+    def __init__(self):
+        self.table: List[Any] = []
+        self.ids: Dict[Any, int] = {}
+
+    def __call__(self, value) -> int:
+        if value not in self.ids:
+            self.ids[value] = len(self.table)
+            self.table.append(list(value) if isinstance(value, tuple) else value)
+        return self.ids[value]
+
+def normalize_dept(dept: str) -> str:
+    dept = (dept or "").upper()
+    if dept.lower() in SECTORS: return dept
+    if dept in DEPT_ALIASES: return DEPT_ALIASES[dept]
+    bare = dept.replace("_", "")  # CYBERSECURITY -> CYBER_SECURITY
+    return next((s.upper() for s in SECTORS if s.upper().replace("_", "") in bare), "GENERAL_ENGINEERING")
+
+# ==============================================================================
+# 1. SINGLE-PASS BUILDER
+# ==============================================================================
+
+def build_roster_artifacts(records: Iterable[Any], data_dir: Path, sectors: Optional[List[str]] = None) -> Dict[str, int]:
+    """
+    One crawl -> roster.json (HUD schema, unchanged), industrial_capability_map.json (v2: interned
+    tool ids and toolsets, aliases by reference) and roster_cache.json (columnar, rows grouped by dept).
+    `records` are AgentStore AgentRecords.
+    """
+    data_dir = Path(data_dir)
+    sectors = sectors or SECTORS
+    tools, toolsets, skills = _Interner(), _Interner(), _Interner()
+    rows: List[Tuple[str, Dict[str, Any]]] = []
+
+    for rec in records:
+        # Every manifest is kept; silo folders outside the canonical list (architect/, cybersecurity/) are normalized
+        f_role = rec.functional_role or "Industrial_Specialist"
+        rows.append((normalize_dept(rec.dept or Path(rec.path).parent.name), {
+            "real_name": rec.name,
+            "name": f_role,
+            "id": rec.employee_id or f"GEN-{hashlib.md5(rec.path.encode()).hexdigest()[:4].upper()}",
+            "path": rec.path,
+            "toolset": toolsets(tuple(tools(t) for t in rec.tools)),
+            "skills": [skills(s) for s in rec.skills],
+            "god_mode": rec.god_mode,
+        }))
+    rows.sort(key=lambda r: r[0])  # Stable: crawl order kept inside each dept
+
+    # --- Columnar cache ---
+    columns = {k: [r[k] for _, r in rows] for k in ("name", "real_name", "id", "path", "toolset", "skills", "god_mode")}
+    offsets: Dict[str, List[int]] = {}
+    for i, (dept, _) in enumerate(rows):
+        offsets.setdefault(dept, [i, i])[1] = i + 1
+    cache = {
+        "schema": CACHE_SCHEMA, "built_at": datetime.now().isoformat(),
+        "dept_offsets": offsets, "tool_table": tools.table, "toolsets": toolsets.table,
+        "skill_table": skills.table, "columns": columns,
+    }
+
+    # --- Capability map v2 ---
+    capability_map = {
+        "schema": MAP_SCHEMA, "tool_table": tools.table, "toolsets": toolsets.table,
+        "sectors": {s.upper(): [] for s in sectors}, "aliases": SECTOR_ALIASES,
+    }
+    for dept, r in rows:
+        capability_map["sectors"].setdefault(dept, []).append(
+            [r["real_name"], r["name"], r["path"], r["toolset"], int(r["god_mode"])]
+        )
+    capability_map["row_fields"] = ["name", "functional_role", "path", "toolset", "god_mode"]
+
+    # --- roster.json (UI Support, legacy schema) ---
+    master_roster = [{
+        "name": r["name"], # HUD strictly uses name slot for role mapping
+        "display_name": r["name"].replace("_", " "),
+        "real_name": r["real_name"],
+        "dept": dept,
+        "id": r["id"],
+        "skills": [skills.table[s] for s in r["skills"]],
+        "status": "ONLINE",
+    } for dept, r in rows]
+
+    with open(data_dir / "industrial_capability_map.json", "w", encoding="utf-8") as f:
+        json.dump(capability_map, f, **_COMPACT)
+    with open(data_dir / "roster.json", "w", encoding="utf-8") as f:
+        json.dump({"roster": master_roster, "alignment": "NVIDIA_CORPORATE_V1", "last_suture": cache["built_at"]}, f, indent=2)
+    tmp = data_dir / "roster_cache.json.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(cache, f, **_COMPACT)
+    os.replace(tmp, data_dir / "roster_cache.json")
+
+    return {"agents": len(rows), "sectors": len(offsets), "tools": len(tools.table), "toolsets": len(toolsets.table)}
+
+# ==============================================================================
+# 2. RUNTIME READER
+# ==============================================================================
+
+class RosterCache:
+    """Loads the columnar cache once (reloaded on mtime change) and answers sector/roster queries from memory."""
+
+    def __init__(self, path: Path = ROSTER_CACHE_PATH, legacy_roster: Optional[Path] = None):
+        self.path = Path(path)
+        self.legacy_roster = Path(legacy_roster) if legacy_roster else self.path.with_name("roster.json")
+        self._lock = threading.Lock()
+        self._stamp: Optional[Tuple[str, int]] = None
+        self._data: Dict[str, Any] = {}
+        self._sector_memo: Dict[str, List[Dict[str, Any]]] = {}
+        self._all: Optional[List[Dict[str, Any]]] = None
+
+    def _current(self) -> Dict[str, Any]:
+        source = self.path if self.path.exists() else self.legacy_roster
+        try:
+            stamp = (str(source), source.stat().st_mtime_ns)
+        except OSError:
+            return {}
+        if stamp != self._stamp:
+            with self._lock:
+                if stamp != self._stamp:
+                    with open(source, "r", encoding="utf-8-sig") as f:
+                        raw = json.load(f)
+                    self._data = raw if raw.get("schema") == CACHE_SCHEMA else self._from_legacy(raw)
+                    self._sector_memo, self._all, self._stamp = {}, None, stamp
+        return self._data
+
+    @staticmethod
+    def _from_legacy(raw: Dict[str, Any]) -> Dict[str, Any]:
+        """roster.json fallback until the builder has produced a cache."""
+        roster = sorted(raw.get("roster", []), key=lambda a: a.get("dept", ""))
+        offsets: Dict[str, List[int]] = {}
+        for i, a in enumerate(roster):
+            offsets.setdefault(a.get("dept", ""), [i, i])[1] = i + 1
+        columns = {
+            "name": [a.get("name") or a.get("functional_role") for a in roster],
+            "real_name": [a.get("real_name") or a.get("name") for a in roster],
+            "id": [a.get("id", "UNK") for a in roster],
+            "path": [a.get("path") for a in roster],
+        }
+        return {"dept_offsets": offsets, "columns": columns}
+
+    def _rows(self, data: Dict[str, Any], start: int, end: int, dept: str) -> List[Dict[str, Any]]:
+        cols = data["columns"]
+        return [{"name": cols["real_name"][i], "role": cols["name"][i], "id": cols["id"][i],
+                 "department": dept, "path": cols["path"][i], "status": "ONLINE"} for i in range(start, end)]
+
+    def sector(self, department: str) -> List[Dict[str, Any]]:
+        """Legacy rule (`department` is a case-insensitive substring of the dept), answered from slices."""
+        data = self._current()
+        key = (department or "").lower()
+        hit = self._sector_memo.get(key)
+        if hit is None:
+            hit = []
+            for dept, (start, end) in data.get("dept_offsets", {}).items():
+                if key in dept.lower():
+                    hit.extend(self._rows(data, start, end, dept))
+            self._sector_memo[key] = hit
+        return hit
+
+    def all(self) -> List[Dict[str, Any]]:
+        data = self._current()
+        if self._all is None:
+            out = []
+            for dept, (start, end) in data.get("dept_offsets", {}).items():
+                out.extend(self._rows(data, start, end, dept))
+            self._all = out
+        return self._all
+
+    def available(self) -> bool:
+        return bool(self._current())
+
+    def built(self) -> bool:
+        """True only for a builder-produced cache (not the legacy roster.json fallback)."""
+        return self._current().get("schema") == CACHE_SCHEMA
+
+# --- GLOBAL INSTANCE ---
+roster_cache = RosterCache()
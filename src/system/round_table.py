@@ -0,0 +1,235 @@
+"""
+REALM FORGE: ROUND TABLE ENGINE v1.0
+ARCHITECT: LEAD SWARM ENGINEER (MASTERMIND v31.4)
+STATUS: PRODUCTION READY - PARALLEL DELIBERATION - ROLLING TRANSCRIPT COMPRESSION
+PATH: F:/RealmForge_PROD/src/system/round_table.py
+"""
+
+import os
+import time
+import asyncio
+import logging
+from enum import Enum
+from dataclasses import dataclass, field, asdict
+from typing import List, Dict, Any, Optional
+
+from langchain_core.messages import SystemMessage
+
+logger = logging.getLogger("RoundTable")
+
+# ==============================================================================
+# 0. STRATEGIES & TELEMETRY MODELS
+# ==============================================================================
+
+class RoundTableStrategy(str, Enum):
+    """Deliberation modes for Meeting Mode."""
+    SEQUENTIAL = "SEQUENTIAL"              # Legacy turn-taking, bounded by rolling summaries
+    PARALLEL = "PARALLEL"                  # All specialists answer the topic at once
+    PARALLEL_SUMMARY = "PARALLEL_SUMMARY"  # Parallel round + one moderator synthesis round
+
+    @classmethod
+    def resolve(cls, value: Optional[str]) -> "RoundTableStrategy":
+        """Maps env/config strings onto a strategy, defaulting to PARALLEL_SUMMARY."""
+        if isinstance(value, cls): return value
+        try:
+            return cls((value or "").strip().upper())
+        except ValueError:
+            return cls.PARALLEL_SUMMARY
+
+@dataclass
+class ParticipantTelemetry:
+    """Per-call cost ledger for a single round-table contribution."""
+    name: str
+    role: str
+    round: str
+    prompt_tokens: int
+    completion_tokens: int
+    latency_ms: float
+    estimated: bool = False  # True when the provider did not report usage
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+@dataclass
+class RoundTableResult:
+    """Outcome of a convened meeting: transcript, synthesis and cost telemetry."""
+    mission_id: str
+    strategy: str
+    transcript: List[str]
+    summary: str = ""
+    telemetry: List[ParticipantTelemetry] = field(default_factory=list)
+    wall_clock_ms: float = 0.0
+
+    def usage_report(self) -> Dict[str, Any]:
+        """Aggregated token/latency view for the HUD and the meeting archive."""
+        return {
+            "mission_id": self.mission_id,
+            "strategy": self.strategy,
+            "wall_clock_ms": round(self.wall_clock_ms, 1),
+            "total_prompt_tokens": sum(t.prompt_tokens for t in self.telemetry),
+            "total_completion_tokens": sum(t.completion_tokens for t in self.telemetry),
+            "participants": [{**asdict(t), "total_tokens": t.total_tokens} for t in self.telemetry],
+        }
+
+# ==============================================================================
+# 1. USAGE EXTRACTION
+# ==============================================================================
+
+def estimate_tokens(text: str) -> int:
+    """Cheap 4-chars-per-token heuristic used when the provider omits usage data."""
+    return max(1, len(text or "") // 4)
+
+def extract_usage(res: Any, prompt: str) -> Dict[str, Any]:
+    """Reads token usage from LangChain responses (usage_metadata or Groq token_usage)."""
+    text = res.content if hasattr(res, "content") else str(res)
+    usage = getattr(res, "usage_metadata", None) or {}
+    if usage.get("input_tokens") is not None:
+        return {"prompt_tokens": int(usage.get("input_tokens", 0)),
+                "completion_tokens": int(usage.get("output_tokens", 0)), "estimated": False}
+
+    meta = (getattr(res, "response_metadata", None) or {}).get("token_usage") or {}
+    if meta.get("prompt_tokens") is not None:
+        return {"prompt_tokens": int(meta.get("prompt_tokens", 0)),
+                "completion_tokens": int(meta.get("completion_tokens", 0)), "estimated": False}
+
+    return {"prompt_tokens": estimate_tokens(prompt), "completion_tokens": estimate_tokens(text), "estimated": True}
+
+# ==============================================================================
+# 2. THE ENGINE
+# ==============================================================================
+
+class RoundTableEngine:
+    """
+    Meeting Mode executor.
+    Replaces the O(n^2) sequential transcript replay with a parallel first round,
+    an optional moderator synthesis round and a rolling summary that caps every prompt.
+    """
+
+    def __init__(
+        self,
+        llm,
+        strategy: Optional[str] = None,
+        max_concurrency: int = 8,
+        summary_budget_chars: int = 2400,
+        live_window: int = 3,
+    ):
+        self.llm = llm
+        self.strategy = RoundTableStrategy.resolve(strategy or os.getenv("REALM_ROUND_TABLE_STRATEGY"))
+        self.semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self.summary_budget_chars = summary_budget_chars
+        self.live_window = max(1, live_window)
+
+    async def _invoke(self, prompt: str, name: str, role: str, round_label: str, telemetry: List[ParticipantTelemetry]) -> str:
+        """Single metered LLM call; failures become transcript notes instead of aborting the meeting."""
+        async with self.semaphore:
+            t0 = time.perf_counter()
+            try:
+                res = await self.llm.ainvoke([SystemMessage(content=prompt)])
+            except Exception as e:
+                logger.warning(f"⚠️ [ROUND_TABLE]: {name} dropped from {round_label}: {e}")
+                res = f"(no contribution: {e})"
+            latency_ms = (time.perf_counter() - t0) * 1000
+
+        usage = extract_usage(res, prompt)
+        telemetry.append(ParticipantTelemetry(name=name, role=role, round=round_label, latency_ms=round(latency_ms, 1), **usage))
+        return res.content if hasattr(res, "content") else str(res)
+
+    # --- ROLLING TRANSCRIPT COMPRESSION ---
+
+    async def _compress(self, summary: str, overflow: List[str], topic: str, telemetry: List[ParticipantTelemetry]) -> str:
+        """Folds contributions that left the live window into the rolling summary."""
+        prompt = f"""
+        ROLE: Round Table Scribe
+        MEETING TOPIC: {topic}
+        SUMMARY SO FAR: {summary or '(none)'}
+        NEW CONTRIBUTIONS:
+        {chr(10).join(overflow)}
+
+        Update the summary so it keeps every decision, owner and open risk.
+        Hard limit: {self.summary_budget_chars} characters. Return the summary only.
+        """
+        text = await self._invoke(prompt, "Scribe", "Transcript_Compressor", "compression", telemetry)
+        return text.strip()[: self.summary_budget_chars]
+
+    def _context_block(self, summary: str, live: List[str]) -> str:
+        block = f"ROLLING SUMMARY: {summary}\n" if summary else ""
+        return block + ("RECENT CONTRIBUTIONS:\n" + "\n".join(live) if live else "")
+
+    # --- ROUNDS ---
+
+    def _specialist_prompt(self, p: Dict[str, Any], topic: str, context: str = "") -> str:
+        return f"""
+        IDENTITY: {p.get('name')} | ROLE: {p.get('role')}
+        MEETING TOPIC: {topic}
+        {context}
+
+        Provide your expert industrial input for this mission.
+        Be concise, technical, and focus on your sector's contribution.
+        """
+
+    async def _parallel_round(self, participants: List[Dict[str, Any]], topic: str, telemetry: List[ParticipantTelemetry]) -> List[str]:
+        """Round 1: every specialist answers the topic concurrently with no transcript."""
+        replies = await asyncio.gather(*[
+            self._invoke(self._specialist_prompt(p, topic), p.get("name"), p.get("role"), "round_1", telemetry)
+            for p in participants
+        ])
+        return [f"[{p.get('name')} - {p.get('role')}]: {r}" for p, r in zip(participants, replies)]
+
+    async def _sequential_round(self, participants: List[Dict[str, Any]], topic: str, telemetry: List[ParticipantTelemetry]):
+        """Turn-taking round where each prompt sees the rolling summary plus a fixed live window."""
+        transcript, live, summary = [], [], ""
+        for p in participants:
+            prompt = self._specialist_prompt(p, topic, self._context_block(summary, live))
+            reply = await self._invoke(prompt, p.get("name"), p.get("role"), "round_1", telemetry)
+            entry = f"[{p.get('name')} - {p.get('role')}]: {reply}"
+            transcript.append(entry)
+            live.append(entry)
+            if len(live) > self.live_window:
+                overflow, live = live[:-self.live_window], live[-self.live_window:]
+                summary = await self._compress(summary, overflow, topic, telemetry)
+        return transcript, summary
+
+    async def _summary_round(self, contributions: List[str], topic: str, telemetry: List[ParticipantTelemetry]) -> str:
+        """Optional moderator synthesis; oversized inputs are compressed first so the prompt stays bounded."""
+        summary, live = "", list(contributions)
+        while sum(len(c) for c in live) > self.summary_budget_chars * 2 and len(live) > self.live_window:
+            overflow, live = live[:-self.live_window], live[-self.live_window:]
+            summary = await self._compress(summary, overflow, topic, telemetry)
+
+        prompt = f"""
+        ROLE: Round Table Moderator
+        MEETING TOPIC: {topic}
+        {self._context_block(summary, live)}
+
+        Synthesize a single action plan: decisions, owners per silo, and open risks.
+        """
+        return await self._invoke(prompt, "Moderator", "Round_Table_Synthesis", "summary", telemetry)
+
+    async def convene(self, mission_id: str, participants: List[Dict[str, Any]], topic: str) -> RoundTableResult:
+        """Runs the meeting under the configured strategy and returns transcript plus telemetry."""
+        telemetry: List[ParticipantTelemetry] = []
+        t0 = time.perf_counter()
+        summary = ""
+
+        if self.strategy == RoundTableStrategy.SEQUENTIAL:
+            contributions, summary = await self._sequential_round(participants, topic, telemetry)
+        else:
+            contributions = await self._parallel_round(participants, topic, telemetry)
+            if self.strategy == RoundTableStrategy.PARALLEL_SUMMARY:
+                summary = await self._summary_round(contributions, topic, telemetry)
+
+        result = RoundTableResult(
+            mission_id=mission_id,
+            strategy=self.strategy.value,
+            transcript=[f"--- ROUND TABLE: {mission_id} ---"] + contributions,
+            summary=summary,
+            telemetry=telemetry,
+            wall_clock_ms=(time.perf_counter() - t0) * 1000,
+        )
+        report = result.usage_report()
+        logger.info(
+            f"🤝 [ROUND_TABLE] {mission_id} ({result.strategy}): {len(participants)} specialists | "
+            f"{report['total_prompt_tokens']}+{report['total_completion_tokens']} tokens | {report['wall_clock_ms']}ms"
+        )
+        return result
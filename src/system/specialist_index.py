@@ -0,0 +1,219 @@
+"""
+REALM FORGE: SPECIALIST INDEX v1.0
+ARCHITECT: LEAD SWARM ENGINEER (MASTERMIND v31.4)
+STATUS: PRODUCTION READY - SILO ALIAS MAP - TOOL/SKILL BITSETS - ALIAS-METHOD SAMPLING - LOAD LEASES
+PATH: F:/RealmForge_PROD/src/system/specialist_index.py
+"""
+
+import os
+import json
+import time
+import random
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.system.manifest_pipeline import load_manifest_file
+
+logger = logging.getLogger("SpecialistIndex")
+
+LATTICE_PATH = Path(os.getenv("REALM_LATTICE_PATH", "F:/RealmForge_PROD/master_departmental_lattice.json"))
+LEASE_TTL_S = float(os.getenv("REALM_SPECIALIST_LEASE_S", "900"))  # Crashed missions stop counting as load
+MATCH_BOOST = 4.0       # Weight multiplier for an agent holding every planned tool
+SKILL_BOOST = 2.0       # ...and for one holding every requested skill
+MAX_REJECTIONS = 8      # Load-rejection draws before falling back to the least-loaded sampled agent
+ALIAS_CACHE_SIZE = 256
+
+def _normalize(silo: str) -> str:
+    return (silo or "").strip().lower().replace(" ", "_").replace("-", "_")
+
+def _popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+# ==============================================================================
+# 0. ALIAS TABLE (Vose)
+# ==============================================================================
+
+class AliasTable:
+    """O(n) build, O(1) draw from a fixed discrete distribution."""
+    __slots__ = ("prob", "alias")
+
+    def __init__(self, weights: List[float]):
+        n = len(weights)
+        total = sum(weights) or 1.0
+        scaled = [w * n / total for w in weights]
+        self.prob, self.alias = [1.0] * n, list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s], self.alias[s] = scaled[s], l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+    def draw(self, rng: random.Random) -> int:
+        i = rng.randrange(len(self.prob))
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+# ==============================================================================
+# 1. PER-SILO AGENT TABLE (array-backed columns)
+# ==============================================================================
+
+class SiloTable:
+    def __init__(self, silo: str, agents: List[Dict[str, Any]], silo_tools: List[str]):
+        self.silo = silo
+        self.agents = agents                      # Original lattice entries, returned to callers
+        self.names = [a.get("name") for a in agents]
+        self.position = {n: i for i, n in enumerate(self.names)}
+        self.silo_tools = silo_tools
+        self.tool_bits: List[int] = [0] * len(agents)
+        self.skill_bits: List[int] = [0] * len(agents)
+        self.inflight: List[int] = [0] * len(agents)
+        self.hydrated = False
+        self.alias_cache: "OrderedDict[Tuple[int, int], AliasTable]" = OrderedDict()
+
+class SpecialistIndex:
+    """
+    Silo alias -> SiloTable. Agents are drawn from an alias table weighted by how much of the planned
+    tool set their manifest holds, then accepted with probability 1/(1+in_flight) so idle agents win.
+    """
+
+    def __init__(self, lattice_path: Path = LATTICE_PATH, seed: Optional[int] = None):
+        self.lattice_path = Path(lattice_path)
+        self.tables: Dict[str, SiloTable] = {}
+        self.aliases: Dict[str, str] = {}
+        self.tool_bit: Dict[str, int] = {}
+        self.skill_bit: Dict[str, int] = {}
+        self.leases: Dict[str, Tuple[str, int, float]] = {}  # mission_id -> (silo, row, expires_at)
+        self.rng = random.Random(seed)
+        self._lock = threading.RLock()
+        self._loaded = False
+
+    # --- BUILD ---
+
+    def load(self, lattice: Optional[Dict[str, Any]] = None):
+        with self._lock:
+            if lattice is None:
+                if not self.lattice_path.exists():
+                    self._loaded = True
+                    return
+                with open(self.lattice_path, "r", encoding="utf-8-sig") as f:
+                    lattice = json.load(f)
+            self.tables.clear()
+            self.aliases.clear()
+            for silo, data in lattice.items():
+                self.tables[silo] = SiloTable(silo, list(data.get("agents", [])), list(data.get("tools", [])))
+                self.aliases[_normalize(silo)] = silo
+            self._loaded = True
+            logger.info(f"🗂️ [SPECIALIST_INDEX]: {sum(len(t.agents) for t in self.tables.values())} agents across {len(self.tables)} silos indexed.")
+
+    def _bits(self, names: Iterable[str], registry: Dict[str, int]) -> int:
+        mask = 0
+        for n in names or []:
+            if n not in registry: registry[n] = len(registry)
+            mask |= 1 << registry[n]
+        return mask
+
+    def _hydrate(self, table: SiloTable):
+        """First use of a silo: read each manifest once and fold tools/skills into bitsets."""
+        silo_mask = self._bits(table.silo_tools, self.tool_bit)
+        for i, agent in enumerate(table.agents):
+            _, dna, _ = load_manifest_file(agent.get("path", ""))
+            prof = (dna or {}).get("professional") or {}
+            tools, skills = prof.get("tools_assigned", []), prof.get("skills", [])
+            table.tool_bits[i] = self._bits(tools, self.tool_bit) or silo_mask
+            table.skill_bits[i] = self._bits(skills, self.skill_bit)
+        table.hydrated = True
+
+    def resolve(self, silo: str) -> Optional[SiloTable]:
+        if not self._loaded: self.load()
+        key = _normalize(silo)
+        name = self.aliases.get(key)
+        if name is None and key:
+            # Fuzzy alias (legacy substring rule), memoized so the scan runs once per spelling
+            name = next((s for k, s in list(self.aliases.items()) if key in k), None)
+            if name: self.aliases[key] = name
+        return self.tables.get(name) if name else None
+
+    def _mask(self, names: Optional[Iterable[str]], registry: Dict[str, int]) -> int:
+        mask = 0
+        for n in names or []:
+            if n in registry: mask |= 1 << registry[n]
+        return mask
+
+    def _alias_for(self, table: SiloTable, tool_mask: int, skill_mask: int) -> AliasTable:
+        key = (tool_mask, skill_mask)
+        cached = table.alias_cache.get(key)
+        if cached is not None:
+            table.alias_cache.move_to_end(key)
+            return cached
+        want_tools, want_skills = _popcount(tool_mask), _popcount(skill_mask)
+        weights = [
+            1.0
+            + (MATCH_BOOST * _popcount(tb & tool_mask) / want_tools if want_tools else 0.0)
+            + (SKILL_BOOST * _popcount(sb & skill_mask) / want_skills if want_skills else 0.0)
+            for tb, sb in zip(table.tool_bits, table.skill_bits)
+        ]
+        cached = table.alias_cache[key] = AliasTable(weights)
+        if len(table.alias_cache) > ALIAS_CACHE_SIZE:
+            table.alias_cache.popitem(last=False)
+        return cached
+
+    # --- SELECTION ---
+
+    def pick(self, silo: str, tools: Optional[Iterable[str]] = None, skills: Optional[Iterable[str]] = None,
+             mission_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            table = self.resolve(silo)
+            if table is None or not table.agents:
+                return None
+            if not table.hydrated:
+                self._hydrate(table)
+            self._expire()
+
+            alias = self._alias_for(table, self._mask(tools, self.tool_bit), self._mask(skills, self.skill_bit))
+
+            row, best = None, None
+            for _ in range(MAX_REJECTIONS):
+                i = alias.draw(self.rng)
+                if self.rng.random() < 1.0 / (1 + table.inflight[i]):
+                    row = i
+                    break
+                if best is None or table.inflight[i] < table.inflight[best]:
+                    best = i
+            row = best if row is None else row
+
+            if mission_id:
+                self._lease(mission_id, table, row)
+            return table.agents[row]
+
+    # --- LOAD ACCOUNTING ---
+
+    def _lease(self, mission_id: str, table: SiloTable, row: int):
+        self.release(mission_id)  # Handoff: the previous specialist is freed
+        table.inflight[row] += 1
+        self.leases[mission_id] = (table.silo, row, time.monotonic() + LEASE_TTL_S)
+
+    def release(self, mission_id: str):
+        with self._lock:
+            lease = self.leases.pop(mission_id, None)
+            if lease:
+                table = self.tables.get(lease[0])
+                if table and lease[1] < len(table.inflight):
+                    table.inflight[lease[1]] = max(0, table.inflight[lease[1]] - 1)
+
+    def _expire(self):
+        now = time.monotonic()
+        for mid in [m for m, lease in self.leases.items() if lease[2] < now]:
+            self.release(mid)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            busy = {t.silo: sum(t.inflight) for t in self.tables.values() if any(t.inflight)}
+            return {"silos": len(self.tables), "active_leases": len(self.leases), "inflight_by_silo": busy,
+                    "tools_indexed": len(self.tool_bit)}
+
+# --- GLOBAL INSTANCE ---
+specialist_index = SpecialistIndex()
@@ -0,0 +1,155 @@
+"""
+REALM FORGE: SPECULATIVE SENSOR ENGINE v1.0
+ARCHITECT: LEAD SWARM ENGINEER (MASTERMIND v31.4)
+STATUS: PRODUCTION READY - PLAN/SENSE OVERLAP - PER-MISSION REGISTRY - KEEP OR DISCARD ON PLAN LOCK
+PATH: F:/RealmForge_PROD/src/system/speculation.py
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from src.system.state import priority_rank
+
+logger = logging.getLogger("SpeculationEngine")
+
+SPECULATION_ENABLED = os.getenv("REALM_SPECULATE", "1") == "1"
+MAX_SPECULATIVE_PER_MISSION = int(os.getenv("REALM_SPECULATE_MAX", "8"))
+
+# Sensors with no side effects: safe to start before the plan is locked and to throw away after.
+# Network sensors are deliberately absent (rate limits make wasted calls expensive).
+READ_ONLY_TOOLS = frozenset({
+    "read_file",
+    "list_files",
+    "list_workspace_files",
+    "get_directory_tree",
+    "grep_files",
+    "csv_processor_read",
+    "read_excel_file",
+    "sqlite_inspect_schema",
+    "get_system_vitals",
+    "calculate_file_hash",
+    "hash_file_integrity",
+    "parse_log_file",
+    "detect_log_anomalies",
+    "inspect_agent_manifest",
+    "validate_agent_alignment",
+    "query_knowledge_graph",
+})
+
+Runner = Callable[[str, Dict[str, Any], Dict[str, Any]], Awaitable[Any]]
+
+def speculation_key(tool_name: str, args: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+    return tool_name, json.dumps(args or {}, sort_keys=True, default=str)
+
+@dataclass
+class SpeculativeRun:
+    tool_name: str
+    future: asyncio.Task
+    timing: Dict[str, Any] = field(default_factory=dict)
+    launched_at: float = field(default_factory=time.perf_counter)
+
+# ==============================================================================
+# 1. PER-MISSION SPECULATOR
+# ==============================================================================
+
+class MissionSpeculator:
+    """Holds the in-flight speculative sensor runs for one mission, keyed by (tool, canonical args)."""
+
+    def __init__(self, mission_id: str, runner: Runner):
+        self.mission_id = mission_id
+        self.runner = runner
+        self.runs: Dict[Tuple[str, str], SpeculativeRun] = {}
+        self.locked_at: Optional[float] = None
+
+    def launch(self, task: Dict[str, Any]) -> bool:
+        tool_name, args = task.get("tool"), task.get("args") or {}
+        if tool_name not in READ_ONLY_TOOLS or len(self.runs) >= MAX_SPECULATIVE_PER_MISSION:
+            return False
+        key = speculation_key(tool_name, args)
+        if key in self.runs:
+            return False
+        timing: Dict[str, Any] = {}
+        future = asyncio.ensure_future(self.runner(tool_name, dict(args), timing))
+        self.runs[key] = SpeculativeRun(tool_name, future, timing)
+        speculation_registry.stats["launched"] += 1
+        logger.info(f"🔮 [SPECULATE]: {self.mission_id} started {tool_name} ahead of plan lock.")
+        return True
+
+    def lock(self, final_tasks: Iterable[Dict[str, Any]]):
+        """
+        Plan finalized: keep runs the executor reaches before its first non-read-only step, cancel the rest.
+        `final_tasks` is the queue in arrival order; it is walked in the executor's order (TaskBacklog:
+        OPEN first, then priority, then arrival), so a HIGH write listed after a LOW read still wins.
+        A read the executor runs after a write (write_file -> read_file of the same path) ran too early.
+        """
+        self.locked_at = time.perf_counter()
+        tasks = [t for t in final_tasks if isinstance(t, dict)]
+        tasks.sort(key=lambda t: (t.get("status", "OPEN") != "OPEN", priority_rank(t.get("priority"))))  # Stable: arrival breaks ties
+        wanted = set()
+        for t in tasks:
+            if t.get("tool") not in READ_ONLY_TOOLS:
+                break
+            wanted.add(speculation_key(t.get("tool"), t.get("args")))
+        for key in [k for k in self.runs if k not in wanted]:
+            self._discard(key)
+
+    def claim(self, tool_name: str, args: Optional[Dict[str, Any]]) -> Optional[SpeculativeRun]:
+        run = self.runs.pop(speculation_key(tool_name, args), None)
+        if run is None:
+            return None
+        speculation_registry.stats["hits"] += 1
+        if run.future.done() and self.locked_at:
+            # Fully hidden behind planning: the whole run time is saved wall clock
+            speculation_registry.stats["overlap_ms"] += round(run.timing.get("run_ms", 0), 1)
+        elif self.locked_at:
+            speculation_registry.stats["overlap_ms"] += round((self.locked_at - run.launched_at) * 1000, 1)
+        return run
+
+    def _discard(self, key):
+        run = self.runs.pop(key)
+        if not run.future.done():
+            run.future.cancel()
+        elif not run.future.cancelled():
+            run.future.exception()  # Retrieve it so asyncio does not log an unhandled task exception
+        speculation_registry.stats["discarded"] += 1
+
+    def close(self):
+        for key in list(self.runs):
+            self._discard(key)
+
+# ==============================================================================
+# 2. REGISTRY
+# ==============================================================================
+
+class SpeculationRegistry:
+    """Mission id -> MissionSpeculator. Planner launches and locks; executor claims and releases."""
+
+    def __init__(self):
+        self.missions: Dict[str, MissionSpeculator] = {}
+        self.stats = {"launched": 0, "hits": 0, "discarded": 0, "overlap_ms": 0.0}
+
+    def open(self, mission_id: str, runner: Runner) -> Optional[MissionSpeculator]:
+        if not SPECULATION_ENABLED or not mission_id:
+            return None
+        self.release(mission_id)  # A replan supersedes the previous plan's speculation
+        spec = self.missions[mission_id] = MissionSpeculator(mission_id, runner)
+        return spec
+
+    def claim(self, mission_id: str, tool_name: str, args: Optional[Dict[str, Any]]) -> Optional[SpeculativeRun]:
+        spec = self.missions.get(mission_id)
+        return spec.claim(tool_name, args) if spec else None
+
+    def release(self, mission_id: str):
+        spec = self.missions.pop(mission_id, None)
+        if spec: spec.close()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {**self.stats, "active_missions": len(self.missions)}
+
+# --- GLOBAL INSTANCE ---
+speculation_registry = SpeculationRegistry()
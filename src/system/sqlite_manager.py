@@ -0,0 +1,196 @@
+"""
+REALM FORGE: SQLITE DATABASE MANAGER v1.0
+ARCHITECT: LEAD SWARM ENGINEER (MASTERMIND v31.4)
+STATUS: PRODUCTION READY - ONE WAL CONNECTION PER DB - OWNER THREADS - STATEMENT CACHE - GROUP COMMIT
+PATH: F:/RealmForge_PROD/src/system/sqlite_manager.py
+"""
+
+import os
+import queue
+import asyncio
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("SQLiteManager")
+
+STATEMENT_CACHE = int(os.getenv("REALM_SQLITE_STMT_CACHE", "256"))   # Compiled statements kept per connection
+MAX_OPEN_DBS = int(os.getenv("REALM_SQLITE_MAX_OPEN", "32"))
+GROUP_COMMIT_MAX = int(os.getenv("REALM_SQLITE_GROUP_MAX", "512"))    # Queued writes folded into one transaction
+
+@lru_cache(maxsize=1024)
+def insert_sql(table: str, columns: Tuple[str, ...]) -> str:
+    """Same (table, columns) -> same SQL text, so the connection's statement cache hits."""
+    cols = ", ".join(f'"{c}"' for c in columns)
+    return f'INSERT INTO "{table}" ({cols}) VALUES ({", ".join("?" * len(columns))})'
+
+# ==============================================================================
+# 1. PER-DATABASE OWNER THREAD
+# ==============================================================================
+
+class _Job:
+    __slots__ = ("fn", "args", "future", "write")
+
+    def __init__(self, fn: Callable[..., Any], args: tuple, write: bool):
+        self.fn, self.args, self.write, self.future = fn, args, write, Future()
+
+class DatabaseWorker:
+    """
+    Owns the only connection to one database file. Jobs run in submission order; consecutive queued
+    writes share one transaction (each inside its own SAVEPOINT, so one failure does not sink the rest).
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._jobs: "queue.Queue[Optional[_Job]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=f"sqlite:{self.path.name}", daemon=True)
+        self._thread.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), isolation_level=None, cached_statements=STATEMENT_CACHE)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    def submit(self, fn: Callable[..., Any], *args, write: bool = False) -> Future:
+        job = _Job(fn, args, write)
+        self._jobs.put(job)
+        return job.future
+
+    def close(self):
+        self._jobs.put(None)
+
+    @staticmethod
+    def _settle(job: _Job, fn: Callable[[], Any]):
+        if not job.future.set_running_or_notify_cancel():
+            return
+        try:
+            job.future.set_result(fn())
+        except BaseException as e:
+            job.future.set_exception(e)
+
+    def _run(self):
+        try:
+            conn = self._connect()
+        except Exception as e:
+            logger.error(f"❌ [SQLITE]: Cannot open {self.path}: {e}")
+            while True:
+                job = self._jobs.get()
+                if job is None: return
+                if job.future.set_running_or_notify_cancel(): job.future.set_exception(e)
+        try:
+            held: List[Optional[_Job]] = []  # A non-write pulled while batching runs next, keeping FIFO order
+            while True:
+                job = held.pop() if held else self._jobs.get()
+                if job is None:
+                    return
+                if not job.write:
+                    self._settle(job, lambda: job.fn(conn, *job.args))
+                    continue
+                batch = [job]
+                while len(batch) < GROUP_COMMIT_MAX:
+                    try:
+                        nxt = self._jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                    if nxt is None or not nxt.write:
+                        held.append(nxt)
+                        break
+                    batch.append(nxt)
+                self._write_batch(conn, batch)
+        finally:
+            conn.close()
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: List[_Job]):
+        results: List[Tuple[_Job, bool, Any]] = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for job in batch:
+                conn.execute("SAVEPOINT job")
+                try:
+                    results.append((job, True, job.fn(conn, *job.args)))
+                    conn.execute("RELEASE job")
+                except Exception as e:
+                    conn.execute("ROLLBACK TO job")
+                    conn.execute("RELEASE job")
+                    results.append((job, False, e))
+            conn.execute("COMMIT")
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            results = [(job, False, e) for job in batch]
+        for job, ok, value in results:
+            if job.future.set_running_or_notify_cancel():
+                job.future.set_result(value) if ok else job.future.set_exception(value)
+
+# ==============================================================================
+# 2. THE MANAGER
+# ==============================================================================
+
+class SQLiteManager:
+    """Path -> DatabaseWorker, LRU-bounded. Async wrappers await the owner thread without blocking the loop."""
+
+    def __init__(self, max_open: int = MAX_OPEN_DBS):
+        self.max_open = max_open
+        self._workers: "OrderedDict[str, DatabaseWorker]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def worker(self, path: Path) -> DatabaseWorker:
+        key = str(Path(path).resolve())
+        with self._lock:
+            w = self._workers.get(key)
+            if w is None:
+                w = self._workers[key] = DatabaseWorker(Path(key))
+                if len(self._workers) > self.max_open:
+                    _, old = self._workers.popitem(last=False)
+                    old.close()  # Drains its queue first, then closes the connection
+            else:
+                self._workers.move_to_end(key)
+            return w
+
+    async def run(self, path: Path, fn: Callable[..., Any], *args, write: bool = False) -> Any:
+        return await asyncio.wrap_future(self.worker(path).submit(fn, *args, write=write))
+
+    # --- ASYNC CONVENIENCE ---
+
+    async def execute(self, path: Path, sql: str, params: Sequence[Any] = ()) -> int:
+        return await self.run(path, lambda c: c.execute(sql, params).rowcount, write=True)
+
+    async def query(self, path: Path, sql: str, params: Sequence[Any] = (), limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        def _q(conn: sqlite3.Connection):
+            cur = conn.execute(sql, params)
+            names = [d[0] for d in cur.description or ()]
+            rows = cur.fetchmany(limit) if limit else cur.fetchall()
+            return [dict(zip(names, r)) for r in rows]
+        return await self.run(path, _q)
+
+    async def insert(self, path: Path, table: str, row: Dict[str, Any]) -> int:
+        """Single row; concurrent callers are group-committed by the owner thread."""
+        cols = tuple(row)
+        return await self.run(path, lambda c: c.execute(insert_sql(table, cols), tuple(row.values())).rowcount, write=True)
+
+    async def insert_many(self, path: Path, table: str, rows: Iterable[Dict[str, Any]]) -> int:
+        """executemany per column layout, all inside one transaction."""
+        groups: Dict[Tuple[str, ...], List[tuple]] = {}
+        for row in rows:
+            groups.setdefault(tuple(row), []).append(tuple(row.values()))
+        def _bulk(conn: sqlite3.Connection):
+            return sum(conn.executemany(insert_sql(table, cols), values).rowcount for cols, values in groups.items())
+        return await self.run(path, _bulk, write=True)
+
+    def close_all(self):
+        with self._lock:
+            for w in self._workers.values():
+                w.close()
+            self._workers.clear()
+
+# --- GLOBAL INSTANCE ---
+sqlite_manager = SQLiteManager()
@@ -0,0 +1,82 @@
+"""
+REALM FORGE: STARTUP PROFILER v1.0
+ARCHITECT: LEAD SWARM ENGINEER (MASTERMIND v31.4)
+STATUS: PRODUCTION READY - PHASED BRAIN IGNITION - WALL TIME & RSS ATTRIBUTION
+PATH: F:/RealmForge_PROD/src/system/startup_profiler.py
+"""
+
+import os
+import sys
+import time
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, List
+
+logger = logging.getLogger("StartupProfiler")
+
+# Modules whose presence in sys.modules is worth calling out (multi-hundred-MB imports)
+HEAVY_MODULES = ("torch", "transformers", "chromadb", "onnxruntime", "langchain_community", "pandas", "playwright")
+
+def _rss_mb() -> float:
+    try:
+        import psutil
+        return psutil.Process(os.getpid()).memory_info().rss / (1024 * 1024)
+    except Exception:
+        try:
+            import resource  # POSIX fallback: peak RSS (KiB on Linux)
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        except Exception:
+            return 0.0
+
+@dataclass
+class PhaseRecord:
+    name: str
+    wall_ms: float
+    rss_delta_mb: float
+    rss_after_mb: float
+    modules_loaded: int
+    heavy_loaded: List[str]
+
+class StartupProfiler:
+    """Wraps each brain-ignition phase and attributes wall time, RSS growth and heavy imports to it."""
+
+    def __init__(self):
+        self.phases: List[PhaseRecord] = []
+        self.baseline_rss_mb = _rss_mb()
+
+    @contextmanager
+    def phase(self, name: str):
+        rss0, mods0, heavy0 = _rss_mb(), len(sys.modules), {m for m in HEAVY_MODULES if m in sys.modules}
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            rss1 = _rss_mb()
+            self.phases.append(PhaseRecord(
+                name=name,
+                wall_ms=round((time.perf_counter() - t0) * 1000, 1),
+                rss_delta_mb=round(rss1 - rss0, 1),
+                rss_after_mb=round(rss1, 1),
+                modules_loaded=len(sys.modules) - mods0,
+                heavy_loaded=sorted(m for m in HEAVY_MODULES if m in sys.modules and m not in heavy0),
+            ))
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "baseline_rss_mb": round(self.baseline_rss_mb, 1),
+            "current_rss_mb": round(_rss_mb(), 1),
+            "total_phase_ms": round(sum(p.wall_ms for p in self.phases), 1),
+            "torch_loaded": "torch" in sys.modules,
+            "phases": [asdict(p) for p in self.phases],
+        }
+
+    def log_report(self):
+        r = self.report()
+        logger.info(f"⏱️ [STARTUP] {r['total_phase_ms']}ms across {len(self.phases)} phases | RSS {r['current_rss_mb']}MB | torch loaded: {r['torch_loaded']}")
+        for p in self.phases:
+            heavy = f" | heavy: {', '.join(p.heavy_loaded)}" if p.heavy_loaded else ""
+            logger.info(f"   ↳ {p.name:<14} {p.wall_ms:>9.1f}ms  {p.rss_delta_mb:>+8.1f}MB  ({p.modules_loaded} modules){heavy}")
+
+# --- GLOBAL INSTANCE ---
+startup_profiler = StartupProfiler()
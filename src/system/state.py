@@ -5,37 +5,87 @@ STATUS: PRODUCTION READY - IDEMPOTENCY LOCKS - BENTO-GRID TELEMETRY
 PATH: F:/RealmForge_PROD/src/system/state.py
 """
 
-import operator
+import heapq
 import uuid
+from collections.abc import MutableSet
 from datetime import datetime
-from typing import Annotated, List, Dict, Any, TypedDict, Union, Optional, Set
+from typing import Annotated, List, Dict, Any, TypedDict, Union, Optional, Set, Iterable
 from langchain_core.messages import BaseMessage
+from src.system.compaction import window_messages, intern
 
 # ==============================================================================
 # 0. REDUCER LOGIC (KINETIC STATE SYNCHRONIZATION)
 # ==============================================================================
 
-def merge_tasks(existing: List[Dict], new: List[Dict]) -> List[Dict]:
-    """Sovereign Task Merger: Ensures the mission backlog is unique and sorted."""
-    if not isinstance(existing, list): existing = []
-    if not isinstance(new, list): new = []
-    
-    task_map = {t.get('id'): t for t in existing if t.get('id')}
-    
-    for t in new:
-        if not isinstance(t, dict): continue
+# Numeric priority ladder (lower pops first). Integers in task['priority'] are used as-is.
+PRIORITY_RANK = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
+
+def priority_rank(value: Any) -> int:
+    if isinstance(value, (int, float)) and not isinstance(value, bool): return int(value)
+    return PRIORITY_RANK.get(str(value or "MEDIUM").upper(), PRIORITY_RANK["MEDIUM"])
+
+class TaskBacklog:
+    """
+    Incremental mission backlog: an insertion-ordered id -> task dict plus a lazy-deletion heap
+    keyed on (status, numeric priority, arrival). Merges cost O(delta log n) instead of a full re-sort.
+    Owned by the task_queue channel and updated in place by merge_tasks.
+    """
+    __slots__ = ("_tasks", "_heap", "_arrival", "_version", "_ordered")
+
+    def __init__(self, tasks: Optional[List[Dict]] = None):
+        self._tasks: Dict[str, Dict] = {}
+        self._heap: List[tuple] = []          # (is_closed, priority, arrival, version, id)
+        self._arrival: Dict[str, int] = {}    # Stable tie-break: first-seen order
+        self._version: Dict[str, int] = {}    # Heap entries with an older version are stale
+        self._ordered: Optional[List[Dict]] = None
+        self.merge(tasks or [])
+
+    def upsert(self, t: Dict):
         tid = t.get('id') or f"task_{uuid.uuid4().hex[:6]}"
         t['id'] = tid
-        
-        if tid in task_map:
-            task_map[tid] = {**task_map[tid], **t} # Update existing
+        if tid in self._tasks:
+            t = {**self._tasks[tid], **t}  # Update existing
         else:
-            task_map[tid] = t # Append new
+            self._arrival[tid] = len(self._arrival)
+        self._tasks[tid] = t
+        self._version[tid] = self._version.get(tid, 0) + 1
+        key = (t.get('status', 'OPEN') != 'OPEN', priority_rank(t.get('priority')))
+        heapq.heappush(self._heap, (*key, self._arrival[tid], self._version[tid], tid))
+        self._ordered = None
+
+    def merge(self, new: List[Dict]) -> "TaskBacklog":
+        for t in new:
+            if isinstance(t, dict): self.upsert(t)
+        # Compact once stale heap entries dominate (amortized O(1) per update)
+        if len(self._heap) > 2 * len(self._tasks) + 64:
+            self._heap = [e for e in self._heap if self._version.get(e[-1]) == e[-2]]
+            heapq.heapify(self._heap)
+        return self
+
+    def peek(self) -> Optional[Dict]:
+        """Highest-priority OPEN-first task in O(log n) amortized."""
+        while self._heap and self._version.get(self._heap[0][-1]) != self._heap[0][-2]:
+            heapq.heappop(self._heap)
+        return self._tasks[self._heap[0][-1]] if self._heap else None
+
+    def to_list(self) -> List[Dict]:
+        """Priority-ordered snapshot; cached until the next merge."""
+        if self._ordered is None:
+            live = sorted(e for e in self._heap if self._version.get(e[-1]) == e[-2])
+            self._ordered = [self._tasks[e[-1]] for e in live]
+        return self._ordered
 
-    return sorted(
-        list(task_map.values()), 
-        key=lambda x: (x.get('status', 'OPEN') != 'OPEN', x.get('priority', 'MEDIUM'), x.get('id', ''))
-    )
+    def __iter__(self): return iter(self.to_list())
+    def __len__(self): return len(self._tasks)
+    def __getitem__(self, i): return self.to_list()[i]
+    def __contains__(self, tid): return tid in self._tasks
+    def __repr__(self): return f"TaskBacklog({len(self._tasks)} tasks)"
+
+def merge_tasks(existing: List[Dict], new: List[Dict]) -> "TaskBacklog":
+    """Sovereign Task Merger: Ensures the mission backlog is unique and priority-ordered (O(delta))."""
+    backlog = existing if isinstance(existing, TaskBacklog) else TaskBacklog(existing if isinstance(existing, list) else [])
+    if isinstance(new, TaskBacklog): new = new.to_list()
+    return backlog.merge(new if isinstance(new, list) else [])
 
 def merge_vitals(existing: Dict, new: Dict) -> Dict:
     """Telemetry Merger: Updates real-time HUD vitals without losing historical keys."""
@@ -62,9 +112,35 @@ def merge_genesis_protocol(existing: Dict[str, bool], new: Dict[str, bool]) -> D
     if not new: return existing
     return {**existing, **new}
 
-def deduplicate_artifacts(existing: List[str], new: List[str]) -> List[str]:
-    """Ensures file paths/hashes in the IronClad registry are unique."""
-    return list(set((existing or []) + (new or [])))
+class OrderedSet(MutableSet):
+    """Insertion-ordered set backed by a dict: O(1) add/contains, deterministic iteration."""
+    __slots__ = ("_items",)
+
+    def __init__(self, items: Optional[Iterable] = None):
+        self._items: Dict[Any, None] = dict.fromkeys(items or ())
+
+    def __contains__(self, item): return item in self._items
+    def __iter__(self): return iter(self._items)
+    def __len__(self): return len(self._items)
+    def __repr__(self): return f"OrderedSet({list(self._items)!r})"
+    def add(self, item): self._items[item] = None
+    def discard(self, item): self._items.pop(item, None)
+
+    def extend(self, items: Iterable) -> "OrderedSet":
+        for item in items: self._items[item] = None
+        return self
+
+    def to_list(self) -> List[Any]:
+        return list(self._items)
+
+def merge_ordered(existing: Iterable, new: Iterable) -> OrderedSet:
+    """Union reducer: appends only unseen entries (O(delta)) and keeps first-seen order."""
+    target = existing if isinstance(existing, OrderedSet) else OrderedSet(existing)
+    return target.extend(new or ())
+
+def deduplicate_artifacts(existing: List[str], new: List[str]) -> OrderedSet:
+    """Ensures file paths/hashes in the IronClad registry are unique, in first-seen order."""
+    return merge_ordered(existing, new)
 
 # ==============================================================================
 # 1. STATE DEFINITION (THE TITAN-INDUSTRIAL SCHEMA)
@@ -77,7 +153,7 @@ class RealmForgeState(TypedDict):
     v20.0: Optimized for 13-Silo Bento Grid UI.
     """
     # --- 1. CORE COMMUNICATION ---
-    messages: Annotated[List[BaseMessage], operator.add]
+    messages: Annotated[List[BaseMessage], window_messages] # Pinned directive + digest + live window
     mission_id: str
     intent: str            # "INDUSTRIAL_STRIKE", "INTEL_RECON", etc.
     semantic_params: Dict[str, Any] # Captured entities from NLC
@@ -94,26 +170,44 @@ class RealmForgeState(TypedDict):
     handoff_history: Annotated[List[Dict[str, str]], track_handoffs] 
     
     # --- 4. TASK MANAGEMENT ---
-    task_queue: Annotated[List[Dict[str, Any]], merge_tasks] 
+    task_queue: Annotated[TaskBacklog, merge_tasks] 
     genesis_tasks: Annotated[Dict[str, bool], merge_genesis_protocol] 
     
     # --- 5. DATA LATTICE & ARTIFACTS ---
     memory_context: str
-    artifacts: Annotated[List[str], deduplicate_artifacts]
+    artifacts: Annotated[OrderedSet, deduplicate_artifacts]
     tool_results: Dict[str, Any] # NEW: Results from the 180-tool registry
     
     # --- 6. TELEMETRY & DIAGNOSTICS ---
     vitals: Annotated[Dict[str, Any], merge_vitals]
     diagnostic_stream: Annotated[List[str], buffer_diagnostics]
-    mission_locks: Annotated[Set[str], operator.or_] 
+    mission_locks: Annotated[OrderedSet, merge_ordered] 
     
     # --- 7. METADATA ---
     metadata: Dict[str, Any]
+    resume_from: str       # Entry node when a mission is rebuilt from the journal
 
 # ==============================================================================
 # 2. INITIALIZATION (THE CLEAN SLATE)
 # ==============================================================================
 
+# Static per-deployment metadata: interned once, shared by reference across every mission.
+GENESIS_DEFAULTS = intern("genesis_tasks", {
+    "silo_alignment_verification": True,
+    "workforce_audit_init": True,
+    "arsenal_180_verification": True,
+    "lattice_node_ingestion": True,
+    "discord_webhook_sync": True
+})
+
+SILO_DISTRIBUTION = intern("silo_distribution", {
+    "Architect": 86, "Data_Intelligence": 86, "Software_Engineering": 86,
+    "DevOps_Infrastructure": 86, "Cybersecurity": 86, "Financial_Ops": 86,
+    "Legal_Compliance": 86, "Research_Development": 86, "Executive_Board": 86,
+    "Marketing_PR": 86, "Human_Capital": 86, "Quality_Assurance": 86,
+    "Facility_Management": 81
+})
+
 def get_initial_state() -> RealmForgeState:
     """
     Titan Factory: Initializes the swarm in production mode.
@@ -136,13 +230,7 @@ def get_initial_state() -> RealmForgeState:
         "meeting_participants": ["ForgeMaster"],
         "handoff_history": [],
         "task_queue": [],
-        "genesis_tasks": {
-            "silo_alignment_verification": True,
-            "workforce_audit_init": True,
-            "arsenal_180_verification": True,
-            "lattice_node_ingestion": True,
-            "discord_webhook_sync": True
-        },
+        "genesis_tasks": GENESIS_DEFAULTS,
         "memory_context": "Neural uplink stable. F:/ drive pressurized. Awaiting directive.",
         "artifacts": [],
         "tool_results": {},
@@ -152,13 +240,7 @@ def get_initial_state() -> RealmForgeState:
             "latency": 0.0, 
             "lattice_nodes": 13472,
             "active_sector": "Architect",
-            "silo_distribution": {
-                "Architect": 86, "Data_Intelligence": 86, "Software_Engineering": 86,
-                "DevOps_Infrastructure": 86, "Cybersecurity": 86, "Financial_Ops": 86,
-                "Legal_Compliance": 86, "Research_Development": 86, "Executive_Board": 86,
-                "Marketing_PR": 86, "Human_Capital": 86, "Quality_Assurance": 86,
-                "Facility_Management": 81
-            }
+            "silo_distribution": SILO_DISTRIBUTION
         },
         "diagnostic_stream": [f"[{datetime.now().strftime('%H:%M:%S')}] RE-PRESSURIZATION COMPLETE. LATTICE READY."],
         "mission_locks": set(),
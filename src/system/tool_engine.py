@@ -0,0 +1,220 @@
+"""
+REALM FORGE: TOOL EXECUTION ENGINE v1.0
+ARCHITECT: LEAD SWARM ENGINEER (MASTERMIND v31.4)
+STATUS: PRODUCTION READY - EXECUTION CLASSES - ISOLATED WORKER POOLS - QUEUE TELEMETRY
+PATH: F:/RealmForge_PROD/src/system/tool_engine.py
+"""
+
+import os
+import time
+import asyncio
+import logging
+from enum import Enum
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger("ToolEngine")
+
+# ==============================================================================
+# 0. EXECUTION CLASSES (DECLARED PER TOOL)
+# ==============================================================================
+
+class ExecutionClass(str, Enum):
+    """Where a tool is allowed to burn time without freezing the HUD event loop."""
+    ASYNC_IO = "ASYNC_IO"   # Native coroutine (httpx, playwright, edge-tts) - stays on the loop
+    THREAD = "THREAD"       # Blocking I/O or GIL-releasing C code (sqlite3, zipfile, hashlib, subprocess)
+    PROCESS = "PROCESS"     # CPU-bound Python (pandas full scans, pagerank, reportlab layout)
+
+# Tools not listed here are ASYNC_IO. The sqlite_* tools are ASYNC_IO on purpose: they await the
+# per-database owner thread in src/system/sqlite_manager.py instead of borrowing a pool thread.
+TOOL_EXECUTION_CLASSES: Dict[str, ExecutionClass] = {
+    # --- CPU-BOUND (PROCESS POOL) ---
+    "validate_email_list": ExecutionClass.PROCESS,
+    "merge_csv_files": ExecutionClass.PROCESS,
+    "graph_centrality_analysis": ExecutionClass.PROCESS,
+    "graph_find_path": ExecutionClass.PROCESS,
+    "generate_corporate_invoice": ExecutionClass.PROCESS,
+    "generate_corporate_document": ExecutionClass.PROCESS,
+    "create_investor_deck": ExecutionClass.PROCESS,
+
+    # --- BLOCKING I/O (THREAD POOL) ---
+    "archive_workspace": ExecutionClass.THREAD,
+    "zip_directory": ExecutionClass.THREAD,
+    "unzip_file": ExecutionClass.THREAD,
+    "backup_memory_db": ExecutionClass.THREAD,
+    "create_client_workspace": ExecutionClass.THREAD,
+    "scaffold_commercial_website": ExecutionClass.THREAD,
+    "scaffold_industrial_project": ExecutionClass.THREAD,
+    "calculate_file_hash": ExecutionClass.THREAD,
+    "hash_file_integrity": ExecutionClass.THREAD,
+    "copy_internal_file": ExecutionClass.THREAD,
+    "move_internal_file": ExecutionClass.THREAD,
+    "csv_processor_read": ExecutionClass.THREAD,
+    "industrial_data_ingress": ExecutionClass.THREAD,   # mmap newline scan + header parse only
+    "csv_processor_write": ExecutionClass.THREAD,
+    "convert_csv_to_markdown_table": ExecutionClass.THREAD,
+    "read_excel_file": ExecutionClass.THREAD,
+    "write_csv_report": ExecutionClass.THREAD,
+    "get_stock_history_csv": ExecutionClass.THREAD,
+    "analyze_stock_technicals": ExecutionClass.THREAD,
+    "get_market_intelligence": ExecutionClass.THREAD,
+    "convert_currency": ExecutionClass.THREAD,
+    "get_crypto_price": ExecutionClass.THREAD,
+    "web_search_duckduckgo": ExecutionClass.THREAD,
+    "web_search_news": ExecutionClass.THREAD,
+    "query_knowledge_graph": ExecutionClass.THREAD,
+    "update_knowledge_graph": ExecutionClass.THREAD,
+    "grep_files": ExecutionClass.THREAD,
+    "lattice_scout_search": ExecutionClass.THREAD,
+    "get_directory_tree": ExecutionClass.THREAD,
+    "list_workspace_files": ExecutionClass.THREAD,
+    "detect_log_anomalies": ExecutionClass.THREAD,
+    "parse_log_file": ExecutionClass.THREAD,
+    "deduplicate_lines": ExecutionClass.THREAD,
+    "duplicate_agent": ExecutionClass.THREAD,
+    "self_evolve": ExecutionClass.THREAD,
+    "inspect_agent_manifest": ExecutionClass.THREAD,
+    "validate_agent_alignment": ExecutionClass.THREAD,
+    "get_system_vitals": ExecutionClass.THREAD,
+    "dns_lookup_records": ExecutionClass.THREAD,
+    "create_qr_code": ExecutionClass.THREAD,
+    "create_business_card_qr": ExecutionClass.THREAD,
+}
+
+def get_execution_class(tool_name: str) -> ExecutionClass:
+    return TOOL_EXECUTION_CLASSES.get(tool_name, ExecutionClass.ASYNC_IO)
+
+# ==============================================================================
+# 1. WORKER ENTRYPOINTS (MUST STAY MODULE-LEVEL FOR PICKLING)
+# ==============================================================================
+
+def _run_tool_blocking(tool, args: Dict[str, Any]):
+    """Thread worker: drives the tool coroutine on a private event loop."""
+    return asyncio.run(tool.ainvoke(args))
+
+def _run_tool_in_process(tool_name: str, args: Dict[str, Any]):
+    """Process worker: resolves the tool by name inside the child (tool objects are not picklable)."""
+    from src.system.arsenal.registry import ALL_TOOLS_LIST
+    tool = next((t for t in ALL_TOOLS_LIST if getattr(t, "name", None) == tool_name), None)
+    if tool is None:
+        return f"[ERROR] Tool '{tool_name}' not present in worker registry."
+    from src.system.arsenal.results import ToolResult
+    result = asyncio.run(tool.ainvoke(args))
+    return result if isinstance(result, (ToolResult, str, bytes, int, float, dict, list, tuple, type(None))) else str(result)
+
+# ==============================================================================
+# 2. THE ENGINE
+# ==============================================================================
+
+class ToolExecutionEngine:
+    """
+    Routes tool invocations to the loop, a thread pool or a process pool.
+    Each class has its own concurrency ceiling so one heavy tool cannot starve missions or WebSockets.
+    """
+
+    def __init__(self, io_slots: Optional[int] = None, thread_workers: Optional[int] = None, process_workers: Optional[int] = None):
+        cpu = os.cpu_count() or 2
+        self.limits = {
+            ExecutionClass.ASYNC_IO: io_slots or int(os.getenv("REALM_IO_SLOTS", "32")),
+            ExecutionClass.THREAD: thread_workers or int(os.getenv("REALM_THREAD_WORKERS", str(min(16, cpu * 2)))),
+            ExecutionClass.PROCESS: process_workers or int(os.getenv("REALM_PROCESS_WORKERS", str(max(1, cpu - 1)))),
+        }
+        self._semaphores: Dict[ExecutionClass, asyncio.Semaphore] = {}
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._stats = {c: {"queued": 0, "in_flight": 0, "completed": 0, "queue_ms": deque(maxlen=200), "run_ms": deque(maxlen=200)} for c in ExecutionClass}
+
+    # --- LAZY POOL IGNITION ---
+
+    def _semaphore(self, cls: ExecutionClass) -> asyncio.Semaphore:
+        if cls not in self._semaphores:
+            self._semaphores[cls] = asyncio.Semaphore(self.limits[cls])
+        return self._semaphores[cls]
+
+    def _threads(self) -> ThreadPoolExecutor:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(max_workers=self.limits[ExecutionClass.THREAD], thread_name_prefix="realm-tool")
+        return self._thread_pool
+
+    def _processes(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=self.limits[ExecutionClass.PROCESS])
+        return self._process_pool
+
+    def _retire_process_pool(self, pool: ProcessPoolExecutor):
+        """Shuts a broken pool down (reaping its workers) and lets the next PROCESS call build a fresh one."""
+        if self._process_pool is pool:
+            self._process_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    # --- DISPATCH ---
+
+    async def dispatch(self, tool_name: str, tool, args: Dict[str, Any], execution_class: Optional[ExecutionClass] = None, timing: Optional[Dict[str, Any]] = None):
+        """Executes a tool in its declared lane and records queue/run latency (mirrored into `timing` if given)."""
+        cls = execution_class or get_execution_class(tool_name)
+        stats = self._stats[cls]
+        submitted = time.perf_counter()
+        stats["queued"] += 1
+
+        async with self._semaphore(cls):
+            started = time.perf_counter()
+            stats["queued"] -= 1
+            stats["in_flight"] += 1
+            stats["queue_ms"].append((started - submitted) * 1000)
+            if timing is not None:
+                timing.update({"lane": cls.value, "queue_ms": round((started - submitted) * 1000, 2)})
+            try:
+                loop = asyncio.get_running_loop()
+                if cls == ExecutionClass.PROCESS:
+                    # Only pool faults re-route to the thread lane. Exceptions raised by the tool itself
+                    # propagate untouched, so a non-idempotent tool never runs a second time.
+                    try:
+                        pool = self._processes()
+                        pending = loop.run_in_executor(pool, _run_tool_in_process, tool_name, args)
+                    except NotImplementedError as e:
+                        logger.warning(f"⚠️ [TOOL_ENGINE]: Process lane unsupported for {tool_name} ({e}). Re-routing to thread lane.")
+                        return await loop.run_in_executor(self._threads(), _run_tool_blocking, tool, args)
+                    try:
+                        return await pending
+                    except BrokenProcessPool as e:
+                        logger.warning(f"⚠️ [TOOL_ENGINE]: Process pool broke under {tool_name} ({e}). Re-routing to thread lane.")
+                        self._retire_process_pool(pool)
+                        return await loop.run_in_executor(self._threads(), _run_tool_blocking, tool, args)
+                if cls == ExecutionClass.THREAD:
+                    return await loop.run_in_executor(self._threads(), _run_tool_blocking, tool, args)
+                return await tool.ainvoke(args)
+            finally:
+                stats["in_flight"] -= 1
+                stats["completed"] += 1
+                stats["run_ms"].append((time.perf_counter() - started) * 1000)
+                if timing is not None:
+                    timing["run_ms"] = round(stats["run_ms"][-1], 2)
+
+    # --- TELEMETRY ---
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Per-lane load and queue-time figures for the HUD vitals feed."""
+        out = {}
+        for cls, s in self._stats.items():
+            q = list(s["queue_ms"])
+            r = list(s["run_ms"])
+            out[cls.value] = {
+                "limit": self.limits[cls],
+                "queued": s["queued"],
+                "in_flight": s["in_flight"],
+                "completed": s["completed"],
+                "avg_queue_ms": round(sum(q) / len(q), 2) if q else 0.0,
+                "max_queue_ms": round(max(q), 2) if q else 0.0,
+                "avg_run_ms": round(sum(r) / len(r), 2) if r else 0.0,
+            }
+        return out
+
+    def shutdown(self):
+        if self._thread_pool: self._thread_pool.shutdown(wait=False, cancel_futures=True)
+        if self._process_pool: self._process_pool.shutdown(wait=False, cancel_futures=True)
+        self._thread_pool = self._process_pool = None
+
+# --- GLOBAL INSTANCE ---
+tool_engine = ToolExecutionEngine()
@@ -0,0 +1,154 @@
+"""
+REALM FORGE: IRONCLAD ARTIFACT VERIFIER v1.0
+ARCHITECT: LEAD SWARM ENGINEER (MASTERMIND v31.4)
+STATUS: PRODUCTION READY - PARALLEL HASHING - STAT-CACHED SKIPS - BATCHED LATTICE ANCHORING
+PATH: F:/RealmForge_PROD/src/system/verification.py
+"""
+
+import os
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from datetime import datetime
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
+
+import networkx as nx
+
+logger = logging.getLogger("IronClad")
+
+GRAPH_PATH = Path("F:/RealmForge/data/memory/neural_graph.json")
+HASH_BLOCK = 1 << 20  # 1 MiB reads keep hashlib in its GIL-free path
+
+# ==============================================================================
+# 0. RECORDS
+# ==============================================================================
+
+@dataclass
+class VerificationRecord:
+    """Outcome for a single artifact: VERIFIED (fresh hash), CACHED (stat match) or MISSING."""
+    path: str
+    status: str
+    sha256: Optional[str] = None
+    size: Optional[int] = None
+    mtime_ns: Optional[int] = None
+    hash_ms: float = 0.0
+    error: Optional[str] = None
+
+    def log_line(self) -> str:
+        if self.status == "MISSING":
+            return f"❌ {self.path}: Physical file missing from drive."
+        tag = "Verified" if self.status == "VERIFIED" else "Unchanged (cached)"
+        return f"✅ {self.path}: {tag}. ({self.sha256[:8]})"
+
+# ==============================================================================
+# 1. HASHING & LATTICE I/O (BLOCKING - RUN OFF THE LOOP)
+# ==============================================================================
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _load_graph(graph_path: Path) -> nx.DiGraph:
+    if not graph_path.exists():
+        return nx.DiGraph()
+    with open(graph_path, "r", encoding="utf-8-sig") as f:
+        return nx.node_link_graph(json.load(f))
+
+def _save_graph(G: nx.DiGraph, graph_path: Path):
+    """Atomic write: temp file + os.replace so readers never see a torn lattice."""
+    os.makedirs(graph_path.parent, exist_ok=True)
+    temp_path = graph_path.with_suffix(".tmp")
+    with open(temp_path, "w", encoding="utf-8-sig") as f:
+        json.dump(nx.node_link_data(G), f, indent=2)
+    os.replace(temp_path, graph_path)
+
+# ==============================================================================
+# 2. THE VERIFIER
+# ==============================================================================
+
+class ArtifactVerifier:
+    """
+    Validator stage: one lattice read, concurrent hashing of changed files only,
+    and one lattice write anchoring every CURRENT_HASH edge for the batch.
+    """
+
+    def __init__(self, graph_path: Path = GRAPH_PATH, max_workers: Optional[int] = None):
+        self.graph_path = Path(graph_path)
+        self.max_workers = max_workers or int(os.getenv("REALM_VERIFY_WORKERS", str(min(8, (os.cpu_count() or 2) * 2))))
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._graph_lock = threading.Lock()  # Serializes read-modify-write transactions across missions
+
+    def _threads(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="realm-verify")
+        return self._pool
+
+    @staticmethod
+    def _inspect(path: str, known: Dict[str, Any]) -> VerificationRecord:
+        """Stat the file and only hash it when (size, mtime_ns) differ from the last verified entry."""
+        try:
+            st = os.stat(path)
+        except OSError as e:
+            return VerificationRecord(path=path, status="MISSING", error=str(e))
+
+        if known.get("sha256") and known.get("size") == st.st_size and known.get("mtime_ns") == st.st_mtime_ns:
+            return VerificationRecord(path, "CACHED", known["sha256"], st.st_size, st.st_mtime_ns)
+
+        t0 = time.perf_counter()
+        try:
+            digest = _sha256(path)
+        except OSError as e:
+            return VerificationRecord(path=path, status="MISSING", error=str(e))
+        return VerificationRecord(path, "VERIFIED", digest, st.st_size, st.st_mtime_ns, round((time.perf_counter() - t0) * 1000, 2))
+
+    def _anchor(self, fresh: List[VerificationRecord]):
+        """Single batched transaction: re-read under lock, replace stale hash edges, write once."""
+        with self._graph_lock:
+            G = _load_graph(self.graph_path)
+            stamp = datetime.now().isoformat()
+            for rec in fresh:
+                if rec.path in G:
+                    stale = [t for _, t, d in G.out_edges(rec.path, data=True) if d.get("relation") == "CURRENT_HASH"]
+                    G.remove_edges_from((rec.path, t) for t in stale)
+                G.add_edge(rec.path, rec.sha256, relation="CURRENT_HASH", timestamp=stamp)
+                G.nodes[rec.path].update(sha256=rec.sha256, size=rec.size, mtime_ns=rec.mtime_ns, verified_at=stamp)
+            _save_graph(G, self.graph_path)
+
+    async def verify(self, artifacts: List[str]) -> List[VerificationRecord]:
+        paths = list(dict.fromkeys(str(a).replace("\\", "/") for a in artifacts))
+        if not paths: return []
+        loop = asyncio.get_running_loop()
+        pool = self._threads()
+
+        try:
+            G = await loop.run_in_executor(pool, _load_graph, self.graph_path)
+        except Exception as e:
+            logger.warning(f"⚠️ [IRONCLAD]: Lattice unreadable ({e}). Hashing without cache.")
+            G = nx.DiGraph()
+        known = {p: dict(G.nodes[p]) if p in G else {} for p in paths}
+
+        records = await asyncio.gather(*[loop.run_in_executor(pool, self._inspect, p, known[p]) for p in paths])
+
+        fresh = [r for r in records if r.status == "VERIFIED"]
+        if fresh:
+            try:
+                await loop.run_in_executor(pool, self._anchor, fresh)
+            except Exception as e:
+                logger.warning(f"⚠️ [IRONCLAD]: Lattice anchor failed: {e}")
+        return list(records)
+
+    def shutdown(self):
+        if self._pool: self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+
+# --- GLOBAL INSTANCE ---
+artifact_verifier = ArtifactVerifier()
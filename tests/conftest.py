@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Tests import `src.system.*` exactly as server.py does, from the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,76 @@
+import asyncio
+import operator
+import time
+from typing import Annotated, List, TypedDict
+
+import pytest
+
+from src.system.checkpoint import MissionActiveError, MissionJournal
+
+class State(TypedDict, total=False):
+    mission_id: str
+    messages: Annotated[List[str], operator.add]
+    next_node: str
+
+class Graph:
+    def __init__(self, steps, gate: asyncio.Event = None):
+        self.steps, self.gate = steps, gate
+
+    async def astream(self, state):
+        for node, update in self.steps:
+            if self.gate: await self.gate.wait()
+            yield {node: update}
+
+def _journal(tmp_path, **kw):
+    return MissionJournal(tmp_path / "journal.db", **kw)
+
+async def _drain(stream):
+    return [o async for o in stream]
+
+def test_replay_rebuilds_state_through_reducers(tmp_path):
+    j = _journal(tmp_path)
+
+    class Boom(Graph):
+        async def astream(self, state):
+            yield {"planner": {"messages": ["a"], "next_node": "executor"}}
+            raise RuntimeError("crash")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(_drain(j.stream(Boom([]), {"mission_id": "m1", "messages": []})))
+    state = asyncio.run(j.resume_state("m1", State, lambda last, s: s["next_node"]))
+    assert state["messages"] == ["a"]
+    assert state["resume_from"] == "executor"
+
+def test_running_mission_is_not_resumable_and_cannot_run_twice(tmp_path):
+    j = _journal(tmp_path)
+
+    async def main():
+        gate = asyncio.Event()
+        first = asyncio.create_task(_drain(j.stream(Graph([("planner", {"messages": ["a"]})], gate), {"mission_id": "m1"})))
+        await asyncio.sleep(0.05)
+        assert j.is_active("m1")
+        assert [m["mission_id"] for m in await asyncio.to_thread(j.list_resumable)] == []
+        with pytest.raises(MissionActiveError):
+            await _drain(j.stream(Graph([]), {"mission_id": "m1"}, resume=True))
+        gate.set()
+        await first
+        assert not j.is_active("m1")
+
+    asyncio.run(main())
+
+def test_gc_purges_failed_missions_past_retention(tmp_path):
+    j = _journal(tmp_path, retention_s=10, failed_retention_s=100)
+
+    class Boom(Graph):
+        async def astream(self, state):
+            raise RuntimeError("crash")
+            yield
+
+    for mid in ("old", "new"):
+        with pytest.raises(RuntimeError):
+            asyncio.run(_drain(j.stream(Boom([]), {"mission_id": mid})))
+    asyncio.run(_drain(j.stream(Graph([]), {"mission_id": "done"})))
+    j._db().execute("UPDATE missions SET updated_at = ? WHERE mission_id IN ('old', 'done')", (time.time() - 1000,))
+
+    assert j.collect_garbage() == 2
+    assert [m["mission_id"] for m in j.list_resumable()] == ["new"]
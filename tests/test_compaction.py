@@ -0,0 +1,37 @@
+import copy
+import pickle
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from src.system import compaction
+from src.system.compaction import FrozenDict, intern, spill_tool_output, total_messages, window_messages
+
+def test_window_pins_directive_and_counts_folded_turns():
+    msgs = [HumanMessage(content="directive")]
+    for i in range(60):
+        msgs = window_messages(msgs, [AIMessage(content=f"turn {i}")])
+    assert msgs[0].content == "directive"
+    assert msgs[1].name == compaction.DIGEST_NAME
+    assert [m.content for m in msgs[2:]] == [f"turn {i}" for i in range(60 - compaction.MESSAGE_WINDOW, 60)]
+    assert total_messages(msgs) == 61
+    assert len(msgs[1].content) <= compaction.DIGEST_BUDGET_CHARS + 100
+
+def test_frozen_dict_is_immutable_and_interned_across_copies():
+    meta = intern("test_meta", {"a": 1})
+    assert intern("test_meta", {"a": 2}) is meta
+    with pytest.raises(TypeError):
+        meta["a"] = 3
+    assert copy.deepcopy(meta) is meta
+    assert pickle.loads(pickle.dumps(meta)) is meta
+    assert {**meta, "b": 2} == {"a": 1, "b": 2}
+    assert isinstance(pickle.loads(pickle.dumps(FrozenDict(x=1))), FrozenDict)
+
+def test_spill_keeps_small_outputs_and_points_at_large_ones(tmp_path, monkeypatch):
+    monkeypatch.setattr(compaction, "SPILL_DIR", tmp_path)
+    assert spill_tool_output("short", "m1", "t") == "short"
+    big = "é" * 5000
+    out = spill_tool_output(big, "m1", "t", budget_bytes=101)
+    assert "[OUTPUT_SPILLED]: 10000 bytes" in out
+    spilled = list((tmp_path / "m1").iterdir())
+    assert len(spilled) == 1 and spilled[0].read_text(encoding="utf-8") == big
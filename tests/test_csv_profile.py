@@ -0,0 +1,60 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.system.csv_profile import CSVProfiler, HyperLogLog, sidecar_path
+
+def test_hyperloglog_estimate_within_error():
+    hll = HyperLogLog()
+    for start in range(0, 200_000, 50_000):  # Fed in chunks, with repeats that must not count twice
+        hll.add(pd.Series(np.arange(start, start + 50_000)))
+        hll.add(pd.Series(np.arange(start, start + 1_000)))
+    assert abs(hll.count() - 200_000) / 200_000 < 0.05
+
+def test_hyperloglog_small_cardinality_and_nulls():
+    hll = HyperLogLog()
+    hll.add(pd.Series(["a", "b", "a", None, "c"]))
+    assert hll.count() == 3
+
+def test_profile_written_to_sidecar_and_reused(tmp_path):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"x": [1, 2, 3, None], "name": ["b", "a", "c", "a"]}).to_csv(path, index=False)
+    prof = CSVProfiler().get(path)
+    assert prof["rows"] == 4
+    assert prof["columns"]["x"]["nulls"] == 1
+    assert prof["columns"]["name"]["min"] == "a" and prof["columns"]["name"]["distinct_approx"] == 3
+    assert sidecar_path(path).exists()
+    assert CSVProfiler().cached(path)["rows"] == 4  # A fresh process reads the sidecar
+
+def test_concurrent_inline_gets_share_one_pass(tmp_path):
+    path = tmp_path / "slow.csv"
+    pd.DataFrame({"x": range(10)}).to_csv(path, index=False)
+    profiler = CSVProfiler()
+    real, calls = profiler.compute, []
+
+    def slow_compute(p):
+        calls.append(p)
+        time.sleep(0.2)
+        return real(p)
+    profiler.compute = slow_compute
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(profiler.get(path))) for _ in range(3)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    assert len(calls) == 1
+    assert [r["rows"] for r in results] == [10, 10, 10]
+
+def test_unparseable_file_reports_unavailable_and_is_not_reparsed(tmp_path, monkeypatch):
+    path = tmp_path / "bad.csv"
+    path.write_text("a,b\n" + "1,2\n" * 20 + "3,4,5,6\n", encoding="utf-8")  # Malformed row past any preview
+    prof, passes = CSVProfiler(), []
+    compute = prof.compute
+    monkeypatch.setattr(prof, "compute", lambda p: passes.append(p) or compute(p))
+    assert prof.get(path) == {"rows": 21, "profile": "unavailable"}
+    assert prof.get(path) == {"rows": 21, "profile": "unavailable"}
+    assert len(passes) == 1
+    path.write_text("a,b\n1,2\n", encoding="utf-8")  # A fixed file is profiled again
+    assert prof.get(path)["rows"] == 1
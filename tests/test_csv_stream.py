@@ -0,0 +1,44 @@
+import pandas as pd
+
+from src.system.csv_stream import Aggregator, aggregate, concat_csv, count_rows, iter_chunks
+
+def test_count_rows_with_and_without_trailing_newline(tmp_path):
+    a = tmp_path / "a.csv"
+    a.write_text("x,y\n1,2\n3,4\n", encoding="utf-8")
+    b = tmp_path / "b.csv"
+    b.write_text("x,y\n1,2\n3,4", encoding="utf-8")
+    assert count_rows(a) == count_rows(b) == 2
+
+def test_chunked_aggregate_matches_whole_frame(tmp_path):
+    path = tmp_path / "n.csv"
+    df = pd.DataFrame({"v": [float(i) for i in range(1000)], "k": ["a", "b"] * 500})
+    df.loc[7, "v"] = None
+    df.to_csv(path, index=False)
+    out = aggregate(path, chunksize=128, value_counts=["k"])
+    assert out["rows"] == 1000
+    assert out["nulls"]["v"] == 1
+    assert out["numeric"]["v"]["sum"] == df["v"].sum()
+    assert out["numeric"]["v"]["max"] == 999.0
+    assert out["value_counts"]["k"] == {"a": 500, "b": 500}
+
+def test_dtype_drift_resumes_without_losing_or_repeating_rows(tmp_path):
+    path = tmp_path / "drift.csv"
+    rows = [str(i) for i in range(50)] + ["not-a-number"] + [str(i) for i in range(51, 60)]
+    pd.DataFrame({"x": rows}).to_csv(path, index=False)
+    chunks = list(iter_chunks(path, chunksize=10, dtypes={"x": "float64"}))
+    values = [str(v) for c in chunks for v in c["x"].tolist()]
+    assert len(values) == 60
+    assert "not-a-number" in values
+
+def test_concat_csv_unions_columns(tmp_path):
+    a, b = tmp_path / "a.csv", tmp_path / "b.csv"
+    pd.DataFrame({"x": [1], "y": [2]}).to_csv(a, index=False)
+    pd.DataFrame({"y": [3], "z": [4]}).to_csv(b, index=False)
+    out = tmp_path / "out.csv"
+    assert concat_csv([a, b], out) == 2
+    assert list(pd.read_csv(out).columns) == ["x", "y", "z"]
+
+def test_regex_match_counts():
+    agg = Aggregator(match={"e": r"^[^@]+@[^@]+\.\w+$"})
+    agg.feed(pd.DataFrame({"e": ["a@b.io", "nope", "c@d.com"]}))
+    assert agg.result()["matches"] == {"e": 2}
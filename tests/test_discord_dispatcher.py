@@ -0,0 +1,57 @@
+import asyncio
+
+from src.system.discord_dispatcher import MESSAGE_LIMIT, DiscordDispatcher, route_key
+
+def _stubbed():
+    disp = DiscordDispatcher()
+    posts = []
+
+    async def request(method, endpoint, json_data=None):
+        posts.append(json_data)
+        await asyncio.sleep(0)
+        return None
+    disp.request = request
+    return disp, posts
+
+def test_route_key_collapses_minor_ids_and_masks_webhook_tokens():
+    assert route_key("post", "https://discord.com/api/v10/channels/123/messages/456") == "POST /channels/123/messages/:id"
+    assert route_key("POST", "https://discord.com/api/webhooks/42/s3cr3t-token") == "POST /webhooks/42/:token"
+
+def test_separate_messages_coalesce():
+    disp, posts = _stubbed()
+
+    async def main():
+        await asyncio.gather(*(disp.send_message("1", f"m{i}") for i in range(6)))
+    asyncio.run(main())
+    assert [p["content"] for p in posts] == ["m0\nm1\nm2\nm3\nm4\nm5"]
+    assert disp.stats["coalesced"] == 5
+
+def test_chunks_of_one_message_are_never_merged():
+    disp, posts = _stubbed()
+    chunks = ["a" * 1900, "b" * 50]
+
+    async def main():
+        await disp.send_chunks("1", chunks)
+    asyncio.run(main())
+    assert [p["content"] for p in posts] == chunks
+
+def test_chunks_do_not_absorb_or_join_neighbours():
+    disp, posts = _stubbed()
+
+    async def main():
+        await asyncio.gather(disp.send_message("1", "before"), disp.send_chunks("1", ["x" * 10, "y" * 10]),
+                             disp.send_message("1", "after"))
+    asyncio.run(main())
+    contents = [p["content"] for p in posts]
+    assert "x" * 10 in contents and "y" * 10 in contents  # Each chunk is a post of its own
+    assert contents.index("x" * 10) + 1 == contents.index("y" * 10)
+    assert "before" in contents[0] and any("after" in c for c in contents)
+
+def test_coalesced_post_stays_under_limit():
+    disp, posts = _stubbed()
+
+    async def main():
+        await asyncio.gather(*(disp.send_message("1", "z" * 900) for _ in range(5)))
+    asyncio.run(main())
+    assert all(len(p["content"]) <= MESSAGE_LIMIT for p in posts)
+    assert sum(p["content"].count("z") for p in posts) == 4500
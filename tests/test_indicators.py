@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+from src.system.indicators import IndicatorBook, IndicatorState
+
+def _ohlc(t, n, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, (t, n)), axis=0)
+    high = close + rng.uniform(0, 2, (t, n))
+    low = close - rng.uniform(0, 2, (t, n))
+    return close, high, low
+
+def _reference(close, high, low, fast=50, slow=200, period=14):
+    """Textbook per-bar loops over one ticker."""
+    c, h, l = pd.Series(close), pd.Series(high), pd.Series(low)
+    delta = c.diff().dropna().to_numpy()
+    tr = np.maximum(h - l, np.maximum((h - c.shift()).abs(), (l - c.shift()).abs())).to_numpy()[1:]
+    def wilder(x):
+        s = x[:period].mean()
+        for v in x[period:]: s += (v - s) / period
+        return s
+    g, lo = wilder(np.clip(delta, 0, None)), wilder(np.clip(-delta, 0, None))
+    return {
+        "sma_fast": c.rolling(fast).mean().iloc[-1],
+        "sma_slow": c.rolling(slow).mean().iloc[-1],
+        "rsi": 100 - 100 / (1 + g / lo),
+        "atr": wilder(tr),
+    }
+
+def test_batch_matches_reference_per_ticker():
+    close, high, low = _ohlc(260, 3)
+    vals = IndicatorState.from_arrays(close, high, low).values()
+    for j in range(3):
+        ref = _reference(close[:, j], high[:, j], low[:, j])
+        for k, v in ref.items():
+            assert np.isclose(vals[k][j], v, rtol=1e-9), k
+
+def test_incremental_matches_batch_through_warmup():
+    close, high, low = _ohlc(230, 2, seed=1)
+    inc = IndicatorState(2)
+    for t in range(len(close)):
+        inc.update(close[t], high[t], low[t])
+        if t in (0, 5, 13, 14, 15, 49, 50, 199, 200, 229):
+            batch = IndicatorState.from_arrays(close[:t + 1], high[:t + 1], low[:t + 1]).values()
+            for k, v in inc.values().items():
+                np.testing.assert_allclose(v, batch[k], rtol=1e-9, equal_nan=True, err_msg=f"{k}@{t}")
+
+def test_book_incremental_equals_rebuild():
+    close, high, low = _ohlc(240, 1, seed=2)
+    idx = pd.date_range("2024-01-01", periods=240, freq="D")
+    hist = pd.DataFrame({"Close": close[:, 0], "High": high[:, 0], "Low": low[:, 0]}, index=idx)
+    book = IndicatorBook()
+    book.latest("X", hist.iloc[:220])
+    got = book.latest("X", hist)
+    assert book.stats == {"rebuilds": 1, "incremental": 1}
+    fresh = IndicatorBook().latest("X", hist)
+    assert got.keys() == fresh.keys()
+    for k in got:
+        assert np.isclose(got[k], fresh[k], rtol=1e-9), k
+
+def test_book_rebuilds_when_history_is_rewritten():
+    close, high, low = _ohlc(60, 1, seed=3)
+    idx = pd.date_range("2024-01-01", periods=60, freq="D")
+    hist = pd.DataFrame({"Close": close[:, 0], "High": high[:, 0], "Low": low[:, 0]}, index=idx)
+    book = IndicatorBook()
+    book.latest("X", hist)
+    adjusted = hist * 0.5  # Split adjustment rewrites every past bar
+    got = book.latest("X", adjusted)
+    assert book.stats["rebuilds"] == 2
+    assert np.isclose(got["atr"], IndicatorBook().latest("X", adjusted)["atr"])
@@ -0,0 +1,32 @@
+from src.system.json_stream import (
+    PLANNER_SCHEMA, SUPERVISOR_SCHEMA, StreamingJSONParser, extract_json, parse_tolerant,
+)
+
+def test_extract_skips_prose_and_braces_inside_strings():
+    text = 'Sure! Here\'s the plan:\n```json\n{"intent": "GENERAL_INQUIRY", "reasoning": "a {b} c"}\n```'
+    assert extract_json(text, SUPERVISOR_SCHEMA) == {"intent": "GENERAL_INQUIRY", "reasoning": "a {b} c"}
+
+def test_extract_prefers_first_schema_valid_candidate():
+    text = '{"note": 1} then {"intent": "INDUSTRIAL_STRIKE"}'
+    assert extract_json(text, SUPERVISOR_SCHEMA) == {"intent": "INDUSTRIAL_STRIKE"}
+    assert extract_json('{"note": 1}', SUPERVISOR_SCHEMA) == {"note": 1}  # Fallback: first parseable
+    assert extract_json("no json here") == {}
+
+def test_repair_handles_python_literals_trailing_commas_and_truncation():
+    assert parse_tolerant("{'a': True, 'b': None,}") == {"a": True, "b": None}
+    assert parse_tolerant('{"a": [1, 2], "b": "trunc') is not None
+    assert parse_tolerant('{"a": 1, "b": {"c": ') == {"a": 1, "b": {"c": None}}
+
+def test_schema_drops_malformed_sub_tasks():
+    doc = extract_json('{"sub_tasks": [{"tool": "x", "args": "{\\"p\\": 1}"}, {"args": {}}]}', PLANNER_SCHEMA)
+    assert doc["sub_tasks"] == [{"tool": "x", "args": {"p": 1}}]
+
+def test_streaming_parser_emits_items_as_they_close_across_chunks():
+    text = '{"sub_tasks": [{"tool": "a", "args": {"q": "}"}}, // note\n {"tool": "b"}, {"bad": 1}]}'
+    parser, seen = StreamingJSONParser(), []
+    for i in range(0, len(text), 3):
+        seen.extend(item["tool"] for item in parser.feed(text[i:i + 3]))
+        if i < text.index('"b"'):
+            assert seen in ([], ["a"])
+    assert seen == ["a", "b"]
+    assert [t["tool"] for t in parser.close(PLANNER_SCHEMA)["sub_tasks"]] == ["a", "b"]
@@ -0,0 +1,31 @@
+import yaml
+
+from src.system.manifest_pipeline import ManifestJob, apply_manifest_jobs, plan_conflicts, removable_sources
+
+def _manifest(path, name):
+    path.write_text(yaml.safe_dump({"identity": {"full_name": name}, "professional": {"department": "X"}}), encoding="utf-8")
+    return str(path)
+
+def test_rename_chain_is_a_conflict(tmp_path):
+    a, b, c = (str(tmp_path / n) for n in ("a.yaml", "b.yaml", "c.yaml"))
+    jobs = [ManifestJob(a, b), ManifestJob(b, c)]  # Job 0 writes the file job 1 still has to read
+    assert [(w.src, r.src) for w, r in plan_conflicts(jobs)] == [(a, b)]
+
+def test_in_place_and_disjoint_moves_are_not_conflicts(tmp_path):
+    jobs = [ManifestJob(str(tmp_path / "a.yaml")), ManifestJob(str(tmp_path / "b.yaml"), str(tmp_path / "n/b.yaml"))]
+    assert plan_conflicts(jobs) == []
+
+def test_sources_written_by_another_job_are_never_removed(tmp_path):
+    a = _manifest(tmp_path / "a.yaml", "A")
+    b = _manifest(tmp_path / "b.yaml", "B")
+    c = str(tmp_path / "c.yaml")
+    jobs = [ManifestJob(a, b, {"identity": {"full_name": "A2"}}), ManifestJob(b, c)]
+    results = apply_manifest_jobs(jobs, workers=1)
+    assert removable_sources(jobs, results) == [a]
+
+def test_patch_merges_sections_and_skips_unchanged(tmp_path):
+    a = _manifest(tmp_path / "a.yaml", "A")
+    first = apply_manifest_jobs([ManifestJob(a, updates={"professional": {"functional_role": "R"}})], workers=1)[0]
+    assert first.written and first.dna["professional"] == {"department": "X", "functional_role": "R"}
+    again = apply_manifest_jobs([ManifestJob(a, updates={"professional": {"functional_role": "R"}})], workers=1)[0]
+    assert again.written is False
@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from src.system.market_data import MarketDataService, _period_start
+
+class FakeYF:
+    """Business-day bars up to `last_session`, like yfinance queried on a weekend/holiday."""
+
+    def __init__(self, last_session: datetime):
+        self.last_session = pd.Timestamp(last_session.date())
+        self.calls = []
+
+    def download(self, tickers, interval, start=None, period=None, **_):
+        self.calls.append((tuple(tickers), start, period))
+        days = pd.bdate_range(start=start or "2000-01-01", end=self.last_session)
+        cols = pd.MultiIndex.from_product([tickers, ["Open", "High", "Low", "Close", "Volume"]])
+        data = np.tile(np.arange(1, len(days) + 1, dtype=float)[:, None], (1, len(cols)))
+        return pd.DataFrame(data, index=days, columns=cols)
+
+def _service(tmp_path, last_session):
+    svc = MarketDataService(tmp_path / "market.db")
+    fake = FakeYF(last_session)
+    svc._yf = lambda: fake
+    return svc, fake
+
+def test_period_start_is_floored_to_midnight_utc():
+    now = datetime(2026, 10, 18, 15, 30, tzinfo=timezone.utc)
+    start = datetime.fromtimestamp(_period_start("1mo", now), timezone.utc)
+    assert (start.hour, start.minute, start.second) == (0, 0, 0)
+    assert start.date() == (now - timedelta(days=31)).date()
+
+def test_one_day_returns_last_session_when_market_is_closed(tmp_path):
+    # Last session four days ago: a holiday Monday after a weekend
+    svc, _ = _service(tmp_path, datetime.now(timezone.utc) - timedelta(days=4))
+    hist = svc.history("AAPL", period="1d")
+    assert len(hist) == 1
+    assert hist.index[-1].date() <= (datetime.now(timezone.utc) - timedelta(days=4)).date()
+
+def test_five_day_returns_five_sessions(tmp_path):
+    svc, _ = _service(tmp_path, datetime.now(timezone.utc) - timedelta(days=1))
+    hist = svc.history("AAPL", period="5d")
+    assert len(hist) == 5
+    assert hist.index.is_monotonic_increasing
+
+def test_store_serves_repeat_calls_without_download(tmp_path):
+    svc, fake = _service(tmp_path, datetime.now(timezone.utc) - timedelta(days=1))
+    svc.history_many(["AAPL", "MSFT"], period="1mo")
+    assert len(fake.calls) == 1  # Cold tickers share one batched download
+    svc.history_many(["msft", "AAPL"], period="5d")
+    assert len(fake.calls) == 1
+
+class ExchangeYF(FakeYF):
+    """Like Ticker.history(): bars stamped at exchange midnight, with corporate-action columns."""
+
+    def download(self, tickers, interval, start=None, period=None, **kw):
+        frame = super().download(tickers, interval, start=start, period=period, **kw)
+        frame.index = frame.index.tz_localize("America/New_York")
+        for t in tickers:
+            frame[(t, "Dividends")] = 0.0
+            frame[(t, "Stock Splits")] = 0.0
+            frame.loc[frame.index[-2], (t, "Dividends")] = 0.24
+        return frame
+
+def test_history_keeps_exchange_timezone_and_action_columns(tmp_path):
+    svc = MarketDataService(tmp_path / "market.db")
+    fake = ExchangeYF(datetime.now(timezone.utc) - timedelta(days=1))
+    svc._yf = lambda: fake
+    hist = svc.history("AAPL", period="1mo")
+    assert list(hist.columns) == ["Open", "High", "Low", "Close", "Volume", "Dividends", "Stock Splits"]
+    assert str(hist.index.tz) == "America/New_York"
+    assert (hist.index.hour == 0).all()
+    assert hist["Dividends"].iloc[-2] == 0.24
+    assert len(fake.calls) == 1 and len(svc.history("AAPL", period="5d")) == 5
+
+def test_pre_action_store_is_migrated_in_place(tmp_path):
+    import sqlite3
+    db = tmp_path / "market.db"
+    conn = sqlite3.connect(db)
+    conn.executescript("""
+        CREATE TABLE bars (ticker TEXT NOT NULL, interval TEXT NOT NULL, ts INTEGER NOT NULL,
+                           open REAL, high REAL, low REAL, close REAL, volume REAL, PRIMARY KEY (ticker, interval, ts)) WITHOUT ROWID;
+        CREATE TABLE coverage (ticker TEXT NOT NULL, interval TEXT NOT NULL, covered_from INTEGER NOT NULL,
+                               last_ts INTEGER, checked_at REAL NOT NULL, PRIMARY KEY (ticker, interval));
+        INSERT INTO bars VALUES ('AAPL', '1d', 1700000000, 1, 1, 1, 1, 1);
+    """)
+    conn.close()
+    svc, _ = _service(tmp_path, datetime.now(timezone.utc) - timedelta(days=1))
+    assert svc._load("AAPL", "1d", 0)["Dividends"].tolist() == [0.0]
@@ -0,0 +1,100 @@
+import asyncio
+
+from src.system.resilience import BreakerState, ResilienceLayer, ToolPolicy
+
+POLICY = ToolPolicy(deadline_s=1.0, failure_threshold=1, cooldown_s=0.0)
+
+def _tripped(layer: ResilienceLayer, name: str):
+    b = layer.breaker(name)
+    b.failure_threshold, b.cooldown_s = 1, 0.0
+    b.record_failure()
+    assert b.state == BreakerState.OPEN
+    return b
+
+def test_breaker_opens_and_recovers_through_probe():
+    layer = ResilienceLayer()
+    b = _tripped(layer, "t")
+
+    async def ok():
+        return "fine"
+    assert asyncio.run(layer.execute("t", ok, POLICY)) == "fine"
+    assert b.state == BreakerState.CLOSED
+
+def test_half_open_admits_a_single_probe():
+    layer = ResilienceLayer()
+    b = _tripped(layer, "t")
+    assert b.allow() is True
+    assert b.state == BreakerState.HALF_OPEN
+    assert b.allow() is False
+
+def test_cancelled_probe_rearms_breaker():
+    layer = ResilienceLayer()
+    b = _tripped(layer, "t")
+
+    async def main():
+        started = asyncio.Event()
+
+        async def hang():
+            started.set()
+            await asyncio.sleep(10)
+
+        task = asyncio.create_task(layer.execute("t", hang, POLICY))
+        await started.wait()
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(main())
+    assert b.state == BreakerState.OPEN
+    assert b._probe_in_flight is False
+    assert b.allow() is True  # Cooldown 0: the next caller gets a fresh probe instead of CIRCUIT_OPEN forever
+
+def test_cancel_while_closed_does_not_count_as_failure():
+    layer = ResilienceLayer()
+
+    async def main():
+        task = asyncio.create_task(layer.execute("c", lambda: asyncio.sleep(10), POLICY))
+        await asyncio.sleep(0)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(main())
+    assert layer.breaker("c").state == BreakerState.CLOSED
+    assert layer.breaker("c").total_failures == 0
+
+def test_bad_input_errors_never_trip_the_breaker():
+    layer = ResilienceLayer()
+    policy = ToolPolicy(deadline_s=1.0, idempotent=True, failure_threshold=2, cooldown_s=60.0)
+    calls = []
+
+    async def missing():
+        calls.append(1)
+        return "âŒ [CSV_IO_FAULT]: File x.csv not located on disk."
+
+    for _ in range(5):
+        assert "not located" in asyncio.run(layer.execute("read_file", missing, policy))
+    assert len(calls) == 5  # Deterministic: answered once per call, never retried
+    b = layer.breaker("read_file")
+    assert b.failure_threshold <= 5
+    assert b.state == BreakerState.CLOSED and b.total_failures == 0
+
+def test_transient_errors_and_timeouts_trip_the_breaker():
+    layer = ResilienceLayer()
+    policy = ToolPolicy(deadline_s=0.05, failure_threshold=2, cooldown_s=60.0)
+
+    async def throttled():
+        return "[HTTP_ERROR]: 503"
+
+    async def slow():
+        await asyncio.sleep(1)
+
+    layer.breaker("dl").failure_threshold = 2  # Breakers take their threshold from the tool's registered policy
+    asyncio.run(layer.execute("dl", throttled, policy))
+    asyncio.run(layer.execute("dl", slow, policy))
+    assert layer.breaker("dl").state == BreakerState.OPEN
+    assert "CIRCUIT_OPEN" in asyncio.run(layer.execute("dl", throttled, policy))
@@ -0,0 +1,49 @@
+import json
+
+from src.system.agent_store import AgentRecord
+from src.system.roster_cache import RosterCache, build_roster_artifacts, normalize_dept
+
+def _rec(folder: str, dept: str, name: str, tools=("read_file",)) -> AgentRecord:
+    return AgentRecord(path=f"F:/RealmForge/data/agents/{folder}/{name}.yaml", name=name, employee_id=f"ID-{name}",
+                       dept=dept, role_title="Lead", functional_role="Specialist", tools=list(tools))
+
+def test_normalize_dept_maps_legacy_silos():
+    assert normalize_dept("CYBERSECURITY") == "CYBER_SECURITY"
+    assert normalize_dept("ARCHITECT") == "SOFTWARE_ENGINEERING"
+    assert normalize_dept("data_intelligence") == "DATA_INTELLIGENCE"
+    assert normalize_dept("") == "GENERAL_ENGINEERING"
+
+def test_builder_keeps_agents_outside_canonical_folders(tmp_path):
+    records = [
+        _rec("architect", "ARCHITECT", "a1"),
+        _rec("cybersecurity", "CYBERSECURITY", "c1"),
+        _rec("data_intelligence", "DATA_INTELLIGENCE", "d1", tools=("read_file", "sqlite_query")),
+        _rec("cybersecurity", "", "c2"),
+    ]
+    stats = build_roster_artifacts(records, tmp_path)
+    assert stats["agents"] == 4
+
+    cache = RosterCache(tmp_path / "roster_cache.json")
+    assert cache.built()
+    assert sorted(r["name"] for r in cache.sector("cyber")) == ["c1", "c2"]
+    assert [r["name"] for r in cache.sector("software")] == ["a1"]
+    assert len(cache.all()) == 4
+
+    roster = json.loads((tmp_path / "roster.json").read_text(encoding="utf-8"))["roster"]
+    assert len(roster) == 4
+
+def test_capability_map_interns_toolsets(tmp_path):
+    records = [_rec("financial_ops", "FINANCIAL_OPS", f"f{i}") for i in range(3)]
+    build_roster_artifacts(records, tmp_path)
+    cmap = json.loads((tmp_path / "industrial_capability_map.json").read_text(encoding="utf-8"))
+    assert cmap["toolsets"] == [[0]]
+    assert cmap["tool_table"] == ["read_file"]
+    assert {row[3] for row in cmap["sectors"]["FINANCIAL_OPS"]} == {0}
+    assert cmap["aliases"]["ZERO_TRUST_SENTINEL"] == "CYBER_SECURITY"
+
+def test_legacy_roster_is_readable_but_not_built(tmp_path):
+    (tmp_path / "roster.json").write_text(json.dumps({"roster": [{"name": "Role", "real_name": "x", "dept": "MARKETING_PR", "id": "1"}]}), encoding="utf-8")
+    cache = RosterCache(tmp_path / "roster_cache.json")
+    assert cache.available()
+    assert not cache.built()
+    assert cache.sector("marketing")[0]["name"] == "x"
@@ -0,0 +1,72 @@
+import asyncio
+
+from src.system.speculation import MissionSpeculator
+
+async def _runner(tool_name, args, timing):
+    await asyncio.sleep(0)
+    return f"{tool_name}:{args.get('path')}"
+
+def _plan(*steps):
+    return [{"tool": tool, "args": {"path": path}} for tool, path in steps]
+
+def test_keeps_reads_that_precede_any_write():
+    async def main():
+        spec = MissionSpeculator("m", _runner)
+        spec.launch({"tool": "read_file", "args": {"path": "a"}})
+        spec.launch({"tool": "list_files", "args": {"path": "b"}})
+        spec.lock(_plan(("read_file", "a"), ("list_files", "b"), ("write_file", "c")))
+        assert spec.claim("read_file", {"path": "a"}) is not None
+        assert spec.claim("list_files", {"path": "b"}) is not None
+    asyncio.run(main())
+
+def test_read_after_write_is_discarded():
+    async def main():
+        spec = MissionSpeculator("m", _runner)
+        spec.launch({"tool": "read_file", "args": {"path": "F:/x"}})
+        spec.launch({"tool": "csv_processor_read", "args": {"path": "r.csv"}})
+        spec.lock(_plan(("write_file", "F:/x"), ("read_file", "F:/x"), ("csv_processor_read", "r.csv")))
+        assert spec.claim("read_file", {"path": "F:/x"}) is None
+        assert spec.claim("csv_processor_read", {"path": "r.csv"}) is None
+        assert spec.runs == {}
+    asyncio.run(main())
+
+def test_runs_missing_from_plan_are_cancelled():
+    async def main():
+        spec = MissionSpeculator("m", _runner)
+        spec.launch({"tool": "read_file", "args": {"path": "gone"}})
+        fut = spec.runs[next(iter(spec.runs))].future
+        spec.lock(_plan(("read_file", "other")))
+        await asyncio.sleep(0)
+        assert fut.cancelled()
+    asyncio.run(main())
+
+def test_non_read_only_tools_are_never_launched():
+    async def main():
+        spec = MissionSpeculator("m", _runner)
+        assert spec.launch({"tool": "write_file", "args": {"path": "x"}}) is False
+    asyncio.run(main())
+
+def test_order_follows_executor_priority_not_plan_order():
+    async def main():
+        spec = MissionSpeculator("m", _runner)
+        spec.launch({"tool": "read_file", "args": {"path": "X"}})
+        spec.launch({"tool": "list_files", "args": {"path": "d"}})
+        spec.lock([
+            {"tool": "read_file", "args": {"path": "X"}, "priority": "LOW"},
+            {"tool": "write_file", "args": {"path": "X"}, "priority": "HIGH"},
+            {"tool": "list_files", "args": {"path": "d"}, "priority": "CRITICAL"},
+        ])
+        assert spec.claim("read_file", {"path": "X"}) is None  # The executor runs the HIGH write first
+        assert spec.claim("list_files", {"path": "d"}) is not None
+    asyncio.run(main())
+
+def test_closed_tasks_run_last():
+    async def main():
+        spec = MissionSpeculator("m", _runner)
+        spec.launch({"tool": "read_file", "args": {"path": "a"}})
+        spec.lock([
+            {"tool": "write_file", "args": {"path": "a"}, "priority": "CRITICAL", "status": "DONE"},
+            {"tool": "read_file", "args": {"path": "a"}, "priority": "LOW"},
+        ])
+        assert spec.claim("read_file", {"path": "a"}) is not None
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+import asyncio
+import sqlite3
+import threading
+
+import pytest
+
+from src.system.sqlite_manager import DatabaseWorker, SQLiteManager
+
+def _worker(tmp_path):
+    w = DatabaseWorker(tmp_path / "t.db")
+    w.submit(lambda c: c.execute("CREATE TABLE t (k INTEGER PRIMARY KEY, v TEXT)"), write=True).result(5)
+    return w
+
+def _hold(w):
+    """Parks the owner thread on a read so the next submissions queue up together."""
+    gate, parked = threading.Event(), threading.Event()
+    w.submit(lambda c: (parked.set(), gate.wait(5)))
+    parked.wait(5)
+    return gate
+
+def _insert(k, v="x"):
+    return lambda c: c.execute("INSERT INTO t VALUES (?, ?)", (k, v)).rowcount
+
+def _rows(w):
+    return w.submit(lambda c: c.execute("SELECT k FROM t ORDER BY k").fetchall()).result(5)
+
+def test_queued_writes_share_one_transaction(tmp_path):
+    w = _worker(tmp_path)
+    begins = []
+    w.submit(lambda c: c.set_trace_callback(lambda sql: begins.append(sql) if sql.startswith("BEGIN") else None)).result(5)
+    gate = _hold(w)
+    futs = [w.submit(_insert(i), write=True) for i in range(10)]
+    gate.set()
+    assert [f.result(5) for f in futs] == [1] * 10
+    assert len(begins) == 1
+    w.close()
+
+def test_failing_job_does_not_sink_its_batch(tmp_path):
+    w = _worker(tmp_path)
+    gate = _hold(w)
+    def half_then_fail(c):
+        c.execute("INSERT INTO t VALUES (99, 'partial')")
+        raise ValueError("boom")
+    ok1 = w.submit(_insert(1), write=True)
+    bad = w.submit(half_then_fail, write=True)
+    ok2 = w.submit(_insert(2), write=True)
+    gate.set()
+    assert ok1.result(5) == ok2.result(5) == 1
+    with pytest.raises(ValueError):
+        bad.result(5)
+    assert _rows(w) == [(1,), (2,)]  # The failed job's own insert rolled back with its savepoint
+    w.close()
+
+def test_read_pulled_while_batching_keeps_fifo_order(tmp_path):
+    w = _worker(tmp_path)
+    gate = _hold(w)
+    w.submit(_insert(1), write=True)
+    seen = w.submit(lambda c: c.execute("SELECT count(*) FROM t").fetchone()[0])
+    w.submit(_insert(2), write=True)
+    gate.set()
+    assert seen.result(5) == 1
+    assert _rows(w) == [(1,), (2,)]
+    w.close()
+
+def test_manager_insert_many_is_atomic_and_query_honours_limit(tmp_path):
+    db = tmp_path / "m.db"
+    mgr = SQLiteManager()
+
+    async def scenario():
+        await mgr.execute(db, "CREATE TABLE t (k INTEGER PRIMARY KEY, v TEXT)")
+        assert await mgr.insert_many(db, "t", [{"k": i, "v": str(i)} for i in range(5)]) == 5
+        with pytest.raises(sqlite3.IntegrityError):
+            await mgr.insert_many(db, "t", [{"k": 10, "v": "a"}, {"k": 4, "v": "dup"}])
+        assert await mgr.query(db, "SELECT count(*) AS n FROM t") == [{"n": 5}]
+        assert len(await mgr.query(db, "SELECT * FROM t", limit=2)) == 2
+        await asyncio.gather(*(mgr.insert(db, "t", {"k": 100 + i, "v": "c"}) for i in range(20)))
+        return await mgr.query(db, "SELECT count(*) AS n FROM t")
+
+    assert asyncio.run(scenario()) == [{"n": 25}]
+    mgr.close_all()
@@ -0,0 +1,51 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from src.system import tool_engine as te
+from src.system.tool_engine import ExecutionClass, ToolExecutionEngine
+
+class CountingTool:
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, args):
+        self.calls += 1
+        return "[SUCCESS] thread lane"
+
+class BrokenPool:
+    def __init__(self):
+        self.shut = False
+
+    def submit(self, fn, *args):
+        fut = Future()
+        fut.set_exception(BrokenProcessPool("worker died"))
+        return fut
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut = True
+
+def _dispatch(engine, tool):
+    return asyncio.run(engine.dispatch("merge_csv_files", tool, {}, ExecutionClass.PROCESS))
+
+def test_tool_exception_in_worker_is_not_rerun_on_thread_lane(monkeypatch):
+    def raises(tool_name, args):
+        raise FileNotFoundError("missing.csv")
+    monkeypatch.setattr(te, "_run_tool_in_process", raises)
+    engine, tool = ToolExecutionEngine(), CountingTool()
+    pool = engine._process_pool = ThreadPoolExecutor(1)
+    with pytest.raises(FileNotFoundError):
+        _dispatch(engine, tool)
+    assert tool.calls == 0
+    assert engine._process_pool is pool  # A healthy pool is kept
+    engine.shutdown()
+
+def test_broken_pool_is_shut_down_and_call_rerouted():
+    engine, tool = ToolExecutionEngine(), CountingTool()
+    pool = engine._process_pool = BrokenPool()
+    assert _dispatch(engine, tool) == "[SUCCESS] thread lane"
+    assert tool.calls == 1
+    assert pool.shut and engine._process_pool is None
+    engine.shutdown()
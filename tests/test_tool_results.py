@@ -0,0 +1,17 @@
+from src.system.arsenal.results import ToolResult
+
+def test_legacy_failure_markers():
+    assert not ToolResult.adapt("[ERROR] boom").ok
+    assert not ToolResult.adapt("âŒ [CSV_PARSE_FAIL]: x").ok
+    assert ToolResult.adapt("[SUCCESS] fine").ok
+
+def test_adapt_never_reports_artifacts_from_text():
+    # A read that echoes paths (read_file, csv_processor_read) must not hand its inputs to the validator
+    res = ToolResult.adapt("Contents mention F:/RealmForge/data/in.csv and F:/RealmForge/workspaces/acme/app.py")
+    assert res.ok
+    assert res.artifacts == []
+
+def test_adapt_keeps_declared_artifacts():
+    declared = ToolResult.success("done", artifacts=["F:\\RealmForge\\data\\out.zip"])
+    assert ToolResult.adapt(declared) is declared
+    assert declared.artifacts == ["F:/RealmForge/data/out.zip"]